@@ -2,6 +2,8 @@
 ASGI config for simplelms project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Long-lived streams (the announcement event stream, the async Ninja API) are
+only served through this entry point, e.g. ``uvicorn lms.asgi:application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 
+import os
+from copy import deepcopy
 from pathlib import Path
 from datetime import timedelta
 
@@ -43,10 +45,17 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'lms_core.authentication.CachedJWTAuthentication',
     ],
 }
 
+# Keyset pagination: jumlah item default per halaman dan batas maksimum ?page_size=
+LMS_PAGE_SIZE = 20
+LMS_MAX_PAGE_SIZE = 100
+
+# Jumlah baris per batch saat respons list di-stream (?stream=1)
+LMS_STREAM_CHUNK_SIZE = 500
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),  # Token akses berlaku selama 1 jam
     "REFRESH_TOKEN_LIFETIME": timedelta(days=1),     # Token refresh berlaku 1 hari
@@ -54,9 +63,29 @@ SIMPLE_JWT = {
     "BLACKLIST_AFTER_ROTATION": True,
     "AUTH_HEADER_TYPES": ("Bearer",),
     "AUTH_TOKEN_CLASSES": ("rest_framework_simplejwt.tokens.AccessToken",),
+    # Role, user id dan username disimpan di token agar cek permission tanpa query
+    "TOKEN_OBTAIN_SERIALIZER": "lms_core.serializers.RoleTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "lms_core.serializers.RoleTokenRefreshSerializer",
+    "TOKEN_USER_CLASS": "lms_core.authentication.RoleTokenUser",
 }
 
+# Jumlah maksimum token terverifikasi yang disimpan di LRU per proses
+LMS_JWT_CACHE_SIZE = 10000
+
+# Kirim header Server-Timing (db, serialize, total) di setiap respons
+LMS_SERVER_TIMING = True
+
+# Profiling per request: user staff (claim is_staff di JWT) mengirim header X-Profile: 1
+LMS_PROFILER_ENABLED = os.environ.get('LMS_PROFILER_ENABLED') == '1'
+LMS_PROFILER_DIR = BASE_DIR / 'profiles'
+LMS_PROFILER_INTERVAL = 0.001  # detik antar sampel
+LMS_PROFILER_TOP = 40
+
 MIDDLEWARE = [
+    # Paling luar agar mengukur seluruh request (query SQL, serialisasi, total)
+    'lms_core.middleware.RequestMetricsMiddleware',
+    # Aktif hanya jika LMS_PROFILER_ENABLED
+    'lms_core.middleware.ProfilerMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -64,6 +93,8 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # Aktif hanya jika LMS_REPLICA_DATABASES berisi alias
+    'lms_core.middleware.ReplicaRoutingMiddleware',
 ]
 
 ROOT_URLCONF = 'simplelms.urls'
@@ -101,6 +132,87 @@ DATABASES = {
     }
 }
 
+# Manajemen koneksi database (LMS_DB_CONNECTIONS):
+#   pool       - pool psycopg 3 per proses worker (default; satu-satunya mode yang aman untuk ASGI)
+#   persistent - koneksi dipakai ulang per thread selama CONN_MAX_AGE detik + health check (WSGI)
+#   off        - koneksi baru setiap request
+DB_CONNECTIONS = os.environ.get('LMS_DB_CONNECTIONS', 'pool')
+
+if DB_CONNECTIONS == 'pool':
+    DATABASES['default']['OPTIONS'] = {
+        'pool': {
+            'min_size': int(os.environ.get('LMS_DB_POOL_MIN_SIZE', 2)),
+            'max_size': int(os.environ.get('LMS_DB_POOL_MAX_SIZE', 10)),
+            'timeout': float(os.environ.get('LMS_DB_POOL_TIMEOUT', 10)),  # detik menunggu koneksi bebas
+            'max_idle': 300,
+        },
+    }
+    # Pada mode pool, Django memakai ini sebagai check psycopg: koneksi dicek sebelum dipinjamkan
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+elif DB_CONNECTIONS == 'persistent':
+    DATABASES['default']['CONN_MAX_AGE'] = int(os.environ.get('LMS_DB_CONN_MAX_AGE', 60))
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# Read replica: host dipisah koma, mis. DATABASE_REPLICA_HOSTS=replica1,replica2.
+# Setiap host menjadi alias replica_1, replica_2, ... dengan kredensial yang sama dengan default.
+# Uji lokal tanpa replikasi: tambahkan alias SQLite kedua ke DATABASES, set LMS_REPLICA_MIGRATE=1,
+# lalu `python manage.py migrate --database <alias>`. Data tidak disalin otomatis; isi alias itu
+# (mis. salin file SQLite primary) untuk mensimulasikan replica yang tertinggal.
+for number, host in enumerate(filter(None, os.environ.get('DATABASE_REPLICA_HOSTS', '').split(',')), start=1):
+    # Salinan terpisah: setiap alias punya OPTIONS (dan pool) sendiri
+    DATABASES[f'replica_{number}'] = {**deepcopy(DATABASES['default']), 'HOST': host.strip(), 'TEST': {'MIRROR': 'default'}}
+
+# Alias yang melayani read request GET/HEAD/OPTIONS; kosong = semua query ke default
+LMS_REPLICA_DATABASES = [alias for alias in DATABASES if alias != 'default']
+# Setelah user menulis, read user tsb tetap ke primary selama sekian detik (read-your-writes)
+LMS_REPLICA_PIN_SECONDS = 5
+# Izinkan `migrate` pada alias replica; hanya untuk replica lokal, replica streaming ikut primary
+LMS_REPLICA_MIGRATE = os.environ.get('LMS_REPLICA_MIGRATE') == '1'
+
+DATABASE_ROUTERS = ['lms_core.routers.ReplicaRouter']
+
+
+
+# Cache
+# Redis dari docker-compose dipakai jika REDIS_URL di-set, selain itu LocMem untuk lokal
+
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Cache respons katalog (courses, categories) hanya aktif dengan cache bersama (Redis):
+# LocMem per proses, invalidasi dari satu worker tidak sampai ke worker lain
+LMS_RESPONSE_CACHE = bool(REDIS_URL)
+
+# Umur maksimum entri cache katalog (detik); invalidasi utama lewat signal
+LMS_CACHE_TIMEOUT = 3600
+
+# Push event pengumuman (SSE, /api/v1/announcements/stream/, hanya lewat ASGI).
+# InProcessBroker hanya sampai ke stream di proses yang sama (satu worker / test);
+# beberapa worker atau node butuh RedisBroker, otomatis dipakai jika REDIS_URL di-set
+LMS_EVENT_BROKER = 'lms_core.events.RedisBroker' if REDIS_URL else 'lms_core.events.InProcessBroker'
+LMS_SSE_HEARTBEAT = 15    # detik tanpa event sebelum komentar keep-alive dikirim
+LMS_SSE_RETRY_MS = 3000   # jeda reconnect EventSource
+LMS_SSE_QUEUE_SIZE = 100  # event tertunda per client sebelum stream ditutup
+LMS_SSE_TICKET_SECONDS = 30  # umur tiket ?ticket= untuk membuka stream
+
+# Thread hashing password per worker web (bulk register); import_lms_data memakai semua core
+LMS_HASH_WORKERS = 2
+# User per request bulk register: ~0.15 detik PBKDF2 per user harus muat dalam timeout worker.
+# Import yang lebih besar lewat `manage.py import_lms_data`
+LMS_BULK_REGISTER_MAX = 100
 
 
 # Password validation
@@ -152,3 +264,18 @@ except:
 # Media files (images, documents, etc.)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
+
+# Varian gambar Course.image dan Profile.profile_picture: nama -> sisi terpanjang (px).
+# Dibuat di background setelah commit; 0 worker = dibuat langsung di thread yang menyimpan.
+LMS_IMAGE_VARIANTS = {'thumb': 160, 'card': 640}
+LMS_IMAGE_FORMAT = 'WEBP'  # atau 'JPEG'
+LMS_IMAGE_QUALITY = 80
+LMS_IMAGE_WORKERS = 2
+
+# Download lampiran konten (CourseContent.file_attachment):
+#   'nginx'  -> header X-Accel-Redirect ke LMS_SENDFILE_URL + nama file (location internal nginx yang menunjuk MEDIA_ROOT)
+#   'apache' -> header X-Sendfile berisi path absolut file (mod_xsendfile / lighttpd)
+#   kosong   -> Django men-stream file per LMS_DOWNLOAD_CHUNK_SIZE byte
+LMS_SENDFILE_BACKEND = os.environ.get('LMS_SENDFILE_BACKEND')
+LMS_SENDFILE_URL = '/protected-media/'
+LMS_DOWNLOAD_CHUNK_SIZE = 64 * 1024
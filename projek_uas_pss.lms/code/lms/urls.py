@@ -10,6 +10,9 @@ from lms_core.views import (
     UpdateCourseAnnouncementView, 
     DeleteCourseAnnouncementView, 
     ShowCourseAnnouncementView, 
+    MyAnnouncementFeedView,
+    announcement_stream,
+    StreamTicketView,
     AddCategoryView, 
     ShowCategoryView, 
     DeleteCategoryView, 
@@ -17,10 +20,18 @@ from lms_core.views import (
     ShowBookmarksView, 
     DeleteBookmarkView, 
     ShowCourseContentView,
+    CourseOutlineView,
+    ContentDownloadView,
+    SearchView,
     RegisterView,
+    BulkRegisterView,
     BatchEnrollView,
-    UserListView
+    UserListView,
+    CacheStatsView,
+    RequestStatsView
 )
+from lms_core.metrics import metrics_view
+from lms_core.api import apiv1
 from rest_framework_simplejwt import views as jwt_views  # Tambahkan ini untuk JWT views
 
 urlpatterns = [
@@ -28,17 +39,24 @@ urlpatterns = [
     path('api/users/', UserListView.as_view(), name='user-list'),
     # JWT Authentication Endpoints
     path('register/', RegisterView.as_view(), name='register'),
+    path('register/bulk/', BulkRegisterView.as_view(), name='register-bulk'),
     path('api/login/', jwt_views.TokenObtainPairView.as_view(), name='token_obtain_pair'),  # Untuk mendapatkan token
     path('api/token/refresh/', jwt_views.TokenRefreshView.as_view(), name='token_refresh'),  # Untuk me-refresh token
     
     # API Routes
     path('api/v1/contents/', ShowCourseContentView.as_view()),
+    path('api/v1/contents/<int:content_id>/download/', ContentDownloadView.as_view(), name="content-download"),
+    path('api/v1/search/', SearchView.as_view(), name="search"),
     path('api/batch-enroll/', BatchEnrollView.as_view(), name='batch-enroll'),
     path('api/v1/profile/', GetProfileView.as_view(), name="get-profile"),
     path('api/v1/profile/update/', UpdateProfileView.as_view(), name="update-profile"),
     path('api/v1/courses/', CourseListView.as_view(), name="course-list"),
+    path('api/v1/courses/<int:course_id>/outline/', CourseOutlineView.as_view(), name="course-outline"),
     path('api/v1/courses/<int:course_id>/announcements/', ShowCourseAnnouncementView.as_view(), name="show-course-announcement"),
     path('api/v1/courses/<int:course_id>/announcements/create/', CreateCourseAnnouncementView.as_view(), name="create-course-announcement"),
+    path('api/v1/announcements/', MyAnnouncementFeedView.as_view(), name="my-announcements"),
+    path('api/v1/announcements/stream/', announcement_stream, name="announcement-stream"),
+    path('api/v1/announcements/stream/ticket/', StreamTicketView.as_view(), name="announcement-stream-ticket"),
     path('api/v1/announcements/<int:announcement_id>/update/', UpdateCourseAnnouncementView.as_view(), name="update-course-announcement"),
     path('api/v1/announcements/<int:announcement_id>/delete/', DeleteCourseAnnouncementView.as_view(), name="delete-course-announcement"),
     path('api/v1/categories/add/', AddCategoryView.as_view(), name="add-category"),
@@ -47,6 +65,10 @@ urlpatterns = [
     path('api/v1/bookmarks/add/', AddBookmarkView.as_view(), name="add-bookmark"),
     path('api/v1/bookmarks/', ShowBookmarksView.as_view(), name="show-bookmarks"),
     path('api/v1/bookmarks/<int:bookmark_id>/delete/', DeleteBookmarkView.as_view(), name="delete-bookmark"),
+    path('api/v1/cache/stats/', CacheStatsView.as_view(), name="cache-stats"),
+    path('api/v1/stats/requests/', RequestStatsView.as_view(), name="request-stats"),
+    path('metrics', metrics_view, name="metrics"),  # Di-scrape oleh Prometheus
+    path('api/ninja/v1/', apiv1.urls),  # API baca async (Django Ninja), jalankan lewat ASGI
 
     
     # Admin Panel
@@ -1,16 +1,110 @@
-from ninja import NinjaAPI, UploadedFile, File, Form
-from ninja.responses import Response
-from lms_core.schema import CourseSchemaOut, CourseMemberOut, CourseSchemaIn
-from lms_core.schema import CourseContentMini, CourseContentFull
-from lms_core.schema import CourseCommentOut, CourseCommentIn
-from lms_core.models import Course, CourseMember, CourseContent, Comment
-from ninja_simple_jwt.auth.views.api import mobile_auth_router
-from ninja_simple_jwt.auth.ninja_auth import HttpJwtAuth
-from ninja.pagination import paginate, PageNumberPagination
-
-from django.contrib.auth.models import User
-
-apiv1 = NinjaAPI()
-apiv1.add_router("/auth/", mobile_auth_router)
-apiAuth = HttpJwtAuth()
+from typing import List
 
+from django.conf import settings
+from django.shortcuts import aget_object_or_404
+from ninja import NinjaAPI, Query, Schema
+from ninja.security import HttpBearer
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from lms_core.authentication import StatelessJWTAuthentication
+from lms_core.cache import acached_response_data
+from lms_core.schema import CourseSchemaOut, CourseMemberOut, CourseAnnouncementOut
+from lms_core.schema import CourseContentFull
+from lms_core.schema import CourseCommentOut
+from lms_core.models import Course, CourseMember, CourseContent, Comment, CourseAnnouncement
+
+
+class SimpleJWTBearer(HttpBearer):
+    """
+    Bearer auth for the Ninja API using the same access tokens as the DRF API
+    (``/api/login/``). Verification goes through the verified-token cache and
+    returns a ``RoleTokenUser``, so authenticating never touches the database.
+    """
+
+    jwt = StatelessJWTAuthentication()
+
+    def authenticate(self, request, token):
+        try:
+            validated = self.jwt.get_validated_token(token.encode())
+            return self.jwt.get_user(validated)
+        except (InvalidToken, TokenError):
+            return None
+
+
+apiv1 = NinjaAPI(title="Simple LMS async read API", auth=SimpleJWTBearer(), urls_namespace="ninja-v1")
+apiAuth = apiv1.auth
+
+
+class PageQuery(Schema):
+    limit: int = 20
+    offset: int = 0
+
+
+async def _page(queryset, page):
+    # Pagination bawaan ninja mengevaluasi queryset secara sinkron, jadi slicing + iterasi async di sini
+    limit = max(1, min(page.limit, getattr(settings, 'LMS_MAX_PAGE_SIZE', 100)))
+    offset = max(0, page.offset)
+    return [obj async for obj in queryset[offset:offset + limit]]
+
+
+# Semua relasi yang dibaca schema di-select_related: akses FK lazy di view async akan error
+
+def _courses():
+    return Course.objects.select_related('teacher').order_by('created_at', 'id')
+
+
+def _contents():
+    return CourseContent.objects.select_related('course_id__teacher').order_by('created_at', 'id')
+
+
+@apiv1.get("/courses", response=List[CourseSchemaOut])
+async def list_courses(request, page: Query[PageQuery]):
+    async def build():
+        return [CourseSchemaOut.model_validate(course).model_dump() for course in await _page(_courses(), page)]
+
+    # Cache dan invalidasi sama dengan /api/v1/courses/ (namespace 'courses'), supaya
+    # perbandingan DRF vs Ninja mengukur jalur yang setara
+    return await acached_response_data('courses', request, build)
+
+
+@apiv1.get("/courses/{course_id}", response=CourseSchemaOut)
+async def get_course(request, course_id: int):
+    return await aget_object_or_404(_courses(), id=course_id)
+
+
+@apiv1.get("/courses/{course_id}/contents", response=List[CourseContentFull])
+async def list_course_contents(request, course_id: int, page: Query[PageQuery]):
+    return await _page(_contents().filter(course_id=course_id), page)
+
+
+@apiv1.get("/courses/{course_id}/announcements", response=List[CourseAnnouncementOut])
+async def list_course_announcements(request, course_id: int, page: Query[PageQuery]):
+    announcements = (CourseAnnouncement.objects.filter(course_id=course_id)
+                     .select_related('teacher').order_by('date', 'id'))
+    return await _page(announcements, page)
+
+
+@apiv1.get("/contents", response=List[CourseContentFull])
+async def list_contents(request, page: Query[PageQuery]):
+    return await _page(_contents(), page)
+
+
+@apiv1.get("/contents/{content_id}", response=CourseContentFull)
+async def get_content(request, content_id: int):
+    return await aget_object_or_404(_contents(), id=content_id)
+
+
+@apiv1.get("/contents/{content_id}/comments", response=List[CourseCommentOut])
+async def list_content_comments(request, content_id: int, page: Query[PageQuery]):
+    comments = Comment.objects.filter(content_id=content_id).select_related(
+        'content_id__course_id__teacher', 'member_id__course_id__teacher', 'member_id__user_id',
+    ).order_by('created_at', 'id')
+    return await _page(comments, page)
+
+
+@apiv1.get("/mycourses", response=List[CourseMemberOut])
+async def my_courses(request, page: Query[PageQuery]):
+    memberships = CourseMember.objects.filter(user_id=request.auth.id).select_related(
+        'course_id__teacher', 'user_id',
+    ).order_by('created_at', 'id')
+    return await _page(memberships, page)
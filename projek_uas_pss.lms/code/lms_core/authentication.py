@@ -0,0 +1,132 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication, JWTStatelessUserAuthentication
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.tokens import Token
+
+from lms_core.metrics import JWT_CACHE_REQUESTS
+
+
+class VerifiedTokenCache:
+    """
+    Bounded in-process LRU of tokens whose signature and claims were already
+    verified, keyed by the SHA-256 digest of the raw token. An entry is only
+    served until the token's own ``exp``.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(raw_token):
+        if isinstance(raw_token, str):
+            raw_token = raw_token.encode()
+        return hashlib.sha256(raw_token).digest()
+
+    def get(self, raw_token):
+        key = self._key(raw_token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                token, expires_at = entry
+                if time.time() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    JWT_CACHE_REQUESTS.labels('hit').inc()
+                    return token
+                del self._entries[key]
+            self.misses += 1
+        JWT_CACHE_REQUESTS.labels('miss').inc()
+        return None
+
+    def put(self, raw_token, token):
+        expires_at = token.get('exp')
+        if not expires_at or self.maxsize <= 0:
+            return
+        key = self._key(raw_token)
+        with self._lock:
+            self._entries[key] = (token, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / total, 4) if total else None,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+
+token_cache = VerifiedTokenCache(getattr(settings, 'LMS_JWT_CACHE_SIZE', 10000))
+
+
+class CachedTokenValidationMixin:
+    """
+    Skip signature verification for a bearer token this process has already
+    verified. Tokens are immutable, so a cached verification stays valid until
+    ``exp``. (Token blacklisting is not enabled in this project; with the
+    blacklist app installed, revocation would only apply to uncached tokens.)
+    """
+
+    def get_validated_token(self, raw_token):
+        token = token_cache.get(raw_token)
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            token_cache.put(raw_token, token)
+        return token
+
+
+class CachedJWTAuthentication(CachedTokenValidationMixin, JWTAuthentication):
+    """Default JWT authentication (loads the ``User``) with the verified-token cache."""
+
+
+class RoleTokenUser(TokenUser):
+    """
+    Token-backed user built from the access token claims (``user_id``,
+    ``username``, ``role``, ``is_staff``) without touching the database.
+    """
+
+    @cached_property
+    def role(self):
+        return self.token.get('role')
+
+
+class StreamTicket(Token):
+    """
+    Short-lived, single-purpose credential for the announcement event stream.
+    ``EventSource`` cannot send an ``Authorization`` header, so the credential
+    travels in the query string, where proxies and access logs record it; a
+    logged ticket only opens the stream and expires after
+    ``LMS_SSE_TICKET_SECONDS``. Its ``token_type`` claim keeps it from being
+    accepted as an access token (and an access token from being a ticket).
+    """
+
+    token_type = 'stream'
+    lifetime = timedelta(seconds=getattr(settings, 'LMS_SSE_TICKET_SECONDS', 30))
+
+
+class StatelessJWTAuthentication(CachedTokenValidationMixin, JWTStatelessUserAuthentication):
+    """
+    JWT authentication for hot read endpoints: the user is a ``RoleTokenUser``
+    built from the verified token, so authentication and role checks need zero
+    queries. Role and staff changes take effect when the client refreshes its token.
+    """
@@ -0,0 +1,48 @@
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from lms_core.hashing import hash_passwords
+from lms_core.models import Profile
+
+
+def bulk_create_users(entries, batch_size=1000):
+    """
+    Create users and their profiles from a list of dicts (the fields accepted by
+    ``RegisterSerializer`` except ``profile_picture``).
+
+    Passwords are hashed in parallel before the transaction starts; the
+    inserts themselves are batched ``bulk_create`` calls on this process.
+    Usernames must already be validated as new and unique.
+    """
+    hashed = hash_passwords(entry['password'] for entry in entries)
+
+    users = [
+        User(
+            username=entry['username'],
+            password=password,
+            email=entry.get('email', ''),
+            first_name=entry.get('first_name', ''),
+            last_name=entry.get('last_name', ''),
+        )
+        for entry, password in zip(entries, hashed)
+    ]
+    with transaction.atomic():
+        users = User.objects.bulk_create(users, batch_size=batch_size)
+        if users and users[0].pk is None:
+            # Backend tanpa RETURNING: ambil id berdasarkan username
+            ids = dict(User.objects.filter(username__in=[u.username for u in users]).values_list('username', 'id'))
+            for user in users:
+                user.pk = ids[user.username]
+        Profile.objects.bulk_create(
+            [
+                Profile(
+                    user=user,
+                    role=entry.get('role', 'student'),
+                    phone_number=entry.get('phone_number', ''),
+                    description=entry.get('description', ''),
+                )
+                for user, entry in zip(users, entries)
+            ],
+            batch_size=batch_size,
+        )
+    return users
@@ -0,0 +1,123 @@
+import hashlib
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+
+from lms_core.metrics import CACHE_REQUESTS
+
+_stats_lock = threading.Lock()
+_hits = Counter()
+_misses = Counter()
+
+
+def _version_key(namespace):
+    return f'lms:ns:{namespace}'
+
+
+def namespace_version(namespace):
+    """Current version of a cache namespace; bumping it orphans every old entry."""
+    key = _version_key(namespace)
+    version = cache.get(key)
+    if version is None:
+        # Mulai dari timestamp agar versi baru tidak bentrok dengan entri lama
+        # jika key versi sempat ter-evict dari cache
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def anamespace_version(namespace):
+    """Async :func:`namespace_version` for async views."""
+    key = _version_key(namespace)
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, int(time.time() * 1000), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+def _response_key(namespace, version, request):
+    url_hash = hashlib.md5(request.build_absolute_uri().encode()).hexdigest()
+    return f'lms:{namespace}:v{version}:{url_hash}'
+
+
+def invalidate(*namespaces):
+    for namespace in namespaces:
+        key = _version_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, int(time.time() * 1000), timeout=None)
+
+
+def response_cache_enabled():
+    return getattr(settings, 'LMS_RESPONSE_CACHE', False)
+
+
+def cached_response_data(namespace, request, build):
+    """
+    Read-through cache for a view's response payload.
+
+    The key combines the namespace version with the full request URL, so every
+    page/query string is cached separately and all of them are dropped at once
+    by :func:`invalidate`. ``build`` is only called on a miss.
+
+    Only active with ``LMS_RESPONSE_CACHE``, which must only be set for a cache
+    shared by every worker: :func:`invalidate` bumps the version in that cache,
+    so with a per-process cache the other workers would keep serving (and
+    ETag-validating) the old payload until ``LMS_CACHE_TIMEOUT``.
+    """
+    if not response_cache_enabled():
+        return build()
+    key = _response_key(namespace, namespace_version(namespace), request)
+
+    data = cache.get(key)
+    if data is not None:
+        _record(namespace, hit=True)
+        return data
+
+    _record(namespace, hit=False)
+    data = build()
+    cache.set(key, data, getattr(settings, 'LMS_CACHE_TIMEOUT', 3600))
+    return data
+
+
+async def acached_response_data(namespace, request, build):
+    """Async :func:`cached_response_data`; ``build`` is a coroutine function."""
+    if not response_cache_enabled():
+        return await build()
+    key = _response_key(namespace, await anamespace_version(namespace), request)
+
+    data = await cache.aget(key)
+    if data is not None:
+        _record(namespace, hit=True)
+        return data
+
+    _record(namespace, hit=False)
+    data = await build()
+    await cache.aset(key, data, getattr(settings, 'LMS_CACHE_TIMEOUT', 3600))
+    return data
+
+
+def _record(namespace, hit):
+    with _stats_lock:
+        (_hits if hit else _misses)[namespace] += 1
+    CACHE_REQUESTS.labels(namespace, 'hit' if hit else 'miss').inc()
+
+
+def cache_stats():
+    """Hit/miss counters of this process, per namespace."""
+    with _stats_lock:
+        namespaces = sorted(set(_hits) | set(_misses))
+        stats = {}
+        for namespace in namespaces:
+            hits, misses = _hits[namespace], _misses[namespace]
+            stats[namespace] = {
+                'hits': hits,
+                'misses': misses,
+                'hit_ratio': round(hits / (hits + misses), 4) if hits + misses else None,
+            }
+        return stats
@@ -0,0 +1,58 @@
+import hashlib
+from functools import wraps
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+
+
+def queryset_validator(*querysets):
+    """
+    Cheap change validator for one or more querysets: ``MAX(updated_at)`` and
+    ``COUNT(*)`` of each, computed in the database without loading any rows.
+
+    Returns the fingerprint string. The row count is part of it so deletions
+    change the ETag even when the newest ``updated_at`` stays the same, and
+    ``updated_at`` keeps its microseconds so two edits in the same second
+    still differ.
+    """
+    parts = []
+    for queryset in querysets:
+        result = queryset.order_by().aggregate(last=Max('updated_at'), count=Count('pk'))
+        parts.append(f"{queryset.model._meta.label_lower}:{result['count']}:{result['last'] and result['last'].isoformat()}")
+    return '|'.join(parts)
+
+
+def conditional_get(validator):
+    """
+    Decorator for ``APIView.get`` that answers ``If-None-Match`` with 304
+    before the view serializes anything.
+
+    ``validator(request, *args, **kwargs)`` returns a fingerprint like
+    :func:`queryset_validator`. It runs after DRF authentication and permission
+    checks, so a 304 is never sent to a client that would get a 401/403.
+
+    Only a strong ETag is sent. A list has no honest ``Last-Modified``:
+    ``MAX(updated_at)`` does not move when a row is deleted and has one-second
+    resolution in HTTP dates, so ``If-Modified-Since`` would give stale 304s.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            fingerprint = validator(request, *args, **kwargs)
+            # URL ikut di-hash karena tiap halaman/query string punya isi berbeda
+            digest = hashlib.md5(f"{request.get_full_path()}|{fingerprint}".encode()).hexdigest()
+            etag = quote_etag(digest)
+
+            response = get_conditional_response(request, etag=etag)
+            if response is not None:
+                # RFC 9110: 304 membawa validator yang sama dengan 200
+                response.headers['ETag'] = etag
+                return response
+
+            response = method(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                response.headers.setdefault('ETag', etag)
+            return response
+        return wrapper
+    return decorator
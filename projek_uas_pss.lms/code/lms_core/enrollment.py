@@ -0,0 +1,64 @@
+from django.contrib.auth.models import User
+
+from lms_core.models import CourseMember
+
+
+def bulk_enroll_students(course, student_ids, batch_size=None):
+    """
+    Enroll many students into ``course`` using a fixed number of queries.
+
+    Users, their roles and existing memberships are resolved with one set-based
+    query each, then the new memberships are written with a conflict-ignoring
+    bulk insert backed by the ``unique_course_member`` constraint.
+
+    Returns a tuple ``(enrolled_usernames, not_found_ids, invalid_role_usernames)``
+    in the order the ids were submitted.
+
+    Every student in ``enrolled_usernames`` is a member of ``course`` when this
+    returns, but not necessarily through this call: a membership inserted by a
+    concurrent request between the membership read and the insert is skipped
+    by the conflict handling and still reported here. Callers that need the
+    exact set of rows written by this call must not rely on the result.
+    """
+    # Buang id ganda tapi pertahankan urutan dari request
+    student_ids = list(dict.fromkeys(student_ids))
+
+    users = {
+        user_id: (username, role)
+        for user_id, username, role in User.objects.filter(id__in=student_ids)
+        .values_list('id', 'username', 'profile__role')
+    }
+
+    not_found = []
+    invalid_role = []
+    candidates = []
+    for student_id in student_ids:
+        if student_id not in users:
+            not_found.append(student_id)
+            continue
+        username, role = users[student_id]
+        if role != 'student':
+            # Termasuk user yang belum punya profile (role None)
+            invalid_role.append(username)
+            continue
+        candidates.append(student_id)
+
+    if not candidates:
+        return [], not_found, invalid_role
+
+    already_member = set(
+        CourseMember.objects.filter(course_id=course, user_id__in=candidates)
+        .values_list('user_id', flat=True)
+    )
+    new_ids = [student_id for student_id in candidates if student_id not in already_member]
+
+    # Konflik (enroll bersamaan dari request lain) dilewati; student tersebut tetap
+    # terdaftar sehingga ikut dilaporkan sebagai enrolled, lihat docstring
+    CourseMember.objects.bulk_create(
+        [CourseMember(course_id=course, user_id_id=student_id, roles='std') for student_id in new_ids],
+        batch_size=batch_size,
+        ignore_conflicts=True,
+    )
+
+    enrolled = [users[student_id][0] for student_id in new_ids]
+    return enrolled, not_found, invalid_role
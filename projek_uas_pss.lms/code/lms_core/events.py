@@ -0,0 +1,172 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from functools import partial
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from rest_framework.utils import encoders
+
+logger = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = 'lms:course:'
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def course_channel(course_id):
+    return f'{CHANNEL_PREFIX}{course_id}'
+
+
+class Subscription:
+    """
+    Messages for one open stream. ``get()`` returns ``None`` once the client has
+    fallen more than ``LMS_SSE_QUEUE_SIZE`` messages behind; the stream is then
+    closed and the client reconnects and re-reads the feed. ``close()`` must be
+    called when the stream ends.
+    """
+
+    def __init__(self, loop, on_close):
+        self._loop = loop
+        self._on_close = on_close
+        self._queue = asyncio.Queue(getattr(settings, 'LMS_SSE_QUEUE_SIZE', 100))
+        self.overflowed = False
+
+    def close(self):
+        self._on_close(self)
+
+    def deliver(self, message):
+        # Dipanggil dari thread mana pun (signal di view sinkron, listener Redis)
+        try:
+            self._loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            pass  # Event loop stream sudah ditutup
+
+    def _put(self, message):
+        if self.overflowed:
+            return
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+
+    async def get(self, timeout):
+        """Next message; raises ``asyncio.TimeoutError`` when nothing arrives within ``timeout`` seconds."""
+        return await asyncio.wait_for(self._queue.get(), timeout)
+
+
+class InProcessBroker:
+    """
+    Pub/sub inside one process: events only reach streams served by the process
+    that published them. Enough for a single ASGI worker and for tests.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}  # channel -> set of Subscription
+
+    def has_subscribers(self, channel):
+        with self._lock:
+            return channel in self._subscribers
+
+    def publish(self, channel, message):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            subscription.deliver(message)
+
+    def subscribe(self, channels):
+        """A :class:`Subscription` to ``channels``, delivered on the running event loop."""
+        subscription = Subscription(asyncio.get_running_loop(), partial(self._unsubscribe, channels))
+        with self._lock:
+            for channel in channels:
+                self._subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def _unsubscribe(self, channels, subscription):
+        with self._lock:
+            for channel in channels:
+                subscribers = self._subscribers.get(channel)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[channel]
+
+
+class RedisBroker(InProcessBroker):
+    """
+    Pub/sub over Redis (``LMS_EVENT_REDIS_URL``, default ``REDIS_URL``) for
+    several workers or nodes. Each process keeps one pattern subscription and
+    fans messages out to its own streams, so the number of Redis connections
+    does not grow with the number of clients.
+    """
+
+    def __init__(self, url=None):
+        super().__init__()
+        import redis  # Dependensi opsional, hanya dibutuhkan broker ini
+
+        self._redis = redis.Redis.from_url(
+            url or getattr(settings, 'LMS_EVENT_REDIS_URL', None) or settings.REDIS_URL
+        )
+        self._listener = None
+
+    def has_subscribers(self, channel):
+        # Subscriber bisa ada di proses/node lain, dari sini tidak terlihat
+        return True
+
+    def publish(self, channel, message):
+        self._redis.publish(channel, message)
+
+    def subscribe(self, channels):
+        self._start_listener()
+        return super().subscribe(channels)
+
+    def _start_listener(self):
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name='lms-event-listener', daemon=True)
+                self._listener.start()
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(f'{CHANNEL_PREFIX}*')
+                for item in pubsub.listen():
+                    if item['type'] == 'pmessage':
+                        InProcessBroker.publish(self, item['channel'].decode(), item['data'].decode())
+            except Exception:
+                # Redis putus/restart: coba lagi, event selama putus memang hilang (client membaca ulang feed)
+                logger.exception("Listener event Redis terputus, mencoba lagi")
+                time.sleep(1)
+
+
+def get_broker():
+    """The process-wide broker configured by ``LMS_EVENT_BROKER`` (dotted path)."""
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = import_string(getattr(settings, 'LMS_EVENT_BROKER', 'lms_core.events.InProcessBroker'))()
+        return _broker
+
+
+def publish_event(course_id, build_event):
+    """
+    Push the event returned by ``build_event()`` to the streams of
+    ``course_id``; best effort, never fails the caller. ``build_event`` is
+    only called when the broker may have subscribers for the course.
+    """
+    channel = course_channel(course_id)
+    try:
+        broker = get_broker()
+        if broker.has_subscribers(channel):
+            broker.publish(channel, json.dumps(build_event(), cls=encoders.JSONEncoder))
+    except Exception:
+        # Data sudah ter-commit; client yang kehilangan event tetap melihatnya di feed
+        logger.exception("Gagal mengirim event untuk course %s", course_id)
@@ -0,0 +1,148 @@
+from operator import itemgetter
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+from lms_core.models import Course, CourseContent
+from lms_core.serializers import image_variant_urls
+
+# Kolom yang dibaca CourseSerializer, urutannya sama dengan field di output
+COURSE_COLUMNS = (
+    'id', 'name', 'description', 'price', 'image', 'image_variants', 'teacher',
+    'created_at', 'updated_at', 'category', 'category__name',
+)
+CONTENT_COLUMNS = (
+    'id', 'name', 'description', 'video_url', 'file_attachment', 'parent_id', 'created_at', 'updated_at',
+)
+
+
+def _datetime_representation():
+    # Sama dengan DRF DateTimeField.to_representation, tapi zona waktu dihitung sekali per respons
+    if (api_settings.DATETIME_FORMAT or '').lower() != ISO_8601 or not settings.USE_TZ:
+        return serializers.DateTimeField().to_representation
+    field_timezone = timezone.get_current_timezone()
+
+    def represent(value):
+        if not value:
+            return None
+        value = value.astimezone(field_timezone).isoformat()
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
+
+    return represent
+
+
+def _file_representation(model_field, request):
+    # Sama dengan DRF FileField/ImageField.to_representation untuk nama file dari values()
+    storage = model_field.storage
+    use_url = api_settings.UPLOADED_FILES_USE_URL
+
+    def represent(name):
+        if not name:
+            return None
+        if not use_url:
+            return name
+        url = storage.url(name)
+        return request.build_absolute_uri(url) if request is not None else url
+
+    return represent
+
+
+def course_builder(request=None, prefix=''):
+    """Row -> dict builder matching ``CourseSerializer`` for ``values()`` rows of ``COURSE_COLUMNS``."""
+    get = itemgetter(*(prefix + column for column in COURSE_COLUMNS))
+    image = _file_representation(Course._meta.get_field('image'), request)
+    when = _datetime_representation()
+
+    def build(row):
+        (pk, name, description, price, image_name, variants, teacher,
+         created_at, updated_at, category_id, category_name) = get(row)
+        return {
+            'id': pk,
+            'name': name,
+            'description': description,
+            'price': price,
+            'image': image(image_name),
+            'image_variants': image_variant_urls(variants, request),
+            'teacher': teacher,
+            'created_at': when(created_at),
+            'updated_at': when(updated_at),
+            'category': None if category_id is None else {'id': category_id, 'name': category_name},
+        }
+
+    return build
+
+
+def content_builder(request=None):
+    """Row -> dict builder matching ``CourseContentSerializer`` (course nested under ``course_id__``)."""
+    get = itemgetter(*CONTENT_COLUMNS)
+    course = course_builder(request, prefix='course_id__')
+    attachment = _file_representation(CourseContent._meta.get_field('file_attachment'), request)
+    when = _datetime_representation()
+
+    def build(row):
+        pk, name, description, video_url, file_name, parent_id, created_at, updated_at = get(row)
+        return {
+            'id': pk,
+            'name': name,
+            'description': description,
+            'video_url': video_url,
+            'file_attachment': attachment(file_name),
+            'course_id': course(row),
+            'parent_id': parent_id,
+            'created_at': when(created_at),
+            'updated_at': when(updated_at),
+        }
+
+    return build
+
+
+class ValuesSerializer:
+    """
+    Read-only stand-in for a ``ModelSerializer`` on hot list endpoints. Rows
+    come from ``QuerySet.values()`` with exactly the needed columns (relations
+    joined in the same query) and are turned into dicts directly, skipping
+    DRF's per-field ``get_attribute``/``to_representation`` calls. Output is
+    identical to the serializer it replaces (checked by ``bench_serializers``).
+
+    Same calling convention as DRF (``Serializer(rows, many=True).data``), so it
+    also plugs into ``stream_json_array``.
+
+    Subclasses must set ``columns`` (passed to ``values()``) and ``builder``, a
+    ``builder(request) -> build(row)`` factory wrapped in ``staticmethod``;
+    both are checked when the subclass is defined.
+    """
+
+    columns = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not cls.columns or not callable(getattr(cls, 'builder', None)):
+            raise TypeError(f"{cls.__name__} harus mendefinisikan 'columns' dan 'builder'")
+
+    def __init__(self, instance, many=False, context=None):
+        self.instance = instance
+        self.many = many
+        self.context = context or {}
+
+    @classmethod
+    def values(cls, queryset):
+        return queryset.values(*cls.columns)
+
+    @property
+    def data(self):
+        build = self.builder(self.context.get('request'))
+        if self.many:
+            return [build(row) for row in self.instance]
+        return build(self.instance)
+
+
+class FastCourseSerializer(ValuesSerializer):
+    columns = COURSE_COLUMNS
+    builder = staticmethod(course_builder)
+
+
+class FastCourseContentSerializer(ValuesSerializer):
+    columns = CONTENT_COLUMNS + tuple('course_id__' + column for column in COURSE_COLUMNS)
+    builder = staticmethod(content_builder)
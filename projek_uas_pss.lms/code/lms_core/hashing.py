@@ -0,0 +1,45 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+
+# Di bawah jumlah ini overhead mengirim pekerjaan ke pool lebih mahal dari hashing-nya
+PARALLEL_HASH_THRESHOLD = 4
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def hash_workers():
+    return getattr(settings, 'LMS_HASH_WORKERS', 2)
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=hash_workers(), thread_name_prefix='lms-hash')
+        return _pool
+
+
+def hash_passwords(passwords, workers=None):
+    """
+    Hash many raw passwords with ``make_password``. Order is preserved.
+
+    ``hashlib.pbkdf2_hmac`` (and the argon2/bcrypt bindings) release the GIL,
+    so threads hash in parallel without extra processes or a second
+    ``django.setup()``. Inside a web worker the work goes to one pool per
+    process capped at ``LMS_HASH_WORKERS`` threads, so N workers use at most
+    N x ``LMS_HASH_WORKERS`` cores for hashing. Offline callers such as
+    ``import_lms_data`` pass ``workers`` (e.g. the CPU count) to get a
+    dedicated pool of that size for the call.
+    """
+    passwords = list(passwords)
+    size = workers or hash_workers()
+    if size <= 1 or len(passwords) < PARALLEL_HASH_THRESHOLD:
+        return [make_password(password) for password in passwords]
+    if workers:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='lms-hash') as pool:
+            return list(pool.map(make_password, passwords))
+    return list(_get_pool().map(make_password, passwords))
@@ -0,0 +1,139 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+
+# Batas bucket histogram (milidetik untuk durasi, jumlah untuk query)
+DURATION_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+_current = ContextVar('lms_request_metrics', default=None)
+
+
+class RequestMetrics:
+    """Counters for the request currently being handled."""
+
+    __slots__ = ('queries', 'db_seconds', 'serialize_seconds')
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+
+    def db_wrapper(self, execute, sql, params, many, context):
+        # Dipasang lewat connection.execute_wrapper, jadi jalan juga saat DEBUG=False
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_seconds += time.perf_counter() - started
+
+
+def current_metrics():
+    return _current.get()
+
+
+def activate(metrics):
+    return _current.set(metrics)
+
+
+def deactivate(token):
+    _current.reset(token)
+
+
+@contextmanager
+def timed_serialization():
+    """Count the enclosed block as serialization time of the current request."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.serialize_seconds += time.perf_counter() - started
+
+
+class Histogram:
+    """Fixed-bucket cumulative histogram (Prometheus style), thread-safe."""
+
+    def __init__(self, buckets):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # slot terakhir = +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def snapshot(self):
+        with self._lock:
+            cumulative = []
+            running = 0
+            for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+                running += count
+                cumulative.append((bound, running))
+            return {'buckets': cumulative, 'sum': self.sum, 'count': self.count}
+
+
+class RouteStats:
+    def __init__(self):
+        self.total_ms = Histogram(DURATION_BUCKETS_MS)
+        self.db_ms = Histogram(DURATION_BUCKETS_MS)
+        self.serialize_ms = Histogram(DURATION_BUCKETS_MS)
+        self.queries = Histogram(QUERY_COUNT_BUCKETS)
+
+    def snapshot(self):
+        return {
+            'total_ms': self.total_ms.snapshot(),
+            'db_ms': self.db_ms.snapshot(),
+            'serialize_ms': self.serialize_ms.snapshot(),
+            'queries': self.queries.snapshot(),
+        }
+
+
+_routes = {}
+_routes_lock = threading.Lock()
+
+
+def record_request(route, metrics, total_seconds):
+    stats = _routes.get(route)
+    if stats is None:
+        with _routes_lock:
+            stats = _routes.setdefault(route, RouteStats())
+    stats.total_ms.observe(total_seconds * 1000)
+    stats.db_ms.observe(metrics.db_seconds * 1000)
+    stats.serialize_ms.observe(metrics.serialize_seconds * 1000)
+    stats.queries.observe(metrics.queries)
+
+
+def route_stats():
+    """Snapshot of the per-route histograms of this process."""
+    with _routes_lock:
+        routes = dict(_routes)
+    return {route: stats.snapshot() for route, stats in sorted(routes.items())}
+
+
+def database_pool_stats():
+    """
+    psycopg pool statistics (size, available, waiting, checkouts, ...) for the
+    pooled aliases this thread currently holds a connection on. Unused aliases
+    are skipped: reading ``connection.pool`` would otherwise build a pool.
+    """
+    stats = {}
+    for connection in connections.all(initialized_only=True):
+        # Koneksi terbuka berarti pool alias ini sudah ada; hanya PostgreSQL dengan OPTIONS['pool'] yang punya pool
+        if connection.connection is None:
+            continue
+        pool = getattr(connection, 'pool', None)
+        if pool is not None:
+            stats[connection.alias] = pool.get_stats()
+    return stats
@@ -0,0 +1,64 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from lms_core.enrollment import bulk_enroll_students
+from lms_core.models import Course, Profile
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark batch enroll: jumlah query harus tetap walaupun jumlah siswa bertambah."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000],
+            help="Jumlah student_ids per percobaan.",
+        )
+
+    def handle(self, *args, **options):
+        sizes = sorted(options["sizes"])
+        try:
+            # Semua data benchmark dibuat di dalam transaksi lalu di-rollback
+            with transaction.atomic():
+                self._run(sizes)
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, sizes):
+        teacher = User.objects.create(username="bench_enroll_teacher")
+        Profile.objects.create(user=teacher, role="teacher")
+
+        students = User.objects.bulk_create(
+            [User(username=f"bench_enroll_student_{i}") for i in range(max(sizes))]
+        )
+        if students[0].pk is None:
+            students = list(User.objects.filter(username__startswith="bench_enroll_student_").order_by("id"))
+        Profile.objects.bulk_create([Profile(user=student, role="student") for student in students])
+        missing_id = User.objects.order_by("-id").values_list("id", flat=True).first() + 1
+
+        if connection.vendor == "sqlite":
+            # Django memecah bulk insert SQLite per 999 parameter, di PostgreSQL tetap satu INSERT
+            self.stdout.write("Catatan: SQLite membatasi parameter per query, INSERT dipecah per batch.")
+        self.stdout.write(f"{'size':>8} {'queries':>8} {'seconds':>10}")
+        for size in sizes:
+            course = Course.objects.create(
+                name=f"bench enroll {size}", description="-", price=0, teacher=teacher
+            )
+            # Tambahkan satu id yang tidak ada dan satu teacher agar semua cabang ikut terukur
+            student_ids = [student.id for student in students[:size]] + [missing_id, teacher.id]
+
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                enrolled, not_found, invalid_role = bulk_enroll_students(course, student_ids)
+                elapsed = time.perf_counter() - started
+
+            assert len(enrolled) == size and not_found == [missing_id] and invalid_role == [teacher.username]
+            self.stdout.write(f"{size:>8} {len(queries):>8} {elapsed:>10.4f}")
@@ -0,0 +1,105 @@
+import time
+from urllib.parse import urlsplit
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from lms_core.models import Course, CourseAnnouncement, CourseMember, Profile
+from lms_core.serializers import RoleTokenObtainPairSerializer
+
+# Satu halaman feed = satu query (JWT stateless, relasi di-join)
+FEED_QUERY_BUDGET = 1
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Bandingkan feed /api/v1/announcements/ (satu query lintas kursus) dengan memanggil "
+        "/api/v1/courses/<id>/announcements/ per kursus; query per halaman feed harus tetap."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--courses", type=int, nargs="+", default=[5, 20, 100],
+            help="Jumlah kursus yang diikuti student per percobaan.",
+        )
+        parser.add_argument("--announcements", type=int, default=30, help="Jumlah pengumuman per kursus.")
+        parser.add_argument("--pages", type=int, default=5, help="Jumlah halaman feed yang diikuti lewat 'next'.")
+
+    def handle(self, *args, **options):
+        # Cache dimatikan supaya yang terukur adalah query-nya
+        dummy_cache = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+        try:
+            with override_settings(ALLOWED_HOSTS=["testserver"], CACHES=dummy_cache), transaction.atomic():
+                failures = self._run(sorted(options["courses"]), options["announcements"], options["pages"])
+                raise _Rollback
+        except _Rollback:
+            pass
+        if failures:
+            raise CommandError(f"Budget {FEED_QUERY_BUDGET} query per halaman feed terlampaui untuk: {failures}")
+
+    def _run(self, sizes, per_course, pages):
+        teacher = User.objects.create(username="bench_feed_teacher")
+        Profile.objects.create(user=teacher, role="teacher")
+        # Student lain ikut terdaftar supaya membership tidak hanya milik satu user
+        others = User.objects.bulk_create([User(username=f"bench_feed_other_{i}") for i in range(20)])
+        if others[0].pk is None:
+            others = list(User.objects.filter(username__startswith="bench_feed_other_"))
+
+        failures = []
+        self.stdout.write(
+            f"{'courses':>8} {'feed q/page':>12} {'feed ms/page':>13} {'per-course q':>13} {'per-course ms':>14}"
+        )
+        for size in sizes:
+            student = User.objects.create(username=f"bench_feed_student_{size}")
+            Profile.objects.create(user=student, role="student")
+            courses = Course.objects.bulk_create([
+                Course(name=f"bench feed {size} {i}", description="-", price=0, teacher=teacher)
+                for i in range(size)
+            ])
+            if courses[0].pk is None:
+                courses = list(Course.objects.filter(name__startswith=f"bench feed {size} "))
+            CourseMember.objects.bulk_create(
+                CourseMember(course_id=course, user_id=user) for course in courses for user in [student, *others]
+            )
+            CourseAnnouncement.objects.bulk_create(
+                CourseAnnouncement(course=course, title=f"pengumuman {i}", content="-",
+                                   date=course.created_at, teacher=teacher)
+                for course in courses
+                for i in range(per_course)
+            )
+            token = RoleTokenObtainPairSerializer.get_token(student).access_token
+            client = Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+            # Feed: ikuti link 'next' beberapa halaman, ukur rata-rata per halaman
+            path, worst, elapsed, fetched = "/api/v1/announcements/", 0, 0.0, 0
+            while path and fetched < pages:
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    response = client.get(path)
+                    elapsed += time.perf_counter() - started
+                worst = max(worst, len(queries))
+                fetched += 1
+                next_link = response.json()["next"]
+                path = next_link and "{0.path}?{0.query}".format(urlsplit(next_link))
+
+            # Cara lama: satu request per kursus yang diikuti
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                for course in courses:
+                    client.get(f"/api/v1/courses/{course.pk}/announcements/")
+                per_course_seconds = time.perf_counter() - started
+
+            self.stdout.write(
+                f"{size:>8} {worst:>12} {elapsed / fetched * 1000:>13.2f} "
+                f"{len(queries):>13} {per_course_seconds * 1000:>14.2f}"
+            )
+            if worst > FEED_QUERY_BUDGET:
+                failures.append((size, worst))
+        return failures
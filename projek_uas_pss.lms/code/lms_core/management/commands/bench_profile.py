@@ -0,0 +1,63 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from lms_core.models import Category, Course, CourseMember, Profile
+from lms_core.serializers import UserProfileSerializer
+
+# user+profile, membership+course+category, created course+category
+PROFILE_QUERY_BUDGET = 3
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Cek jumlah query serialisasi profile tetap di bawah budget untuk jumlah kursus berapa pun."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", type=int, nargs="+", default=[1, 10, 40, 200],
+            help="Jumlah kursus yang diikuti/dibuat per percobaan.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                failures = self._run(sorted(options["sizes"]))
+                raise _Rollback
+        except _Rollback:
+            pass
+        if failures:
+            raise CommandError(f"Budget {PROFILE_QUERY_BUDGET} query terlampaui untuk: {failures}")
+
+    def _run(self, sizes):
+        category = Category.objects.create(name="bench_profile_category")
+        teacher = User.objects.create(username="bench_profile_teacher")
+        student = User.objects.create(username="bench_profile_student")
+        Profile.objects.create(user=teacher, role="teacher")
+        Profile.objects.create(user=student, role="student")
+
+        failures = []
+        self.stdout.write(f"{'courses':>8} {'role':>8} {'queries':>8}")
+        created = 0
+        for size in sizes:
+            for i in range(created, size):
+                course = Course.objects.create(
+                    name=f"bench profile {i}", description="-", price=0,
+                    teacher=teacher, category=category,
+                )
+                CourseMember.objects.create(course_id=course, user_id=student)
+            created = size
+
+            for user in (student, teacher):
+                with CaptureQueriesContext(connection) as queries:
+                    instance = UserProfileSerializer.setup_eager_loading(User.objects.all()).get(pk=user.pk)
+                    UserProfileSerializer(instance).data
+                role = user.profile.role
+                self.stdout.write(f"{size:>8} {role:>8} {len(queries):>8}")
+                if len(queries) > PROFILE_QUERY_BUDGET:
+                    failures.append((size, role, len(queries)))
+        return failures
@@ -0,0 +1,102 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from lms_core.fast_serializers import FastCourseContentSerializer, FastCourseSerializer
+from lms_core.models import Category, Course, CourseContent
+from lms_core.serializers import CourseContentSerializer, CourseSerializer
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Bandingkan rows/detik serializer DRF vs jalur cepat values() dan pastikan JSON-nya identik."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=2000, help="Jumlah course dan konten yang dibuat.")
+        parser.add_argument("--repeat", type=int, default=5, help="Jumlah pengulangan; diambil waktu terbaik.")
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                mismatches = self._run(options["rows"], max(1, options["repeat"]))
+                raise _Rollback
+        except _Rollback:
+            pass
+        if mismatches:
+            raise CommandError(f"Output jalur cepat berbeda dari DRF untuk: {mismatches}")
+
+    def _run(self, rows, repeat):
+        self._seed(rows)
+        cases = [
+            ("courses", lambda: CourseSerializer(
+                list(Course.objects.select_related('category').order_by('created_at', 'id')), many=True).data,
+             lambda: FastCourseSerializer(
+                list(FastCourseSerializer.values(Course.objects.order_by('created_at', 'id'))), many=True).data),
+            ("contents", lambda: CourseContentSerializer(
+                list(CourseContent.objects.select_related('course_id__category').order_by('created_at', 'id')),
+                many=True).data,
+             lambda: FastCourseContentSerializer(
+                list(FastCourseContentSerializer.values(CourseContent.objects.order_by('created_at', 'id'))),
+                many=True).data),
+        ]
+
+        mismatches = []
+        renderer = JSONRenderer()
+        self.stdout.write(f"{'endpoint':>10} {'rows':>6} {'drf rows/s':>12} {'fast rows/s':>12} {'speedup':>8}")
+        for name, drf, fast in cases:
+            # Waktu diukur termasuk query dan render JSON, seperti di view
+            drf_seconds, drf_body = self._best(lambda: renderer.render(drf()), repeat)
+            fast_seconds, fast_body = self._best(lambda: renderer.render(fast()), repeat)
+            if drf_body != fast_body:
+                mismatches.append(name)
+            self.stdout.write(
+                f"{name:>10} {rows:>6} {rows / drf_seconds:>12.0f} {rows / fast_seconds:>12.0f} "
+                f"{drf_seconds / fast_seconds:>7.1f}x"
+            )
+        return mismatches
+
+    @staticmethod
+    def _best(func, repeat):
+        best, result = None, None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    @staticmethod
+    def _seed(rows):
+        teacher = User.objects.create(username="bench_serializers_teacher")
+        categories = [Category.objects.create(name=f"bench_serializers_category_{i}") for i in range(5)]
+        # Variasi supaya semua cabang ikut dibandingkan: tanpa kategori, tanpa gambar, dengan varian
+        courses = Course.objects.bulk_create([
+            Course(
+                name=f"bench serializer {i}", description="Deskripsi kursus é ✓", price=i * 1000,
+                teacher=teacher, category=categories[i % 5] if i % 7 else None,
+                image=f"course/bench_{i}.png" if i % 3 else None,
+                image_variants={
+                    'source': f"course/bench_{i}.png",
+                    'thumb': f"course/variants/bench_{i}.thumb.webp",
+                    'card': f"course/variants/bench_{i}.card.webp",
+                } if i % 3 == 1 else None,
+            )
+            for i in range(rows)
+        ])
+        CourseContent.objects.bulk_create([
+            CourseContent(
+                name=f"konten {i}", course_id=courses[i % len(courses)],
+                video_url=f"https://example.com/video/{i}" if i % 2 else None,
+                file_attachment=f"materi/bench_{i}.pdf" if i % 4 == 0 else None,
+            )
+            for i in range(rows)
+        ])
+        if rows > 1:
+            first = CourseContent.objects.order_by('id').first()
+            CourseContent.objects.filter(id__gt=first.id, id__lte=first.id + rows // 2).update(parent_id=first)
@@ -0,0 +1,199 @@
+import re
+from datetime import timedelta
+from urllib.parse import urlsplit
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+
+from lms_core.models import (
+    Bookmark, Category, Comment, Course, CourseAnnouncement, CourseContent, CourseMember, Profile,
+)
+from lms_core.serializers import RoleTokenObtainPairSerializer
+
+PG_SEQ_SCAN = re.compile(r'Seq Scan on (\w+)')
+PG_INDEX_SCAN = re.compile(r'Index (?:Only )?Scan(?: Backward)? using \w+ on (\w+)')
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Jalankan EXPLAIN untuk setiap query endpoint/lookup utama di atas data seed "
+        "dan gagal jika ada lookup yang jatuh ke sequential scan (atau index scan tanpa Index Cond)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--courses", type=int, default=60, help="Jumlah kursus seed.")
+        parser.add_argument("--contents", type=int, default=5, help="Jumlah konten per kursus.")
+
+    def handle(self, *args, **options):
+        if connection.vendor not in ("postgresql", "sqlite"):
+            raise CommandError(f"Backend {connection.vendor} belum didukung.")
+        self.verbosity = options["verbosity"]
+        # Cache dimatikan agar setiap endpoint benar-benar menjalankan query-nya
+        # (dan data seed tidak pernah masuk ke cache bersama)
+        dummy_cache = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+        try:
+            with override_settings(ALLOWED_HOSTS=["testserver"], CACHES=dummy_cache), transaction.atomic():
+                if connection.vendor == "postgresql":
+                    # Tabel seed kecil: tanpa ini planner memilih seq scan walau index tersedia
+                    with connection.cursor() as cursor:
+                        cursor.execute("SET LOCAL enable_seqscan = off")
+                seed = self._seed(options["courses"], options["contents"])
+                failures = self._run(seed)
+                raise _Rollback
+        except _Rollback:
+            pass
+        if failures:
+            raise CommandError(f"Sequential scan pada hot path: {failures}")
+
+    def _seed(self, n_courses, n_contents):
+        teacher = User.objects.create(username="plan_check_teacher")
+        student = User.objects.create(username="plan_check_student")
+        Profile.objects.create(user=teacher, role="teacher")
+        Profile.objects.create(user=student, role="student")
+        category = Category.objects.create(name="plan_check_category")
+
+        courses = Course.objects.bulk_create(
+            Course(name=f"plan check {i}", description="-", price=0, teacher=teacher, category=category)
+            for i in range(n_courses)
+        )
+        if courses[0].pk is None:
+            courses = list(Course.objects.filter(teacher=teacher).order_by("id"))
+        members = CourseMember.objects.bulk_create(
+            CourseMember(course_id=course, user_id=student) for course in courses
+        )
+        if members[0].pk is None:
+            members = list(CourseMember.objects.filter(user_id=student).order_by("id"))
+        contents = []
+        for course in courses:
+            for i in range(n_contents):
+                # save() dipakai agar materialized path terisi
+                content = CourseContent(name=f"konten {i}", description="-", course_id=course)
+                content.save()
+                contents.append(content)
+        Bookmark.objects.bulk_create(Bookmark(student=student, content=content) for content in contents)
+        Comment.objects.bulk_create(
+            Comment(content_id=content, member_id=member, comment="-")
+            for member in members
+            for content in contents
+            if content.course_id_id == member.course_id_id
+        )
+        now = timezone.now()
+        CourseAnnouncement.objects.bulk_create(
+            CourseAnnouncement(course=course, title=f"pengumuman {i}", content="-",
+                               date=now + timedelta(days=i), teacher=teacher)
+            for course in courses
+            for i in range(3)
+        )
+        return {
+            "teacher": teacher, "student": student, "course": courses[len(courses) // 2],
+            "content": contents[len(contents) // 2],
+        }
+
+    def _checks(self, seed):
+        """(nama, fungsi) — fungsi menjalankan endpoint atau lookup yang diperiksa."""
+        student = _client(seed["student"])
+        teacher = _client(seed["teacher"])
+        course, content = seed["course"], seed["content"]
+
+        def get_pages(client, path):
+            def run():
+                response = client.get(path)
+                next_link = response.json().get("next")
+                if next_link:
+                    parts = urlsplit(next_link)
+                    client.get(f"{parts.path}?{parts.query}")
+            return run
+
+        return [
+            ("course-list", get_pages(student, "/api/v1/courses/")),
+            ("show-contents", get_pages(student, "/api/v1/contents/")),
+            ("show-bookmarks", get_pages(student, "/api/v1/bookmarks/")),
+            ("get-profile", lambda: student.get("/api/v1/profile/")),
+            ("course-outline", lambda: teacher.get(f"/api/v1/courses/{course.pk}/outline/")),
+            ("show-course-announcement", lambda: student.get(f"/api/v1/courses/{course.pk}/announcements/")),
+            ("my-announcements", get_pages(student, "/api/v1/announcements/")),
+            # Lookup di view tulis (Edit/DeleteCourseView, BatchEnrollView) dan komentar per konten
+            ("course-by-name", lambda: Course.objects.filter(name=course.name).first()),
+            ("membership", lambda: CourseMember.objects.filter(course_id=course, user_id=seed["student"]).exists()),
+            ("announcements-by-date", lambda: list(
+                CourseAnnouncement.objects.filter(course=course).order_by("date"))),
+            ("comments-by-content", lambda: list(Comment.objects.filter(content_id=content).order_by("created_at"))),
+        ]
+
+    def _run(self, seed):
+        failures = []
+        for name, check in self._checks(seed):
+            with CaptureQueriesContext(connection) as captured:
+                check()
+            selects = [q["sql"] for q in captured.captured_queries if q["sql"].lstrip().upper().startswith("SELECT")]
+            scanned = set()
+            for sql in selects:
+                plan = _explain(sql)
+                tables = _scanned_tables(plan)
+                # Baca penuh tanpa WHERE/LIMIT (daftar kategori, agregat validator ETag)
+                # memang membaca seluruh tabel; yang dicek adalah lookup dan halaman
+                bounded = re.search(r"\b(WHERE|LIMIT)\b", sql, re.IGNORECASE)
+                if tables and bounded:
+                    scanned |= tables
+                if self.verbosity >= 2 or (tables and bounded):
+                    self.stdout.write(f"  {sql}\n    " + "\n    ".join(plan))
+            status = "SCAN " + ", ".join(sorted(scanned)) if scanned else "ok"
+            self.stdout.write(f"{name:<26} {len(selects):>3} queries  {status}")
+            if scanned:
+                failures.append((name, sorted(scanned)))
+        return failures
+
+
+def _client(user):
+    token = RoleTokenObtainPairSerializer.get_token(user).access_token
+    return Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+
+def _explain(sql):
+    with connection.cursor() as cursor:
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}")
+        rows = cursor.fetchall()
+    if connection.vendor == "sqlite":
+        return [row[-1] for row in rows]
+    return [row[0] for row in rows]
+
+
+def _scanned_tables(plan):
+    if connection.vendor == "sqlite":
+        # "SCAN tabel" tanpa "USING ... INDEX" = full table scan
+        return {line.split()[1] for line in plan if line.startswith("SCAN ") and "USING" not in line}
+    return _pg_scanned_tables(plan)
+
+
+def _pg_scanned_tables(plan):
+    """
+    Tables a PostgreSQL plan reads in full: ``Seq Scan`` nodes, and index scans
+    that have a ``Filter:`` but no ``Index Cond``. With ``enable_seqscan = off``
+    the planner falls back to walking e.g. the primary key and filtering every
+    row, which is still a full scan.
+    """
+    tables = set()
+    node = None  # [tabel, ada Index Cond, ada Filter] dari index scan yang sedang dibaca
+    for line in plan:
+        # Setiap node diawali baris dengan "(cost=", baris di bawahnya adalah atributnya
+        if "(cost=" in line:
+            if node and node[2] and not node[1]:
+                tables.add(node[0])
+            tables |= {match.group(1) for match in PG_SEQ_SCAN.finditer(line)}
+            match = PG_INDEX_SCAN.search(line)
+            node = [match.group(1), False, False] if match else None
+        elif node:
+            attribute = line.strip()
+            node[1] = node[1] or attribute.startswith("Index Cond:")
+            node[2] = node[2] or attribute.startswith("Filter:")
+    if node and node[2] and not node[1]:
+        tables.add(node[0])
+    return tables
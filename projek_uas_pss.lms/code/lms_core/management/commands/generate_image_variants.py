@@ -0,0 +1,31 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from lms_core.thumbnails import TARGETS, generate_variants, needs_variants
+
+
+class Command(BaseCommand):
+    help = "Buat varian gambar (thumbnail WebP/JPEG) untuk Course.image dan Profile.profile_picture yang sudah ada."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Buat ulang walau varian sudah ada.")
+
+    def handle(self, *args, **options):
+        for model, (field_name, variants_field, _) in TARGETS.items():
+            started = time.perf_counter()
+            done = failed = 0
+            queryset = model.objects.exclude(**{field_name: ""}).exclude(**{f"{field_name}__isnull": True})
+            for instance in queryset.only("pk", field_name, variants_field).iterator():
+                if not options["force"] and not needs_variants(instance):
+                    continue
+                try:
+                    generate_variants(model, instance.pk)
+                    done += 1
+                except (OSError, ValueError) as e:
+                    # File hilang dari media/ atau bukan gambar yang bisa dibaca Pillow
+                    failed += 1
+                    self.stderr.write(f"{model.__name__} {instance.pk}: {e}")
+            self.stdout.write(
+                f"{model.__name__:<8} {done:>6} generated  {failed:>4} failed  {time.perf_counter() - started:>7.2f}s"
+            )
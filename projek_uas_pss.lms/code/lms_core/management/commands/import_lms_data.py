@@ -0,0 +1,192 @@
+import csv
+import io
+import json
+import os
+import time
+from itertools import islice
+from pathlib import Path
+from random import randint
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import CharField, Value
+from django.db.models.functions import Cast, Concat, LPad
+
+from lms_core.hashing import hash_passwords
+from lms_core.cache import invalidate
+from lms_core.models import CONTENT_PATH_WIDTH, Comment, Course, CourseContent, CourseMember
+
+
+class Command(BaseCommand):
+    help = "Import data awal LMS (user, course, member, konten, komentar) dari csv_data secara batch."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--data-dir", default=str(Path(settings.BASE_DIR) / "csv_data"),
+            help="Folder berisi user-data.csv, course-data.csv, member-data.csv, contents.json, comments.json.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000, help="Jumlah baris per batch insert.")
+        parser.add_argument(
+            "--no-copy", action="store_true",
+            help="Jangan pakai COPY di PostgreSQL, selalu pakai bulk_create.",
+        )
+
+    def handle(self, *args, **options):
+        self.data_dir = Path(options["data_dir"])
+        self.batch_size = options["batch_size"]
+        self.use_copy = connection.vendor == "postgresql" and not options["no_copy"]
+
+        started = time.perf_counter()
+        self._stage("users", User, self.user_rows(), prepare=self._hash_user_passwords)
+        self._stage("courses", Course, self.course_rows())
+        self._stage("members", CourseMember, self.member_rows())
+        self._stage("contents", CourseContent, self.content_rows())
+        self._fill_content_paths()
+        self._stage("comments", Comment, self.comment_rows())
+
+        # bulk insert tidak memicu signal, jadi cache katalog di-invalidasi manual
+        invalidate("courses", "categories")
+        self.stdout.write("--- %.2f seconds ---" % (time.perf_counter() - started))
+
+    # Sumber baris per stage. Semua pengecekan "sudah ada" dan resolusi FK
+    # memakai set/dict yang dimuat sekali di awal stage, bukan query per baris.
+
+    def user_rows(self):
+        existing = set(User.objects.values_list("username", flat=True))
+        with open(self.data_dir / "user-data.csv") as csvfile:
+            for row in csv.DictReader(csvfile):
+                if row["username"] in existing:
+                    self.skipped += 1
+                    continue
+                existing.add(row["username"])
+                # Password masih mentah di sini, di-hash paralel per batch oleh _hash_user_passwords
+                yield User(username=row["username"],
+                           password=row["password"],
+                           email=row["email"],
+                           first_name=row["firstname"],
+                           last_name=row["lastname"])
+
+    def course_rows(self):
+        existing = set(Course.objects.values_list("id", flat=True))
+        user_ids = set(User.objects.values_list("id", flat=True))
+        with open(self.data_dir / "course-data.csv") as csvfile:
+            for num, row in enumerate(csv.DictReader(csvfile)):
+                if num + 1 in existing or int(row["teacher"]) not in user_ids:
+                    self.skipped += 1
+                    continue
+                yield Course(name=row["name"], price=row["price"],
+                             description=row["description"],
+                             teacher_id=int(row["teacher"]))
+
+    def member_rows(self):
+        existing = set(CourseMember.objects.values_list("id", flat=True))
+        pairs = set(CourseMember.objects.values_list("course_id", "user_id"))
+        course_ids = set(Course.objects.values_list("id", flat=True))
+        user_ids = set(User.objects.values_list("id", flat=True))
+        with open(self.data_dir / "member-data.csv") as csvfile:
+            for num, row in enumerate(csv.DictReader(csvfile)):
+                pair = (int(row["course_id"]), int(row["user_id"]))
+                if (num + 1 in existing or pair in pairs
+                        or pair[0] not in course_ids or pair[1] not in user_ids):
+                    self.skipped += 1
+                    continue
+                pairs.add(pair)
+                yield CourseMember(course_id_id=pair[0], user_id_id=pair[1], roles=row["roles"])
+
+    def content_rows(self):
+        existing = set(CourseContent.objects.values_list("id", flat=True))
+        course_ids = set(Course.objects.values_list("id", flat=True))
+        with open(self.data_dir / "contents.json") as jsonfile:
+            for num, row in enumerate(json.load(jsonfile)):
+                if num + 1 in existing or int(row["course_id"]) not in course_ids:
+                    self.skipped += 1
+                    continue
+                yield CourseContent(course_id_id=int(row["course_id"]),
+                                    video_url=row["video_url"], name=row["name"],
+                                    description=row["description"])
+
+    def comment_rows(self):
+        existing = set(Comment.objects.values_list("id", flat=True))
+        content_course = dict(CourseContent.objects.values_list("id", "course_id"))
+        members = {
+            (course_id, user_id): member_id
+            for member_id, course_id, user_id in CourseMember.objects.values_list("id", "course_id", "user_id")
+        }
+        with open(self.data_dir / "comments.json") as jsonfile:
+            for num, row in enumerate(json.load(jsonfile)):
+                if int(row["user_id"]) > 50:
+                    row["user_id"] = randint(5, 40)
+                # Komentar ditulis oleh member kursus pemilik konten tersebut
+                member_id = members.get((content_course.get(int(row["content_id"])), int(row["user_id"])))
+                if num + 1 in existing or member_id is None:
+                    self.skipped += 1
+                    continue
+                yield Comment(content_id_id=int(row["content_id"]), member_id_id=member_id,
+                              comment=row["comment"])
+
+    # Penulisan batch
+
+    def _hash_user_passwords(self, users):
+        # Proses import terpisah dari web worker: boleh memakai semua core
+        for user, hashed in zip(users, hash_passwords((user.password for user in users), workers=os.cpu_count())):
+            user.password = hashed
+
+    def _stage(self, name, model, rows, prepare=None):
+        self.skipped = 0
+        written = 0
+        started = time.perf_counter()
+        with transaction.atomic():
+            while True:
+                batch = list(islice(rows, self.batch_size))
+                if not batch:
+                    break
+                if prepare:
+                    prepare(batch)
+                if self.use_copy:
+                    self._copy(model, batch)
+                else:
+                    model.objects.bulk_create(batch, batch_size=self.batch_size)
+                written += len(batch)
+        elapsed = time.perf_counter() - started
+        rate = written / elapsed if elapsed else 0
+        self.stdout.write(
+            f"{name:<9} {written:>8} rows  {self.skipped:>6} skipped  {elapsed:>8.2f}s  {rate:>10.0f} rows/s"
+        )
+
+    def _copy(self, model, objs):
+        """Fast path PostgreSQL: kirim satu batch lewat COPY ... FROM STDIN (format text), psycopg 2 atau 3."""
+        fields = [f for f in model._meta.concrete_fields if not f.primary_key]
+        buffer = io.StringIO()
+        for obj in objs:
+            values = [f.get_db_prep_save(f.pre_save(obj, add=True), connection) for f in fields]
+            buffer.write("\t".join(_copy_value(value) for value in values) + "\n")
+        buffer.seek(0)
+
+        columns = ", ".join(connection.ops.quote_name(f.column) for f in fields)
+        sql = f"COPY {connection.ops.quote_name(model._meta.db_table)} ({columns}) FROM STDIN"
+        with connection.cursor() as cursor:
+            raw = cursor.cursor
+            if hasattr(raw, "copy_expert"):  # psycopg2
+                raw.copy_expert(sql, buffer)
+            else:  # psycopg 3
+                with raw.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+
+    def _fill_content_paths(self):
+        # Konten hasil import belum punya materialized path (bulk insert melewati save()).
+        # Semuanya konten root, jadi path = id sendiri yang di-pad.
+        CourseContent.objects.filter(path="").update(
+            path=Concat(LPad(Cast("id", CharField()), CONTENT_PATH_WIDTH, Value("0")), Value("/")),
+            depth=0,
+        )
+
+
+def _copy_value(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
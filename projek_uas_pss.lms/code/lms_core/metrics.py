@@ -0,0 +1,75 @@
+"""
+Prometheus metrics for the LMS API, served at ``/metrics``.
+
+With several worker processes (gunicorn/uvicorn workers) set the
+``PROMETHEUS_MULTIPROC_DIR`` environment variable to an empty, writable
+directory before the workers start: every process then writes its samples
+there and a scrape of any worker returns the aggregate of all of them. The
+directory must be wiped on each deploy/restart.
+"""
+import os
+
+from django.http import HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess,
+)
+
+from lms_core.instrumentation import QUERY_COUNT_BUCKETS
+
+DURATION_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+REQUESTS = Counter(
+    'lms_http_requests_total', 'HTTP requests handled.', ['route', 'method', 'status'],
+)
+REQUEST_DURATION = Histogram(
+    'lms_http_request_duration_seconds', 'Total request latency.', ['route', 'status'],
+    buckets=DURATION_BUCKETS_SECONDS,
+)
+DB_DURATION = Histogram(
+    'lms_db_duration_seconds', 'Time spent in SQL per request.', ['route', 'status'],
+    buckets=DURATION_BUCKETS_SECONDS,
+)
+SERIALIZE_DURATION = Histogram(
+    'lms_serialize_duration_seconds', 'Serialization and rendering time per request.', ['route', 'status'],
+    buckets=DURATION_BUCKETS_SECONDS,
+)
+DB_QUERIES = Histogram(
+    'lms_db_queries_per_request', 'SQL queries executed per request.', ['route', 'status'],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    'lms_cache_requests_total', 'Response cache lookups.', ['namespace', 'result'],
+)
+JWT_CACHE_REQUESTS = Counter(
+    'lms_jwt_cache_requests_total', 'Verified-token cache lookups.', ['result'],
+)
+DB_POOL = Gauge(
+    'lms_db_pool', 'psycopg connection pool statistics (pool_size, pool_available, requests_waiting, '
+    'requests_num, requests_wait_ms, ...), summed over live worker processes.', ['alias', 'stat'],
+    multiprocess_mode='livesum',
+)
+
+
+def observe_request(route, method, status, metrics, total_seconds):
+    status = str(status)
+    REQUESTS.labels(route, method, status).inc()
+    REQUEST_DURATION.labels(route, status).observe(total_seconds)
+    DB_DURATION.labels(route, status).observe(metrics.db_seconds)
+    SERIALIZE_DURATION.labels(route, status).observe(metrics.serialize_seconds)
+    DB_QUERIES.labels(route, status).observe(metrics.queries)
+
+
+def observe_pools(pool_stats):
+    for alias, stats in pool_stats.items():
+        for stat, value in stats.items():
+            DB_POOL.labels(alias, stat).set(value)
+
+
+def metrics_view(request):
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        # Gabungkan sampel dari semua proses worker
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return HttpResponse(generate_latest(registry), content_type=CONTENT_TYPE_LATEST)
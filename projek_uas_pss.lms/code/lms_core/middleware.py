@@ -0,0 +1,173 @@
+import threading
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.contrib.auth import SESSION_KEY
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from rest_framework.exceptions import AuthenticationFailed
+
+from lms_core import instrumentation, metrics as prometheus, routers
+from lms_core.authentication import StatelessJWTAuthentication
+from lms_core.profiling import StackSampler, save_profile
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+class RequestMetricsMiddleware:
+    """
+    Measure every request: number of SQL queries and DB time (through
+    ``execute_wrapper`` on each database connection, so ``DEBUG`` is not
+    needed), serialization time and total time.
+
+    Serialization time is the rendering of every ``TemplateResponse`` (all DRF
+    ``Response`` objects), timed by a post-render callback, plus the blocks a
+    view wraps in :func:`~lms_core.instrumentation.timed_serialization` (for
+    ``serializer.data`` evaluated inside the view).
+
+    The numbers are sent back as a ``Server-Timing`` header and aggregated
+    per URL name (``course-list``, ``get-profile``, ...) in
+    :mod:`lms_core.instrumentation`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.server_timing = getattr(settings, 'LMS_SERVER_TIMING', True)
+
+    def __call__(self, request):
+        metrics = instrumentation.RequestMetrics()
+        token = instrumentation.activate(metrics)
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics.db_wrapper))
+                response = self.get_response(request)
+        finally:
+            instrumentation.deactivate(token)
+        total = time.perf_counter() - started
+
+        match = getattr(request, 'resolver_match', None)
+        route = (match.url_name or match.view_name) if match else 'unmatched'
+        instrumentation.record_request(route, metrics, total)
+        prometheus.observe_request(route, request.method, response.status_code, metrics, total)
+        # Hanya alias yang dipakai request ini (koneksinya masih dipegang sampai request_finished)
+        prometheus.observe_pools(instrumentation.database_pool_stats())
+
+        if self.server_timing:
+            response['Server-Timing'] = ', '.join([
+                f'db;dur={metrics.db_seconds * 1000:.2f};desc="{metrics.queries} queries"',
+                f'serialize;dur={metrics.serialize_seconds * 1000:.2f}',
+                f'total;dur={total * 1000:.2f}',
+            ])
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF Response di-render setelah hook ini; waktu render dihitung sebagai serialisasi
+        metrics = instrumentation.current_metrics()
+        if metrics is not None:
+            started = time.perf_counter()
+
+            def rendered(response):
+                metrics.serialize_seconds += time.perf_counter() - started
+
+            response.add_post_render_callback(rendered)
+        return response
+
+
+class ProfilerMiddleware:
+    """
+    Profile a single request on demand: a staff user (``is_staff`` claim of
+    the bearer token, checked without a query) sends ``X-Profile: 1``. The
+    request runs under a sampling profiler; a collapsed-stack file (for
+    flamegraph.pl or speedscope) and a top-N cumulative table are written to
+    ``LMS_PROFILER_DIR`` and the profile id is returned in ``X-Profile-Id``.
+
+    Without ``LMS_PROFILER_ENABLED`` the middleware removes itself from the
+    chain at startup, so normal requests pay nothing.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'LMS_PROFILER_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.authenticator = StatelessJWTAuthentication()
+        self.directory = getattr(settings, 'LMS_PROFILER_DIR', settings.BASE_DIR / 'profiles')
+        self.interval = getattr(settings, 'LMS_PROFILER_INTERVAL', 0.001)
+        self.top = getattr(settings, 'LMS_PROFILER_TOP', 40)
+
+    def __call__(self, request):
+        if request.headers.get('X-Profile') != '1' or not self._is_staff(request):
+            return self.get_response(request)
+
+        with StackSampler(threading.get_ident(), self.interval) as sampler:
+            response = self.get_response(request)
+        response['X-Profile-Id'] = save_profile(sampler, self.directory, request, self.top)
+        return response
+
+    def _is_staff(self, request):
+        try:
+            result = self.authenticator.authenticate(request)
+        except AuthenticationFailed:
+            return False  # Token tidak valid: request tetap jalan, hanya tanpa profiling
+        return result is not None and result[0].is_staff
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serve reads of safe-method requests (GET/HEAD/OPTIONS) from one of the
+    ``LMS_REPLICA_DATABASES``. After a successful write (POST/PUT/PATCH/DELETE)
+    the user is pinned to the primary for ``LMS_REPLICA_PIN_SECONDS`` so they
+    read their own writes despite replication lag; the same applies when a
+    safe-method request writes (see ``ReplicaRouter.db_for_write``).
+
+    The user is identified before the view runs: from the bearer token (through
+    the verified-token cache, no query) or the session. Without replicas the
+    middleware removes itself at startup.
+    """
+
+    def __init__(self, get_response):
+        if not routers.replica_aliases():
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.pin_seconds = getattr(settings, 'LMS_REPLICA_PIN_SECONDS', 5)
+        self.authenticator = StatelessJWTAuthentication()
+
+    def __call__(self, request):
+        user_id = self._user_id(request)
+
+        if request.method not in SAFE_METHODS:
+            response = self.get_response(request)
+            if user_id is not None and response.status_code < 400:
+                cache.set(_pin_key(user_id), 1, self.pin_seconds)
+            return response
+
+        if user_id is not None and cache.get(_pin_key(user_id)):
+            return self.get_response(request)
+
+        token = routers.use_replica(routers.choose_replica())
+        try:
+            response = self.get_response(request)
+            # ReplicaRouter sudah kembali ke primary jika request ini menulis
+            wrote = routers.read_alias() is None
+        finally:
+            routers.use_primary(token)
+        if wrote and user_id is not None and response.status_code < 400:
+            cache.set(_pin_key(user_id), 1, self.pin_seconds)
+        return response
+
+    def _user_id(self, request):
+        try:
+            result = self.authenticator.authenticate(request)
+        except AuthenticationFailed:
+            result = None  # Token tidak valid akan ditolak oleh view, routing cukup anggap anonim
+        if result is not None:
+            return result[0].id
+        session = getattr(request, 'session', None)
+        return session.get(SESSION_KEY) if session is not None else None
+
+
+def _pin_key(user_id):
+    return f'lms:pin-primary:{user_id}'
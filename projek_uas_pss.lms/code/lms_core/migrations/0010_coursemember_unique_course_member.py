@@ -0,0 +1,42 @@
+# Generated by Django 5.1.6 on 2026-10-18 06:30
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def merge_duplicate_members(apps, schema_editor):
+    # Gabungkan baris CourseMember ganda (course, user) ke baris dengan id terkecil
+    # supaya unique constraint bisa dibuat. Komentar dipindahkan ke baris yang disimpan.
+    CourseMember = apps.get_model('lms_core', 'CourseMember')
+    Comment = apps.get_model('lms_core', 'Comment')
+
+    keep = {}
+    duplicates = {}
+    for member_id, course_id, user_id in (
+        CourseMember.objects.order_by('id').values_list('id', 'course_id_id', 'user_id_id')
+    ):
+        key = (course_id, user_id)
+        if key in keep:
+            duplicates[member_id] = keep[key]
+        else:
+            keep[key] = member_id
+
+    for duplicate_id, kept_id in duplicates.items():
+        Comment.objects.filter(member_id_id=duplicate_id).update(member_id_id=kept_id)
+    CourseMember.objects.filter(id__in=list(duplicates)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0009_bookmark'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_members, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='coursemember',
+            constraint=models.UniqueConstraint(fields=('course_id', 'user_id'), name='unique_course_member'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 06:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0010_coursemember_unique_course_member'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['created_at', 'id'], name='course_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='coursecontent',
+            index=models.Index(fields=['created_at', 'id'], name='content_created_id_idx'),
+        ),
+    ]
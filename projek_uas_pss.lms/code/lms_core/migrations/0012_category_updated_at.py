@@ -0,0 +1,20 @@
+# Generated by Django 5.1.6 on 2026-10-18 06:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0011_course_content_keyset_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 5.1.6 on 2026-10-18 06:45
+
+from django.db import migrations, models
+
+
+def build_paths(apps, schema_editor):
+    CourseContent = apps.get_model('lms_core', 'CourseContent')
+    parents = dict(CourseContent.objects.values_list('id', 'parent_id_id'))
+    paths = {}
+
+    def path_of(pk):
+        # Iteratif dari node ke root, lalu dibalik
+        chain = []
+        current = pk
+        while current is not None and current not in paths:
+            chain.append(current)
+            current = parents.get(current)
+        prefix = paths.get(current, '')
+        for node in reversed(chain):
+            prefix += f"{node:010d}/"
+            paths[node] = prefix
+        return paths[pk]
+
+    batch = []
+    for pk in parents:
+        path = path_of(pk)
+        batch.append(CourseContent(pk=pk, path=path, depth=path.count('/') - 1))
+    CourseContent.objects.bulk_update(batch, ['path', 'depth'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0012_category_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coursecontent',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='kedalaman'),
+        ),
+        migrations.AddField(
+            model_name='coursecontent',
+            name='path',
+            field=models.CharField(default='', editable=False, max_length=255, verbose_name='path hirarki'),
+        ),
+        migrations.RunPython(build_paths, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='coursecontent',
+            index=models.Index(fields=['course_id', 'path'], name='content_course_path_idx'),
+        ),
+    ]
@@ -0,0 +1,114 @@
+# Generated by Django 5.1.6 on 2026-10-18 06:50
+
+from django.db import migrations
+
+# PostgreSQL: kolom tsvector generated (selalu ikut ter-update oleh database) + index GIN
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE lms_core_course ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX course_search_vector_idx ON lms_core_course USING GIN (search_vector)",
+    """
+    ALTER TABLE lms_core_coursecontent ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX content_search_vector_idx ON lms_core_coursecontent USING GIN (search_vector)",
+]
+
+POSTGRES_REVERSE = [
+    "ALTER TABLE lms_core_course DROP COLUMN search_vector",
+    "ALTER TABLE lms_core_coursecontent DROP COLUMN search_vector",
+]
+
+# SQLite: satu tabel FTS5 untuk course dan konten, dijaga oleh trigger.
+# rowid = id * 2 untuk course dan id * 2 + 1 untuk konten, jadi update/delete
+# dari trigger selalu lewat rowid (tanpa scan tabel FTS).
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE lms_core_search USING fts5(
+        name, description, kind UNINDEXED, object_id UNINDEXED, course_id UNINDEXED,
+        tokenize = 'unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER lms_core_course_search_ai AFTER INSERT ON lms_core_course BEGIN
+        INSERT INTO lms_core_search (rowid, name, description, kind, object_id, course_id)
+        VALUES (new.id * 2, new.name, new.description, 'course', new.id, new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER lms_core_course_search_au AFTER UPDATE OF name, description ON lms_core_course BEGIN
+        DELETE FROM lms_core_search WHERE rowid = old.id * 2;
+        INSERT INTO lms_core_search (rowid, name, description, kind, object_id, course_id)
+        VALUES (new.id * 2, new.name, new.description, 'course', new.id, new.id);
+    END
+    """,
+    """
+    CREATE TRIGGER lms_core_course_search_ad AFTER DELETE ON lms_core_course BEGIN
+        DELETE FROM lms_core_search WHERE rowid = old.id * 2;
+    END
+    """,
+    """
+    CREATE TRIGGER lms_core_content_search_ai AFTER INSERT ON lms_core_coursecontent BEGIN
+        INSERT INTO lms_core_search (rowid, name, description, kind, object_id, course_id)
+        VALUES (new.id * 2 + 1, new.name, new.description, 'content', new.id, new.course_id_id);
+    END
+    """,
+    """
+    CREATE TRIGGER lms_core_content_search_au AFTER UPDATE OF name, description, course_id_id ON lms_core_coursecontent BEGIN
+        DELETE FROM lms_core_search WHERE rowid = old.id * 2 + 1;
+        INSERT INTO lms_core_search (rowid, name, description, kind, object_id, course_id)
+        VALUES (new.id * 2 + 1, new.name, new.description, 'content', new.id, new.course_id_id);
+    END
+    """,
+    """
+    CREATE TRIGGER lms_core_content_search_ad AFTER DELETE ON lms_core_coursecontent BEGIN
+        DELETE FROM lms_core_search WHERE rowid = old.id * 2 + 1;
+    END
+    """,
+    """
+    INSERT INTO lms_core_search (rowid, name, description, kind, object_id, course_id)
+    SELECT id * 2, name, description, 'course', id, id FROM lms_core_course
+    """,
+    """
+    INSERT INTO lms_core_search (rowid, name, description, kind, object_id, course_id)
+    SELECT id * 2 + 1, name, description, 'content', id, course_id_id FROM lms_core_coursecontent
+    """,
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS lms_core_course_search_ai",
+    "DROP TRIGGER IF EXISTS lms_core_course_search_au",
+    "DROP TRIGGER IF EXISTS lms_core_course_search_ad",
+    "DROP TRIGGER IF EXISTS lms_core_content_search_ai",
+    "DROP TRIGGER IF EXISTS lms_core_content_search_au",
+    "DROP TRIGGER IF EXISTS lms_core_content_search_ad",
+    "DROP TABLE IF EXISTS lms_core_search",
+]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        # Database lain (mis. MySQL) tidak punya index; pencarian jatuh ke fallback icontains
+        for statement in statements_by_vendor.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0013_coursecontent_path_depth'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run({'postgresql': POSTGRES_FORWARD, 'sqlite': SQLITE_FORWARD}),
+            _run({'postgresql': POSTGRES_REVERSE, 'sqlite': SQLITE_REVERSE}),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.6 on 2026-10-18 06:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0014_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='bookmark',
+            index=models.Index(fields=['student', 'created_at', 'id'], name='bookmark_student_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['content_id', 'created_at'], name='comment_content_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['name'], name='course_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='courseannouncement',
+            index=models.Index(fields=['course', 'date'], name='announcement_course_date_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 06:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0015_hot_lookup_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='image_variants',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='profile',
+            name='profile_picture_variants',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
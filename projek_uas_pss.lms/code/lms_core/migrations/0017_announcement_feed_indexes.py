@@ -0,0 +1,23 @@
+# Generated by Django 5.1.6 on 2026-10-18 06:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lms_core', '0016_image_variants'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='courseannouncement',
+            index=models.Index(fields=['course', 'created_at', 'id'], name='announcement_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='coursemember',
+            index=models.Index(fields=['user_id', 'course_id'], name='coursemember_user_course_idx'),
+        ),
+    ]
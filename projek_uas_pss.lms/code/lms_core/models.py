@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Substr
 from django.contrib.auth.models import User
 
 ROLE_CHOICES = [
@@ -12,12 +14,15 @@ class Profile(models.Model):
     phone_number = models.CharField(max_length=20, null=True, blank=True)
     description = models.TextField(null=True, blank=True)
     profile_picture = models.ImageField(upload_to="profile_pics/", null=True, blank=True)
+    # Diisi oleh lms_core.thumbnails: {"source": nama file asli, "<varian>": nama file varian}
+    profile_picture_variants = models.JSONField(null=True, blank=True, editable=False)
 
     def __str__(self):
         return self.user.username
 
 class Category(models.Model):
     name = models.CharField(max_length=255, unique=True)  # Nama kategori yang unik
+    updated_at = models.DateTimeField(auto_now=True)  # Dipakai untuk validator ETag
 
     def __str__(self):
         return self.name
@@ -28,11 +33,20 @@ class Course(models.Model):
     description = models.TextField("Deskripsi")
     price = models.IntegerField("Harga")
     image = models.ImageField("Gambar", upload_to="course", blank=True, null=True)
+    image_variants = models.JSONField(null=True, blank=True, editable=False)  # Lihat Profile.profile_picture_variants
     teacher = models.ForeignKey(User, verbose_name="Pengajar", on_delete=models.RESTRICT)
     created_at = models.DateTimeField("Dibuat pada", auto_now_add=True)
     updated_at = models.DateTimeField("Diperbarui pada", auto_now=True)
     category = models.ForeignKey(Category, related_name='courses', on_delete=models.SET_NULL, null=True, blank=True)  # Tambahkan kategori
 
+    class Meta:
+        indexes = [
+            # Kunci keyset pagination (created_at, id)
+            models.Index(fields=['created_at', 'id'], name='course_created_id_idx'),
+            # Edit/Delete course mencari berdasarkan nama
+            models.Index(fields=['name'], name='course_name_idx'),
+        ]
+
     def __str__(self):
         return self.name
 
@@ -48,10 +62,24 @@ class CourseMember(models.Model):
     class Meta:
         verbose_name = "Subscriber Matkul"
         verbose_name_plural = "Subscriber Matkul"
+        constraints = [
+            # Satu user hanya boleh terdaftar satu kali per kursus
+            models.UniqueConstraint(fields=['course_id', 'user_id'], name='unique_course_member'),
+        ]
+        indexes = [
+            # Kursus yang diikuti satu user (feed pengumuman), cukup dibaca dari index saja
+            models.Index(fields=['user_id', 'course_id'], name='coursemember_user_course_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"{self.id} {self.course_id} : {self.user_id}"
 
+# Lebar satu segmen materialized path, cukup untuk id sampai 10 digit
+CONTENT_PATH_WIDTH = 10
+
+def content_path_segment(pk):
+    return f"{pk:0{CONTENT_PATH_WIDTH}d}/"
+
 class CourseContent(models.Model):
     name = models.CharField("judul konten", max_length=200)
     description = models.TextField("deskripsi", default='-')
@@ -60,16 +88,68 @@ class CourseContent(models.Model):
     course_id = models.ForeignKey(Course, verbose_name="matkul", on_delete=models.RESTRICT)
     parent_id = models.ForeignKey("self", verbose_name="induk", 
                                 on_delete=models.RESTRICT, null=True, blank=True)
+    # Materialized path: id semua leluhur + id sendiri, mis. "0000000003/0000000011/"
+    path = models.CharField("path hirarki", max_length=255, default='', editable=False)
+    depth = models.PositiveSmallIntegerField("kedalaman", default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Konten Matkul"
         verbose_name_plural = "Konten Matkul"
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='content_created_id_idx'),
+            # Outline satu kursus = satu range scan berurutan di index ini
+            models.Index(fields=['course_id', 'path'], name='content_course_path_idx'),
+        ]
 
     def __str__(self) -> str:
         return f'{self.course_id} {self.name}'
 
+    def save(self, *args, **kwargs):
+        using = kwargs.get('using') or router.db_for_write(CourseContent, instance=self)
+        # Path lama, path baru dan geseran subtree harus konsisten: semuanya dalam satu transaksi
+        with transaction.atomic(using=using):
+            self._save_with_path(using, args, kwargs)
+
+    def _save_with_path(self, using, args, kwargs):
+        contents = CourseContent.objects.using(using).select_for_update()
+        # Path lama dibaca (dan dikunci) dari database, instance di memori bisa saja sudah basi
+        old_path, old_depth = '', 0
+        if self.pk is not None:
+            old_path, old_depth = contents.filter(pk=self.pk).values_list('path', 'depth').first() or ('', 0)
+        parent_path = ''
+        if self.parent_id_id:
+            parent_path = contents.filter(pk=self.parent_id_id).values_list('path', flat=True).first() or ''
+            if old_path and parent_path.startswith(old_path):
+                raise ValueError("Konten tidak boleh menjadi induk dari leluhurnya sendiri.")
+
+        # Setiap segmen lebarnya tetap, jadi panjang path terdalam bisa dicek sebelum menulis
+        longest = len(parent_path) + len(content_path_segment(0))
+        if old_path and old_path != parent_path + content_path_segment(self.pk):
+            # Pindah induk: kunci subtree yang akan digeser sekaligus ukur path terdalamnya
+            subtree = contents.filter(path__startswith=old_path).values_list('path', flat=True)
+            longest += max(map(len, subtree)) - len(old_path)
+        if longest > self._meta.get_field('path').max_length:
+            raise ValueError("Hirarki konten terlalu dalam.")
+
+        update_fields = kwargs.get('update_fields')
+        # Isi kolom path setelah super().save(): nilai di memori, kecuali path tidak ikut ditulis
+        stored_path = self.path if update_fields is None or 'path' in update_fields else old_path
+        super().save(*args, **kwargs)
+
+        new_path = parent_path + content_path_segment(self.pk)
+        new_depth = new_path.count('/') - 1
+        if new_path != stored_path:
+            CourseContent.objects.using(using).filter(pk=self.pk).update(path=new_path, depth=new_depth)
+        if old_path and new_path != old_path:
+            # Induk berubah: geser seluruh subtree dengan satu UPDATE
+            CourseContent.objects.using(using).filter(path__startswith=old_path).exclude(pk=self.pk).update(
+                path=Concat(Value(new_path), Substr('path', len(old_path) + 1)),
+                depth=F('depth') + (new_depth - old_depth),
+            )
+        self.path, self.depth = new_path, new_depth
+
 
 class Comment(models.Model):
     content_id = models.ForeignKey(CourseContent, verbose_name="konten", on_delete=models.CASCADE)
@@ -81,6 +161,10 @@ class Comment(models.Model):
     class Meta:
         verbose_name = "Komentar"
         verbose_name_plural = "Komentar"
+        indexes = [
+            # Komentar per konten, urut waktu
+            models.Index(fields=['content_id', 'created_at'], name='comment_content_created_idx'),
+        ]
 
     def __str__(self) -> str:
         return "Komen: "+self.member_id.user_id+"-"+self.comment
@@ -92,6 +176,10 @@ class Bookmark(models.Model):
 
     class Meta:
         unique_together = ['student', 'content']  # Pastikan student hanya bisa bookmark satu konten satu kali
+        indexes = [
+            # Daftar bookmark per student dengan keyset (created_at, id)
+            models.Index(fields=['student', 'created_at', 'id'], name='bookmark_student_created_idx'),
+        ]
 
     def __str__(self):
         return f"Bookmark by {self.student.username} for {self.content.name}"
@@ -106,6 +194,14 @@ class CourseAnnouncement(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)  # Otomatis diisi saat pengumuman dibuat
     updated_at = models.DateTimeField(auto_now=True)      # Otomatis diupdate saat pengumuman diubah
 
+    class Meta:
+        indexes = [
+            # Pengumuman per kursus, urut tanggal
+            models.Index(fields=['course', 'date'], name='announcement_course_date_idx'),
+            # Feed "pengumuman saya": terbaru per kursus, keyset (created_at, id) menurun
+            models.Index(fields=['course', 'created_at', 'id'], name='announcement_feed_idx'),
+        ]
+
     def __str__(self):
         return self.title
 
@@ -0,0 +1,153 @@
+import base64
+import datetime
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination that seeks on a composite key, ``(created_at, id)`` by default.
+
+    Every page is fetched with ``WHERE key > last_key ORDER BY key LIMIT n``, so
+    a deep page costs the same as the first one as long as the key is indexed.
+    Cursors are opaque base64 tokens; views may override the key with a
+    ``keyset_ordering`` attribute (prefix a field with ``-`` for descending).
+    """
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    ordering = ('created_at', 'id')
+    invalid_cursor_message = 'Invalid cursor'
+
+    def __init__(self):
+        self.page_size = getattr(settings, 'LMS_PAGE_SIZE', 20)
+        self.max_page_size = getattr(settings, 'LMS_MAX_PAGE_SIZE', 100)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.ordering = tuple(getattr(view, 'keyset_ordering', self.ordering))
+        self.model = queryset.model
+        self.page_size = self.get_page_size(request)
+
+        position, reverse = self.decode_cursor(request)
+        ordering = self._reversed(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self._seek(ordering, position))
+
+        # Ambil satu baris ekstra untuk tahu apakah masih ada halaman berikutnya
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+
+        if reverse:
+            rows.reverse()
+            self.has_next = position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = position is not None
+
+        self.page = rows
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            # Halaman kosong di ujung: kembali ke halaman pertama
+            return remove_query_param(self.request.build_absolute_uri(), self.cursor_query_param)
+        return self._link(self.page[0], reverse=True)
+
+    def get_paginated_data(self, data):
+        return {
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        }
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def encode_cursor(self, row, reverse):
+        # Baris bisa berupa instance model atau dict dari values() (lihat lms_core.fast_serializers)
+        if isinstance(row, dict):
+            values = [row[field.lstrip('-')] for field in self.ordering]
+        else:
+            values = [getattr(row, field.lstrip('-')) for field in self.ordering]
+        payload = json.dumps({'r': int(reverse), 'p': values}, default=self._encode_value, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)))
+            raw_values = payload['p']
+            if len(raw_values) != len(self.ordering):
+                raise ValueError
+            position = [
+                self.model._meta.get_field(field.lstrip('-')).to_python(value)
+                for field, value in zip(self.ordering, raw_values)
+            ]
+            return position, bool(payload.get('r'))
+        except (TypeError, ValueError, KeyError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def _link(self, row, reverse):
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(row, reverse))
+
+    @staticmethod
+    def _encode_value(value):
+        # Presisi penuh (mikrodetik) wajib, kalau tidak baris dengan timestamp berdekatan terlewat
+        if isinstance(value, (datetime.datetime, datetime.date)):
+            return value.isoformat()
+        return str(value)
+
+    @staticmethod
+    def _reversed(ordering):
+        return tuple(field[1:] if field.startswith('-') else '-' + field for field in ordering)
+
+    @staticmethod
+    def _seek(ordering, position):
+        # (a, b) > (x, y)  ==>  a > x OR (a = x AND b > y), arah mengikuti ordering
+        condition = Q()
+        for i, field in enumerate(ordering):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+            step = Q(**{f'{name}__{lookup}': position[i]})
+            for prev_field, prev_value in zip(ordering[:i], position[:i]):
+                step &= Q(**{prev_field.lstrip('-'): prev_value})
+            condition |= step
+        return condition
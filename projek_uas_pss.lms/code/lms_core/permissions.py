@@ -1,12 +1,30 @@
 from rest_framework import permissions
 
+from lms_core.models import Profile
+
+
+def get_role(request):
+    """
+    Role of the authenticated user. Read from the JWT ``role`` claim when the
+    token carries one (no query); older tokens fall back to the profile row.
+    The fallback queries by id because the stateless ``RoleTokenUser`` has no
+    ``profile`` relation.
+    """
+    token = request.auth
+    if token is not None and hasattr(token, 'get') and token.get('role'):
+        return token.get('role')
+    user_id = getattr(request.user, 'id', None)
+    if user_id is None:
+        return None
+    return Profile.objects.filter(user_id=user_id).values_list('role', flat=True).first()
+
 class IsTeacher(permissions.BasePermission):
     """
     Custom permission to only allow teachers to view or edit certain content.
     """
     def has_permission(self, request, view):
         # Pastikan user sudah login dan memiliki role 'teacher'
-        return request.user.is_authenticated and request.user.profile.role == 'teacher'
+        return request.user.is_authenticated and get_role(request) == 'teacher'
     
 class IsStudentOrTeacher(permissions.BasePermission):
     """
@@ -21,4 +39,4 @@ class IsStudent(permissions.BasePermission):
     """
     def has_permission(self, request, view):
         # Pastikan user sudah login dan memiliki role 'student'
-        return request.user.is_authenticated and request.user.profile.role == 'student'
+        return request.user.is_authenticated and get_role(request) == 'student'
@@ -0,0 +1,100 @@
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+
+
+def _frame_label(code):
+    # Dua komponen terakhir path cukup untuk membedakan, mis. lms_core/views.py vs rest_framework/views.py.
+    # ';' dan spasi memisahkan frame/jumlah pada format collapsed, jadi tidak boleh muncul di label.
+    filename = '/'.join(code.co_filename.replace('\\', '/').rsplit('/', 2)[-2:])
+    return f'{code.co_name}@{filename}:{code.co_firstlineno}'.replace(';', ':').replace(' ', '_')
+
+
+class StackSampler:
+    """
+    Sample the stack of one thread at a fixed interval from a background
+    thread. Only the profiled request pays for it; nothing is installed with
+    ``sys.setprofile`` and no process-wide setting is changed.
+
+    While the profiled thread runs pure Python, the sampler only gets the GIL
+    every ``sys.getswitchinterval()`` (5 ms by default), so fewer samples than
+    ``interval`` suggests may be taken. Time in C code that releases the GIL
+    (database I/O, hashing) is sampled at the full rate. The sample count is
+    reported in :meth:`top_table`.
+    """
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.samples = 0
+        self._labels = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='lms-profiler', daemon=True)
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.elapsed = time.perf_counter() - self.started
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if self._stop.is_set():
+                break
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                label = self._labels.get(code)
+                if label is None:
+                    label = self._labels[code] = _frame_label(code)
+                stack.append(label)
+                frame = frame.f_back
+            if stack:
+                stack.reverse()
+                self.stacks[tuple(stack)] += 1
+                self.samples += 1
+
+    def collapsed(self):
+        """Brendan Gregg's collapsed-stack format, input for flamegraph.pl/speedscope."""
+        return ''.join(f'{";".join(stack)} {count}\n' for stack, count in self.stacks.most_common())
+
+    def top_table(self, limit):
+        """Top ``limit`` functions by cumulative samples (self samples alongside)."""
+        cumulative = Counter()
+        own = Counter()
+        for stack, count in self.stacks.items():
+            own[stack[-1]] += count
+            for label in set(stack):
+                cumulative[label] += count
+        total = self.samples or 1
+        lines = [
+            f'{self.samples} samples every {self.interval * 1000:g} ms over {self.elapsed * 1000:.1f} ms',
+            '',
+            f'{"cum":>7} {"cum%":>6} {"self":>7} {"self%":>6}  function',
+        ]
+        for label, count in cumulative.most_common(limit):
+            lines.append(
+                f'{count:>7} {100 * count / total:>5.1f}% {own[label]:>7} {100 * own[label] / total:>5.1f}%  {label}'
+            )
+        return '\n'.join(lines) + '\n'
+
+
+def save_profile(sampler, directory, request, limit):
+    """Write ``<id>.collapsed`` and ``<id>.txt`` into ``directory`` and return the id."""
+    profile_id = uuid.uuid4().hex
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f'{profile_id}.collapsed').write_text(sampler.collapsed())
+    (directory / f'{profile_id}.txt').write_text(
+        f'{request.method} {request.get_full_path()}\n' + sampler.top_table(limit)
+    )
+    return profile_id
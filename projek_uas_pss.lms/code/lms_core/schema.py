@@ -64,3 +64,14 @@ class CourseCommentOut(Schema):
 
 class CourseCommentIn(Schema):
     comment: str
+
+
+class CourseAnnouncementOut(Schema):
+    id: int
+    course_id: int
+    teacher: UserOut
+    title: str
+    content: str
+    date: datetime
+    created_at: datetime
+    updated_at: datetime
@@ -0,0 +1,119 @@
+import re
+
+from django.db import connections, router
+from django.db.models import Q
+
+from lms_core.models import Course, CourseContent
+
+SEARCH_TYPES = ('course', 'content')
+
+POSTGRES_BRANCH = {
+    'course': """
+        SELECT 'course' AS type, c.id, c.id AS course_id, c.name, c.description,
+               ts_rank(c.search_vector, q.query) AS rank
+        FROM lms_core_course c, q
+        WHERE c.search_vector @@ q.query
+    """,
+    'content': """
+        SELECT 'content' AS type, cc.id, cc.course_id_id AS course_id, cc.name, cc.description,
+               ts_rank(cc.search_vector, q.query) AS rank
+        FROM lms_core_coursecontent cc, q
+        WHERE cc.search_vector @@ q.query
+    """,
+}
+
+
+def search(query, types=SEARCH_TYPES, limit=20, offset=0):
+    """
+    Ranked full-text search over course and course content names/descriptions.
+
+    Uses the generated ``tsvector`` columns + GIN indexes on PostgreSQL and the
+    ``lms_core_search`` FTS5 table on SQLite (both created by migration 0014
+    and kept current by the database itself). Returns a list of dicts with
+    ``type``, ``id``, ``course_id``, ``name``, ``snippet`` and ``rank``
+    (higher is better), best match first.
+    """
+    # SQL mentah tidak melewati router, jadi alias baca (replica) dipilih manual
+    connection = connections[router.db_for_read(Course)]
+    if connection.vendor == 'postgresql':
+        return _search_postgres(connection, query, types, limit, offset)
+    if connection.vendor == 'sqlite':
+        return _search_sqlite(connection, query, types, limit, offset)
+    return _search_fallback(query, types, limit, offset)
+
+
+def _search_postgres(connection, query, types, limit, offset):
+    union = ' UNION ALL '.join(POSTGRES_BRANCH[kind] for kind in types)
+    # ts_headline hanya dihitung untuk baris di halaman ini, bukan semua hasil
+    sql = f"""
+        WITH q AS (SELECT websearch_to_tsquery('simple', %s) AS query)
+        SELECT hit.type, hit.id, hit.course_id, hit.name,
+               ts_headline('simple', hit.description, q.query,
+                           'StartSel="", StopSel="", MaxWords=30, MinWords=10'),
+               hit.rank
+        FROM ({union} ORDER BY rank DESC, type, id LIMIT %s OFFSET %s) hit, q
+        ORDER BY hit.rank DESC, hit.type, hit.id
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [query, limit, offset])
+        return [_row(row) for row in cursor.fetchall()]
+
+
+def _search_sqlite(connection, query, types, limit, offset):
+    match = _fts5_match(query)
+    if not match:
+        return []
+    type_filter = ''
+    params = [match]
+    if set(types) != set(SEARCH_TYPES):
+        type_filter = f"AND kind IN ({', '.join('%s' for _ in types)})"
+        params.extend(types)
+    # bm25 bernilai negatif (makin kecil makin relevan); nama diberi bobot lebih besar
+    sql = f"""
+        SELECT kind, object_id, course_id, name,
+               snippet(lms_core_search, 1, '', '', '...', 24),
+               -bm25(lms_core_search, 10.0, 1.0) AS rank
+        FROM lms_core_search
+        WHERE lms_core_search MATCH %s {type_filter}
+        ORDER BY rank DESC, kind, object_id
+        LIMIT %s OFFSET %s
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params + [limit, offset])
+        return [_row(row) for row in cursor.fetchall()]
+
+
+def _fts5_match(query):
+    # Setiap kata di-quote agar karakter sintaks FTS5 dari user tidak memicu error
+    terms = re.findall(r'\w+', query)
+    return ' '.join(f'"{term}"' for term in terms)
+
+
+def _search_fallback(query, types, limit, offset):
+    results = []
+    condition = Q(name__icontains=query) | Q(description__icontains=query)
+    if 'course' in types:
+        results += [
+            ('course', pk, pk, name, description[:200], 0.0)
+            for pk, name, description in Course.objects.filter(condition)
+            .order_by('id').values_list('id', 'name', 'description')[:offset + limit]
+        ]
+    if 'content' in types:
+        results += [
+            ('content', pk, course_id, name, description[:200], 0.0)
+            for pk, course_id, name, description in CourseContent.objects.filter(condition)
+            .order_by('id').values_list('id', 'course_id', 'name', 'description')[:offset + limit]
+        ]
+    return [_row(row) for row in results[offset:offset + limit]]
+
+
+def _row(row):
+    kind, pk, course_id, name, snippet, rank = row
+    return {
+        'type': kind,
+        'id': pk,
+        'course_id': course_id,
+        'name': name,
+        'snippet': snippet,
+        'rank': float(rank),
+    }
@@ -1,10 +1,167 @@
 # lms_core/serializers.py
+from collections import Counter
+
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.conf import settings
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.core.exceptions import FieldDoesNotExist
+from django.core.files.storage import default_storage
+from django.db.models import Prefetch
+
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.tokens import AccessToken
 
 from lms_core.models import Course, Profile, CourseMember, CourseAnnouncement, Category, Bookmark, CourseContent
+from lms_core.thumbnails import image_variants
+
+def user_claims(user_id):
+    """Claim ``role`` dan ``is_staff`` untuk token, dibaca dari database dalam satu query."""
+    role, is_staff = User.objects.filter(pk=user_id).values_list('profile__role', 'is_staff').first() or (None, False)
+    return {'role': role, 'is_staff': is_staff}
+
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Login: sisipkan username, role dan is_staff ke dalam token (user_id sudah ada secara default)."""
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        token['username'] = user.username
+        for claim, value in user_claims(user.pk).items():
+            token[claim] = value
+        return token
+
+class RoleTokenRefreshSerializer(TokenRefreshSerializer):
+    """Refresh: role dan is_staff dibaca ulang dari database, jadi perubahannya berlaku setelah refresh."""
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        access = AccessToken(data['access'])
+        for claim, value in user_claims(access['user_id']).items():
+            access[claim] = value
+        data['access'] = str(access)
+        return data
 
-class UserListSerializer(serializers.ModelSerializer):
+def field_selection(request):
+    """
+    ``fields``/``expand`` kwargs for a :class:`DynamicFieldsMixin` serializer
+    from ``?fields=a,b`` and ``?expand=x,y.z``; empty when neither is given.
+    An empty ``?expand=`` is meaningful (every relation as a plain id).
+    """
+    selection = {}
+    for param in ('fields', 'expand'):
+        names = {name.strip() for name in request.query_params.get(param, '').split(',') if name.strip()}
+        if names or (param == 'expand' and param in request.query_params):
+            selection[param] = names
+    return selection
+
+def _split_paths(paths):
+    # {'content', 'content.course_id'} -> ({'content'}, {'content': {'course_id'}})
+    top, nested = set(), {}
+    for path in paths:
+        head, _, rest = path.partition('.')
+        top.add(head)
+        if rest:
+            nested.setdefault(head, set()).add(rest)
+    return top, nested
+
+def _resolves_to_columns(model, path):
+    # only() hanya menerima field model; property/method di source tidak bisa dipersempit
+    for part in path.split('__'):
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return False
+        model = field.related_model or model
+    return True
+
+def _query_paths(serializer, prefix=''):
+    """``(select_related paths, only() columns)`` for the fields ``serializer`` outputs."""
+    related, columns = [], []
+    for field in serializer.fields.values():
+        attrs = field.source_attrs
+        path = prefix + '__'.join(attrs)
+        if len(attrs) > 1:
+            related.append(prefix + '__'.join(attrs[:-1]))
+        if isinstance(field, serializers.BaseSerializer):
+            related.append(path)
+            nested_related, nested_columns = _query_paths(field, path + '__')
+            related += nested_related
+            columns += nested_columns
+        elif isinstance(field, serializers.StringRelatedField):
+            related.append(path)  # __str__ bisa membaca kolom apa saja, objek dimuat utuh
+            columns.append(path)
+        else:
+            columns.append(path)
+    return related, columns
+
+class DynamicFieldsMixin:
+    """
+    Sparse fieldsets and expansion control for read serializers.
+
+    ``fields`` keeps only the named fields. ``expand`` names the nested
+    serializers that stay nested; every other one is replaced by the related
+    object's primary key (read from the foreign key column, no extra query).
+    ``None`` means "as declared", so output only changes when a client asks.
+    Dotted names (``content.course_id``) reach into nested serializers.
+    """
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._selected_fields = fields
+        self._expand = expand
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, fields=None, expand=None, keep=()):
+        """
+        Narrow ``queryset`` to what this selection outputs: ``select_related``
+        for relations that are read and ``only()`` for the output columns plus
+        ``keep`` (e.g. the keyset pagination fields).
+        """
+        related, columns = _query_paths(cls(fields=fields, expand=expand))
+        if related:
+            queryset = queryset.select_related(*related)
+        columns += list(keep)
+        if all(_resolves_to_columns(queryset.model, column) for column in columns):
+            queryset = queryset.only(*columns)
+        return queryset
+
+    def get_fields(self):
+        fields = super().get_fields()
+        wanted, nested_fields = _split_paths(self._selected_fields) if self._selected_fields else (None, {})
+        expanded, nested_expand = _split_paths(self._expand) if self._expand is not None else (None, {})
+        for name in list(fields):
+            if wanted is not None and name not in wanted:
+                del fields[name]
+                continue
+            field = fields[name]
+            if not isinstance(field, serializers.BaseSerializer):
+                continue
+            if expanded is not None and name not in expanded:
+                source = {'source': field.source} if field.source not in (None, name) else {}
+                fields[name] = serializers.PrimaryKeyRelatedField(read_only=True, **source)
+            elif isinstance(field, DynamicFieldsMixin):
+                field._selected_fields = nested_fields.get(name)
+                field._expand = nested_expand.get(name, set()) if expanded is not None else None
+        return fields
+
+def image_variant_urls(variants, request=None):
+    """URL per varian dari peta varian gambar (lihat lms_core.thumbnails), None jika belum dibuat."""
+    if not variants:
+        return None
+    urls = {}
+    for variant in image_variants():
+        name = variants.get(variant)
+        if name:
+            url = default_storage.url(name)
+            urls[variant] = request.build_absolute_uri(url) if request is not None else url
+    return urls
+
+class ImageVariantsField(serializers.ReadOnlyField):
+    def to_representation(self, variants):
+        return image_variant_urls(variants, self.context.get('request'))
+
+class UserListSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     role = serializers.CharField(source='profile.role')
 
     class Meta:
@@ -19,23 +176,36 @@ class UserProfileSerializer(serializers.ModelSerializer):
     phone_number = serializers.CharField(source='profile.phone_number', allow_null=True, required=False)
     description = serializers.CharField(source='profile.description', allow_null=True, required=False)
     profile_picture = serializers.ImageField(source='profile.profile_picture', allow_null=True, required=False)
+    profile_picture_variants = ImageVariantsField(source='profile.profile_picture_variants')
     role = serializers.CharField(source='profile.role', read_only=True)
 
     class Meta:
         model = User
         fields = ['id', 'username', 'first_name', 'last_name', 'email', 'courses_joined', 'courses_created', 
-                  'phone_number', 'description', 'profile_picture', 'role']
+                  'phone_number', 'description', 'profile_picture', 'profile_picture_variants', 'role']
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Load profile, joined courses and created courses (with their categories)
+        up front so serializing a profile costs a fixed number of queries.
+        """
+        return queryset.select_related('profile').prefetch_related(
+            Prefetch('coursemember_set', queryset=CourseMember.objects.select_related('course_id__category')),
+            Prefetch('course_set', queryset=Course.objects.select_related('category')),
+        )
 
     def get_courses_joined(self, obj):
         user = obj
         if hasattr(user, 'profile') and user.profile.role == 'teacher':
             return []  # Teacher tidak boleh join kursus
-        courses = CourseMember.objects.filter(user_id=user)
+        # Memakai hasil prefetch dari setup_eager_loading jika tersedia
+        courses = user.coursemember_set.all()
         return CourseSerializer([course.course_id for course in courses], many=True).data
 
     def get_courses_created(self, obj):
         user = obj
-        courses = Course.objects.filter(teacher=user)
+        courses = user.course_set.all()
         return CourseSerializer(courses, many=True).data
 
     def update(self, instance, validated_data):
@@ -103,6 +273,35 @@ class RegisterSerializer(serializers.ModelSerializer):
 
         return user
 
+class BulkRegisterUserSerializer(serializers.Serializer):
+    username = serializers.CharField(max_length=150, validators=[UnicodeUsernameValidator()])
+    password = serializers.CharField(write_only=True)
+    email = serializers.EmailField(required=False, allow_blank=True, default='')
+    first_name = serializers.CharField(max_length=150, required=False, allow_blank=True, default='')
+    last_name = serializers.CharField(max_length=150, required=False, allow_blank=True, default='')
+    role = serializers.ChoiceField(choices=[('teacher', 'Teacher'), ('student', 'Student')], default='student')
+    phone_number = serializers.CharField(max_length=20, required=False, allow_blank=True, default='')
+    description = serializers.CharField(required=False, allow_blank=True, default='')
+
+class BulkRegisterSerializer(serializers.Serializer):
+    users = serializers.ListField(child=BulkRegisterUserSerializer(), allow_empty=False)
+
+    def validate_users(self, users):
+        limit = getattr(settings, 'LMS_BULK_REGISTER_MAX', 100)
+        if len(users) > limit:
+            raise serializers.ValidationError(f"Maksimal {limit} user per request.")
+
+        usernames = [user['username'] for user in users]
+        duplicates = sorted(name for name, count in Counter(usernames).items() if count > 1)
+        if duplicates:
+            raise serializers.ValidationError(f"Username ganda di dalam request: {duplicates}")
+
+        # Cek username yang sudah terpakai dengan satu query, bukan per user
+        taken = sorted(User.objects.filter(username__in=usernames).values_list('username', flat=True))
+        if taken:
+            raise serializers.ValidationError(f"Username sudah terdaftar: {taken}")
+        return users
+
 class BatchEnrollSerializer(serializers.Serializer):
     course_id = serializers.IntegerField()
     student_ids = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
@@ -119,38 +318,36 @@ class BatchEnrollSerializer(serializers.Serializer):
 
         return data
 
-class CategorySerializer(serializers.ModelSerializer):
+class CategorySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ['id', 'name']
 
-class CourseSerializer(serializers.ModelSerializer):
+class CourseSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     category = CategorySerializer()  # Menyertakan kategori dalam response course
+    image_variants = ImageVariantsField()  # Thumbnail/card WebP, dipakai list daripada gambar asli
 
     class Meta:
         model = Course
-        fields = ['id', 'name', 'description', 'price', 'image', 'teacher', 'created_at', 'updated_at', 'category']
+        fields = ['id', 'name', 'description', 'price', 'image', 'image_variants', 'teacher', 'created_at', 'updated_at', 'category']
 
-class CourseContentSerializer(serializers.ModelSerializer):
+class CourseContentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     course_id = CourseSerializer()  # Menyertakan detail course dalam konten
 
     class Meta:
         model = CourseContent
         fields = ['id', 'name', 'description', 'video_url', 'file_attachment', 'course_id', 'parent_id', 'created_at', 'updated_at']
 
-class BookmarkSerializer(serializers.ModelSerializer):
+class BookmarkSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     content = CourseContentSerializer()  # Menyertakan detail konten kursus
-    course = serializers.SerializerMethodField()  # Mendapatkan course terkait dari course_content
+    # Course dari konten yang sama (sudah di-join), bukan serializer + query kedua
+    course = CourseSerializer(source='content.course_id', read_only=True)
 
     class Meta:
         model = Bookmark
         fields = ['id', 'student', 'content', 'course', 'created_at']
 
-    def get_course(self, obj):
-        # Mengambil course yang terkait dengan course_content
-        return CourseSerializer(obj.content.course_id).data
-
-class CourseAnnouncementSerializer(serializers.ModelSerializer):
+class CourseAnnouncementSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     teacher = serializers.StringRelatedField()  # Menampilkan username teacher
     course = CourseSerializer()
 
@@ -0,0 +1,51 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from lms_core.cache import invalidate
+from lms_core.events import publish_event
+from lms_core.models import Category, Course, CourseAnnouncement, Profile
+from lms_core.serializers import CourseAnnouncementSerializer
+from lms_core.thumbnails import needs_variants, schedule_variants
+
+
+@receiver([post_save, post_delete], sender=Course)
+def invalidate_course_cache(sender, **kwargs):
+    # Invalidasi setelah commit supaya pembaca lain tidak meng-cache data lama dengan versi baru
+    transaction.on_commit(lambda: invalidate('courses'))
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_cache(sender, **kwargs):
+    # Course list ikut menampilkan kategori, jadi keduanya di-invalidasi
+    transaction.on_commit(lambda: invalidate('courses', 'categories'))
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_save, sender=Profile)
+def schedule_image_variants(sender, instance, **kwargs):
+    # Gambar baru/diganti: varian dibuat di background, request tidak menunggu
+    if needs_variants(instance):
+        schedule_variants(instance)
+
+
+@receiver(post_save, sender=CourseAnnouncement)
+def publish_announcement_saved(sender, instance, created, **kwargs):
+    event_type = 'announcement.created' if created else 'announcement.updated'
+
+    def build_event():
+        # Diserialisasi saat commit (isi terakhir yang ter-commit) dan hanya jika ada yang subscribe
+        return {
+            'type': event_type,
+            'announcement': CourseAnnouncementSerializer(instance, expand=set()).data,  # Bentuk sama dengan feed ?expand=
+        }
+
+    # Dikirim setelah commit: client yang lalu membaca feed pasti sudah melihat datanya
+    transaction.on_commit(lambda: publish_event(instance.course_id, build_event))
+
+
+@receiver(post_delete, sender=CourseAnnouncement)
+def publish_announcement_deleted(sender, instance, **kwargs):
+    course_id = instance.course_id
+    event = {'type': 'announcement.deleted', 'announcement': {'id': instance.pk, 'course': course_id}}
+    transaction.on_commit(lambda: publish_event(course_id, lambda: event))
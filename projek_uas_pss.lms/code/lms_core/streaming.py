@@ -0,0 +1,80 @@
+import json
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+
+def wants_stream(request):
+    """Streaming mode is opt-in via ``?stream=1``."""
+    return request.query_params.get('stream', '').lower() in ('1', 'true', 'yes')
+
+
+def served_over_asgi(request):
+    # Request DRF membungkus HttpRequest asli di _request
+    return isinstance(getattr(request, '_request', request), ASGIRequest)
+
+
+async def _iterate_in_thread(iterator):
+    sentinel = object()
+    try:
+        while True:
+            part = await sync_to_async(next)(iterator, sentinel)
+            if part is sentinel:
+                return
+            yield part
+    finally:
+        await sync_to_async(iterator.close)()
+
+
+def streaming_body(request, iterator):
+    """
+    Body for a ``StreamingHttpResponse`` that keeps ``iterator`` lazy on both servers.
+
+    Under ASGI Django consumes a sync iterator with ``sync_to_async(list)``,
+    i.e. builds the whole body in memory before the first byte is sent. There
+    the generator is wrapped in an async iterator that pulls one part at a
+    time (in the request's sync thread, where its DB cursor/file lives).
+    """
+    return _iterate_in_thread(iterator) if served_over_asgi(request) else iterator
+
+
+def stream_json_array(request, queryset, serializer_class, chunk_size=None):
+    """
+    Respond with the whole queryset as a JSON array without building it in memory.
+
+    Rows are read through ``QuerySet.iterator()`` (a server-side cursor on
+    PostgreSQL) and serialized one chunk at a time, so peak memory depends on
+    ``chunk_size`` rather than on the number of rows, under WSGI and ASGI alike
+    (see :func:`streaming_body`).
+    """
+    chunk_size = chunk_size or getattr(settings, 'LMS_STREAM_CHUNK_SIZE', 500)
+    # Format sama dengan JSONRenderer DRF supaya client tidak melihat perbedaan
+    dump_options = {
+        'cls': encoders.JSONEncoder,
+        'ensure_ascii': not api_settings.UNICODE_JSON,
+        'separators': (',', ':') if api_settings.COMPACT_JSON else (', ', ': '),
+    }
+
+    # Alias database dikunci sekarang: generator baru jalan setelah middleware selesai,
+    # saat routing read replica untuk request ini sudah tidak aktif
+    queryset = queryset.using(queryset.db)
+
+    def generate():
+        rows = queryset.iterator(chunk_size=chunk_size)
+        yield '['
+        first = True
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            items = [json.dumps(item, **dump_options) for item in serializer_class(chunk, many=True).data]
+            yield ('' if first else ',') + ','.join(items)
+            first = False
+        yield ']'
+
+    return StreamingHttpResponse(streaming_body(request, generate()), content_type='application/json')
@@ -0,0 +1,73 @@
+from unittest import mock
+
+from django.contrib.auth.hashers import check_password
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from lms_core.hashing import hash_passwords
+from lms_core.models import Profile
+from lms_core.serializers import BulkRegisterSerializer, RoleTokenObtainPairSerializer
+
+FAST_HASHER = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHER)
+class HashPasswordsTests(SimpleTestCase):
+    def test_order_is_preserved(self):
+        passwords = [f'rahasia-{i}' for i in range(25)]
+        for workers in (None, 1, 4):
+            with self.subTest(workers=workers):
+                hashed = hash_passwords(iter(passwords), workers=workers)
+                self.assertEqual(len(hashed), len(passwords))
+                self.assertTrue(all(check_password(raw, encoded) for raw, encoded in zip(passwords, hashed)))
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHER, LMS_BULK_REGISTER_MAX=3)
+class BulkRegisterViewTests(TestCase):
+    url = '/register/bulk/'
+
+    @classmethod
+    def setUpTestData(cls):
+        admin = User.objects.create(username='bulk_admin', is_staff=True)
+        user = User.objects.create(username='bulk_user')
+        cls.admin = f'Bearer {RoleTokenObtainPairSerializer.get_token(admin).access_token}'
+        cls.user = f'Bearer {RoleTokenObtainPairSerializer.get_token(user).access_token}'
+
+    def post(self, users, authorization=None):
+        return self.client.post(self.url, {'users': users}, content_type='application/json',
+                                HTTP_AUTHORIZATION=authorization or self.admin)
+
+    def test_creates_users_and_profiles(self):
+        response = self.post([
+            {'username': 'baru_1', 'password': 'pw-1', 'role': 'teacher'},
+            {'username': 'baru_2', 'password': 'pw-2'},
+        ])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([(row['username'], row['role']) for row in response.json()['users']],
+                         [('baru_1', 'teacher'), ('baru_2', 'student')])
+        self.assertTrue(User.objects.get(username='baru_2').check_password('pw-2'))
+        self.assertEqual(Profile.objects.get(user__username='baru_1').role, 'teacher')
+
+    def test_rejects_invalid_batches(self):
+        cases = {
+            'taken': [{'username': 'bulk_user', 'password': 'x'}],
+            'duplicate': [{'username': 'sama', 'password': 'x'}, {'username': 'sama', 'password': 'y'}],
+            'too many': [{'username': f'u{i}', 'password': 'x'} for i in range(4)],
+        }
+        for name, users in cases.items():
+            with self.subTest(name):
+                self.assertEqual(self.post(users).status_code, 400)
+        self.assertFalse(User.objects.filter(username__in=['sama', 'u0']).exists())
+
+    def test_only_admin(self):
+        self.assertEqual(self.post([{'username': 'x', 'password': 'x'}], self.user).status_code, 403)
+
+    def test_concurrent_registration_is_a_conflict(self):
+        # Request lain mendaftarkan username setelah validasi: constraint unik yang menolak
+        with mock.patch.object(BulkRegisterSerializer, 'validate_users', lambda self, users: users):
+            response = self.post([
+                {'username': 'belum_ada', 'password': 'x'},
+                {'username': 'bulk_user', 'password': 'x'},
+            ])
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(User.objects.filter(username='belum_ada').exists())
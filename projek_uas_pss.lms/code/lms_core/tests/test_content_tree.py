@@ -0,0 +1,96 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from lms_core.models import Course, CourseContent, content_path_segment
+
+
+class ContentTreeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        teacher = User.objects.create(username='tree_teacher')
+        cls.course = Course.objects.create(name='tree', description='-', price=0, teacher=teacher)
+
+    def add(self, name, parent=None):
+        content = CourseContent(name=name, course_id=self.course, parent_id=parent)
+        content.save()
+        return content
+
+    def paths(self):
+        return dict(CourseContent.objects.values_list('name', 'path'))
+
+    def depths(self):
+        return dict(CourseContent.objects.values_list('name', 'depth'))
+
+    def test_create_sets_path_and_depth(self):
+        root = self.add('root')
+        child = self.add('child', root)
+        leaf = self.add('leaf', child)
+        self.assertEqual(leaf.path, root.path + content_path_segment(child.pk) + content_path_segment(leaf.pk))
+        self.assertEqual(self.paths(), {'root': root.path, 'child': child.path, 'leaf': leaf.path})
+        self.assertEqual(self.depths(), {'root': 0, 'child': 1, 'leaf': 2})
+
+    def test_manager_create(self):
+        # objects.create() memanggil save(force_insert=True, using=...)
+        root = CourseContent.objects.create(name='root', course_id=self.course)
+        child = CourseContent.objects.create(name='child', course_id=self.course, parent_id=root)
+        self.assertEqual(self.paths()['child'], content_path_segment(root.pk) + content_path_segment(child.pk))
+
+    def test_move_rewrites_subtree(self):
+        a, b = self.add('a'), self.add('b')
+        x = self.add('x', a)
+        y = self.add('y', x)
+
+        x.parent_id = b
+        x.save()
+        self.assertEqual(self.paths()['y'], b.path + content_path_segment(x.pk) + content_path_segment(y.pk))
+        self.assertEqual(self.depths(), {'a': 0, 'b': 0, 'x': 1, 'y': 2})
+
+        x.parent_id = None
+        x.save()
+        self.assertEqual(self.paths()['y'], content_path_segment(x.pk) + content_path_segment(y.pk))
+        self.assertEqual(self.depths()['y'], 1)
+
+    def test_stale_instance_moves_subtree_from_current_path(self):
+        root = self.add('root')
+        x = self.add('x')
+        y = self.add('y', x)
+
+        stale = CourseContent.objects.get(pk=x.pk)
+        x.parent_id = root
+        x.save()
+        # Instance basi masih menyimpan path lama x; path terkini dibaca dari database
+        stale.parent_id = None
+        stale.name = 'x baru'
+        stale.save()
+        self.assertEqual(self.paths()['y'], content_path_segment(x.pk) + content_path_segment(y.pk))
+        self.assertEqual(self.depths()['y'], 1)
+
+    def test_cycle_is_rejected(self):
+        a = self.add('a')
+        b = self.add('b', a)
+        c = self.add('c', b)
+        before = self.paths()
+
+        stale = CourseContent.objects.get(pk=a.pk)
+        for parent in (a, c):
+            with self.subTest(parent=parent.name), self.assertRaises(ValueError):
+                stale.parent_id = parent
+                stale.save()
+        self.assertEqual(self.paths(), before)
+
+    def test_too_deep_is_rejected_before_writing(self):
+        max_depth = CourseContent._meta.get_field('path').max_length // len(content_path_segment(0))
+        parent = None
+        for level in range(max_depth):
+            parent = self.add(f'level {level}', parent)
+        with self.assertRaises(ValueError):
+            self.add('terlalu dalam', parent)
+
+        # Memindahkan subtree di bawah daun terdalam juga ditolak, tanpa perubahan setengah jalan
+        other = self.add('other')
+        self.add('other child', other)
+        before = self.paths()
+        other.parent_id = CourseContent.objects.get(name=f'level {max_depth - 2}')
+        with self.assertRaises(ValueError):
+            other.save()
+        self.assertEqual(self.paths(), before)
@@ -0,0 +1,74 @@
+import shutil
+import tempfile
+
+from django.contrib.auth.models import User
+from django.core.files.base import ContentFile
+from django.test import AsyncClient, TestCase, override_settings
+
+from lms_core.models import Course, CourseContent, CourseMember, Profile
+from lms_core.serializers import RoleTokenObtainPairSerializer
+
+PAYLOAD = bytes(range(256)) * 40
+
+
+def _authorization(user):
+    return f'Bearer {RoleTokenObtainPairSerializer.get_token(user).access_token}'
+
+
+class ContentDownloadTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.media_root = tempfile.mkdtemp()
+        cls.media_override = override_settings(MEDIA_ROOT=cls.media_root, LMS_SENDFILE_BACKEND=None)
+        cls.media_override.enable()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.media_override.disable()
+        shutil.rmtree(cls.media_root, ignore_errors=True)
+
+    @classmethod
+    def setUpTestData(cls):
+        teacher = User.objects.create(username='download_teacher')
+        Profile.objects.create(user=teacher, role='teacher')
+        cls.member = User.objects.create(username='download_member')
+        cls.outsider = User.objects.create(username='download_outsider')
+        cls.staff = User.objects.create(username='download_staff', is_staff=True)
+        course = Course.objects.create(name='download', description='-', price=0, teacher=teacher)
+        CourseMember.objects.create(course_id=course, user_id=cls.member)
+        cls.content = CourseContent(name='materi', course_id=course)
+        cls.content.file_attachment.save('materi.bin', ContentFile(PAYLOAD), save=False)
+        cls.content.save()
+        cls.url = f'/api/v1/contents/{cls.content.pk}/download/'
+        cls.member_authorization = _authorization(cls.member)  # Test async tidak boleh query sinkron
+
+    def test_member_downloads_whole_file(self):
+        response = self.client.get(self.url, HTTP_AUTHORIZATION=_authorization(self.member))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), PAYLOAD)
+
+    def test_staff_downloads_without_membership(self):
+        response = self.client.get(self.url, HTTP_AUTHORIZATION=_authorization(self.staff))
+        self.assertEqual(response.status_code, 200)
+
+    def test_non_member_is_forbidden(self):
+        response = self.client.get(self.url, HTTP_AUTHORIZATION=_authorization(self.outsider))
+        self.assertEqual(response.status_code, 403)
+
+    def test_range_request(self):
+        response = self.client.get(self.url, HTTP_AUTHORIZATION=_authorization(self.member), HTTP_RANGE='bytes=10-19')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], f'bytes 10-19/{len(PAYLOAD)}')
+        self.assertEqual(b''.join(response.streaming_content), PAYLOAD[10:20])
+
+    async def test_asgi_response_streams_chunk_by_chunk(self):
+        # Iterator async: Django tidak membaca seluruh file ke memori sebelum mengirim
+        with override_settings(LMS_DOWNLOAD_CHUNK_SIZE=1024):
+            response = await AsyncClient().get(self.url, headers={'Authorization': self.member_authorization})
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.is_async)
+            chunks = [chunk async for chunk in response.streaming_content]
+        self.assertEqual(len(chunks), len(PAYLOAD) // 1024)
+        self.assertEqual(b''.join(chunks), PAYLOAD)
@@ -0,0 +1,34 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from lms_core.enrollment import bulk_enroll_students
+from lms_core.models import Course, CourseMember, Profile
+
+
+class BulkEnrollTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        teacher = User.objects.create(username='enroll_teacher')
+        Profile.objects.create(user=teacher, role='teacher')
+        cls.course = Course.objects.create(name='enroll', description='-', price=0, teacher=teacher)
+        cls.students = User.objects.bulk_create(User(username=f'enroll_student_{i}') for i in range(3))
+        Profile.objects.bulk_create(Profile(user=student, role='student') for student in cls.students)
+
+    def test_concurrent_enrollment_is_reported_not_duplicated(self):
+        real_bulk_create = CourseMember.objects.bulk_create
+
+        def enroll_concurrently(objs, **kwargs):
+            # Request lain mendaftarkan student pertama tepat sebelum INSERT batch ini
+            CourseMember.objects.create(course_id=self.course, user_id=self.students[0])
+            return real_bulk_create(objs, **kwargs)
+
+        with mock.patch.object(CourseMember.objects, 'bulk_create', side_effect=enroll_concurrently):
+            enrolled, not_found, invalid_role = bulk_enroll_students(
+                self.course, [student.id for student in self.students])
+
+        self.assertEqual(enrolled, [student.username for student in self.students])
+        self.assertEqual((not_found, invalid_role), ([], []))
+        members = CourseMember.objects.filter(course_id=self.course)
+        self.assertCountEqual(members.values_list('user_id', flat=True), [student.id for student in self.students])
@@ -0,0 +1,163 @@
+import asyncio
+import json
+
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.test import AsyncClient, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from lms_core import events
+from lms_core.authentication import StreamTicket
+from lms_core.models import Course, CourseAnnouncement, CourseMember, Profile
+from lms_core.serializers import RoleTokenObtainPairSerializer
+
+STREAM_URL = '/api/v1/announcements/stream/'
+TICKET_URL = '/api/v1/announcements/stream/ticket/'
+
+
+@override_settings(LMS_EVENT_BROKER='lms_core.events.InProcessBroker', LMS_SSE_HEARTBEAT=0.05)
+class AnnouncementStreamTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create(username='sse_teacher')
+        student = User.objects.create(username='sse_student')
+        Profile.objects.create(user=cls.teacher, role='teacher')
+        Profile.objects.create(user=student, role='student')
+        cls.course = Course.objects.create(name='sse diikuti', description='-', price=0, teacher=cls.teacher)
+        cls.other = Course.objects.create(name='sse lain', description='-', price=0, teacher=cls.teacher)
+        CourseMember.objects.create(course_id=cls.course, user_id=student)
+        # Token dibuat di sini: tes async tidak boleh menjalankan query sinkron
+        cls.access_token = RoleTokenObtainPairSerializer.get_token(student).access_token
+        cls.authorization = f'Bearer {cls.access_token}'
+        expired = StreamTicket.for_user(student)
+        expired.set_exp(lifetime=-timedelta(seconds=1))
+        cls.expired_ticket = str(expired)
+
+    def setUp(self):
+        events._broker = None
+
+    def tearDown(self):
+        events._broker = None
+
+    async def open_stream(self, path=STREAM_URL, headers=None):
+        if headers is None:
+            headers = {'Authorization': self.authorization}
+        response = await AsyncClient().get(path, headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        # Frame pertama dikirim setelah subscribe
+        self.assertTrue((await anext(stream)).startswith(b'retry: '))
+        return stream
+
+    async def announce(self, *courses):
+        def create():
+            with self.captureOnCommitCallbacks(execute=True):
+                for course in courses:
+                    CourseAnnouncement.objects.create(
+                        course=course, teacher=self.teacher, title=f'untuk {course.name}', content='-',
+                        date=timezone.now(),
+                    )
+        await sync_to_async(create)()
+
+    async def test_only_subscribed_courses_are_pushed(self):
+        stream = await self.open_stream()
+        await self.announce(self.other, self.course)
+
+        frame = (await anext(stream)).decode()
+        event_line, data_line = frame.strip().split('\n')
+        self.assertEqual(event_line, 'event: announcement.created')
+        announcement = json.loads(data_line.removeprefix('data: '))['announcement']
+        self.assertEqual((announcement['course'], announcement['title']), (self.course.pk, 'untuk sse diikuti'))
+        # Pengumuman kursus lain tidak pernah dikirim; yang datang berikutnya heartbeat
+        self.assertEqual(await anext(stream), b': keep-alive\n\n')
+
+    async def test_heartbeat_when_idle(self):
+        stream = await self.open_stream()
+        self.assertEqual(await anext(stream), b': keep-alive\n\n')
+        self.assertEqual(await anext(stream), b': keep-alive\n\n')
+
+    @override_settings(LMS_SSE_QUEUE_SIZE=2)
+    async def test_overflow_closes_stream(self):
+        stream = await self.open_stream()
+        await self.announce(self.course, self.course, self.course)
+        with self.assertRaises(StopAsyncIteration):
+            await anext(stream)
+
+    async def test_disconnect_unsubscribes(self):
+        stream = await self.open_stream()
+        broker = events.get_broker()
+        channel = events.course_channel(self.course.pk)
+        self.assertTrue(broker.has_subscribers(channel))
+
+        # Server ASGI membatalkan task respons saat client memutus koneksi
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+        self.assertFalse(broker.has_subscribers(channel))
+
+    async def test_requires_authentication(self):
+        response = await AsyncClient().get(STREAM_URL)
+        self.assertEqual(response.status_code, 401)
+        response = await AsyncClient().get(f'{STREAM_URL}?ticket=invalid')
+        self.assertEqual(response.status_code, 401)
+
+    async def test_ticket_opens_stream(self):
+        response = await AsyncClient().post(TICKET_URL, headers={'Authorization': self.authorization})
+        self.assertEqual(response.status_code, 201)
+        data = response.json()['data']
+        self.assertEqual(data['expires_in'], int(StreamTicket.lifetime.total_seconds()))
+
+        stream = await self.open_stream(f"{STREAM_URL}?ticket={data['ticket']}", headers={})
+        await self.announce(self.course)
+        self.assertTrue((await anext(stream)).startswith(b'event: announcement.created'))
+
+    async def test_ticket_is_single_purpose_and_short_lived(self):
+        client = AsyncClient()
+        # Access token di query string tidak diterima sebagai tiket
+        response = await client.get(f'{STREAM_URL}?ticket={self.access_token}')
+        self.assertEqual(response.status_code, 401)
+        response = await client.get(f'{STREAM_URL}?ticket={self.expired_ticket}')
+        self.assertEqual(response.status_code, 401)
+
+        response = await client.post(TICKET_URL, headers={'Authorization': self.authorization})
+        ticket = response.json()['data']['ticket']
+        # Tiket juga bukan access token untuk endpoint lain
+        response = await client.post(TICKET_URL, headers={'Authorization': f'Bearer {ticket}'})
+        self.assertEqual(response.status_code, 401)
+
+    async def test_ticket_requires_authentication(self):
+        response = await AsyncClient().post(TICKET_URL)
+        self.assertEqual(response.status_code, 401)
+
+    def test_not_available_under_wsgi(self):
+        response = self.client.get(STREAM_URL, HTTP_AUTHORIZATION=self.authorization)
+        self.assertEqual(response.status_code, 501)
+
+
+@override_settings(LMS_EVENT_BROKER='lms_core.events.InProcessBroker')
+class PublishEventTests(SimpleTestCase):
+    def setUp(self):
+        events._broker = None
+
+    def tearDown(self):
+        events._broker = None
+
+    def test_event_is_not_built_without_subscribers(self):
+        built = []
+        events.publish_event(1, lambda: built.append(1) or {'type': 'announcement.created'})
+        self.assertEqual(built, [])
+
+    def test_failures_are_logged_not_raised(self):
+        async def subscribe_and_publish():
+            subscription = events.get_broker().subscribe([events.course_channel(1)])
+            try:
+                with self.assertLogs('lms_core.events', 'ERROR'):
+                    events.publish_event(1, lambda: 1 / 0)
+            finally:
+                subscription.close()
+        asyncio.run(subscribe_and_publish())
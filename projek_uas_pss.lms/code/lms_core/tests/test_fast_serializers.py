@@ -0,0 +1,29 @@
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from rest_framework.renderers import JSONRenderer
+
+from lms_core.fast_serializers import FastCourseSerializer, ValuesSerializer, course_builder
+from lms_core.models import Category, Course
+from lms_core.serializers import CourseSerializer
+
+
+class ValuesSerializerDefinitionTests(SimpleTestCase):
+    def test_builder_and_columns_are_required(self):
+        with self.assertRaisesMessage(TypeError, 'NoBuilder'):
+            type('NoBuilder', (ValuesSerializer,), {'columns': ('id',)})
+        with self.assertRaisesMessage(TypeError, 'NoColumns'):
+            type('NoColumns', (ValuesSerializer,), {'builder': staticmethod(course_builder)})
+
+
+class FastCourseSerializerTests(TestCase):
+    def test_matches_drf_serializer(self):
+        teacher = User.objects.create(username='fast_teacher')
+        category = Category.objects.create(name='fast_category')
+        Course.objects.create(name='dengan kategori', description='-', price=1, teacher=teacher, category=category,
+                              image='course/a.png')
+        Course.objects.create(name='tanpa kategori', description='-', price=2, teacher=teacher)
+
+        courses = Course.objects.order_by('id')
+        drf = CourseSerializer(courses.select_related('category'), many=True).data
+        fast = FastCourseSerializer(FastCourseSerializer.values(courses), many=True).data
+        self.assertEqual(JSONRenderer().render(fast), JSONRenderer().render(drf))
@@ -0,0 +1,118 @@
+from datetime import datetime, timezone
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from lms_core.models import Bookmark, Category, Course, CourseAnnouncement, CourseContent, CourseMember, Profile
+from lms_core.serializers import RoleTokenObtainPairSerializer
+
+COURSE_FIELDS = {'id', 'name', 'description', 'price', 'image', 'image_variants', 'teacher',
+                 'created_at', 'updated_at', 'category'}
+CONTENT_FIELDS = {'id', 'name', 'description', 'video_url', 'file_attachment', 'course_id',
+                  'parent_id', 'created_at', 'updated_at'}
+
+
+class FieldSelectionTests(TestCase):
+    """?fields= / ?expand= mengubah bentuk output dan tetap satu query per halaman."""
+
+    @classmethod
+    def setUpTestData(cls):
+        teacher = User.objects.create_user(username='fields_teacher')
+        cls.student = User.objects.create_user(username='fields_student')
+        Profile.objects.create(user=teacher, role='teacher')
+        Profile.objects.create(user=cls.student, role='student')
+        category = Category.objects.create(name='Sains')
+        when = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        for i in range(3):
+            course = Course.objects.create(name=f'Kursus {i}', description='-', price=0,
+                                           teacher=teacher, category=category)
+            CourseMember.objects.create(course_id=course, user_id=cls.student)
+            content = CourseContent.objects.create(name=f'Bab {i}', course_id=course)
+            Bookmark.objects.create(student=cls.student, content=content)
+            CourseAnnouncement.objects.create(course=course, teacher=teacher, title=f'Info {i}',
+                                              content='-', date=when)
+        cls.course = course
+        cls.auth = f'Bearer {RoleTokenObtainPairSerializer.get_token(cls.student).access_token}'
+
+    def get(self, path, queries):
+        # Autentikasi stateless: tidak ada query user, jadi yang terhitung hanya query halaman
+        with self.assertNumQueries(queries):
+            response = self.client.get(path, HTTP_AUTHORIZATION=self.auth)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        return body['data'] if isinstance(body, dict) else body
+
+    def test_bookmarks_default_shape(self):
+        rows = self.get('/api/v1/bookmarks/', 1)
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(set(rows[0]), {'id', 'student', 'content', 'course', 'created_at'})
+        self.assertEqual(set(rows[0]['content']), CONTENT_FIELDS)
+        self.assertEqual(set(rows[0]['content']['course_id']), COURSE_FIELDS)
+        self.assertEqual(set(rows[0]['course']), COURSE_FIELDS)
+        self.assertEqual(set(rows[0]['course']['category']), {'id', 'name'})
+
+    def test_bookmarks_fields(self):
+        rows = self.get('/api/v1/bookmarks/?fields=id,content', 1)
+        self.assertEqual(set(rows[0]), {'id', 'content'})
+        self.assertEqual(set(rows[0]['content']), CONTENT_FIELDS)
+
+    def test_bookmarks_nested_fields(self):
+        rows = self.get('/api/v1/bookmarks/?fields=id,content.name,course.name', 1)
+        for row in rows:
+            self.assertEqual(set(row), {'id', 'content', 'course'})
+            self.assertEqual(set(row['content']), {'name'})
+            self.assertEqual(set(row['course']), {'name'})
+
+    def test_bookmarks_empty_expand_returns_ids(self):
+        rows = self.get('/api/v1/bookmarks/?expand=', 1)
+        bookmark = Bookmark.objects.select_related('content').get(pk=rows[0]['id'])
+        self.assertEqual(rows[0]['content'], bookmark.content_id)
+        self.assertEqual(rows[0]['course'], bookmark.content.course_id_id)
+
+    def test_bookmarks_nested_expand(self):
+        rows = self.get('/api/v1/bookmarks/?expand=content&fields=content', 1)
+        content = rows[0]['content']
+        self.assertEqual(set(content), CONTENT_FIELDS)
+        # content diperluas, course di dalamnya tidak: cukup id dari kolom foreign key
+        self.assertIsInstance(content['course_id'], int)
+
+        rows = self.get('/api/v1/bookmarks/?expand=content.course_id&fields=content.course_id', 1)
+        self.assertEqual(set(rows[0]['content']), {'course_id'})
+        self.assertEqual(set(rows[0]['content']['course_id']), COURSE_FIELDS)
+        self.assertIsInstance(rows[0]['content']['course_id']['category'], int)
+
+    def test_announcements_feed_fields(self):
+        rows = self.get('/api/v1/announcements/', 1)
+        self.assertEqual(set(rows[0]), {'id', 'course', 'teacher', 'title', 'content', 'created_at', 'updated_at'})
+        self.assertEqual(rows[0]['teacher'], 'fields_teacher')
+        self.assertEqual(set(rows[0]['course']), COURSE_FIELDS)
+
+        rows = self.get('/api/v1/announcements/?fields=title,teacher', 1)
+        self.assertEqual([set(row) for row in rows], [{'title', 'teacher'}] * 3)
+        self.assertEqual(rows[0]['teacher'], 'fields_teacher')
+
+    def test_announcements_expand(self):
+        # 3 query validator ETag + ambil course + 1 query daftar
+        rows = self.get(f'/api/v1/courses/{self.course.pk}/announcements/?expand=', 5)
+        self.assertEqual(rows, [{
+            **rows[0], 'course': self.course.pk, 'title': 'Info 2', 'teacher': 'fields_teacher',
+        }])
+
+        rows = self.get(f'/api/v1/courses/{self.course.pk}/announcements/?fields=course.name,course.category.name', 5)
+        self.assertEqual(rows, [{'course': {'name': 'Kursus 2', 'category': {'name': 'Sains'}}}])
+
+    def test_contents_fields_and_expand(self):
+        rows = self.get('/api/v1/contents/?fields=id,name', 1)
+        self.assertEqual([set(row) for row in rows], [{'id', 'name'}] * 3)
+
+        rows = self.get('/api/v1/contents/?fields=name,course_id.name&expand=course_id', 1)
+        self.assertEqual(sorted(row['course_id']['name'] for row in rows), ['Kursus 0', 'Kursus 1', 'Kursus 2'])
+        self.assertEqual(set(rows[0]), {'name', 'course_id'})
+
+        rows = self.get('/api/v1/contents/?expand=', 1)
+        self.assertEqual(set(rows[0]), CONTENT_FIELDS)
+        self.assertIsInstance(rows[0]['course_id'], int)
+
+    def test_unknown_field_is_ignored(self):
+        rows = self.get('/api/v1/contents/?fields=name,tidak_ada', 1)
+        self.assertEqual([set(row) for row in rows], [{'name'}] * 3)
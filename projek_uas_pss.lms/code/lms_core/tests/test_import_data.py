@@ -0,0 +1,133 @@
+import json
+import shutil
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+
+from lms_core.management.commands.import_lms_data import Command, _copy_value
+from lms_core.models import Comment, Course, CourseContent, CourseMember, content_path_segment
+
+USERS = """firstname,lastname,email,password,username
+Ani,Lestari,ani@example.com,rahasia1,ani
+Budi,Santoso,budi@example.com,rahasia2,budi
+Citra,Dewi,citra@example.com,rahasia3,citra
+"""
+COURSES = """name,url,description,site,price,teacher
+Kalkulus,https://example.com/1,"Limit, turunan",Coursera,100000,1
+Statistika,https://example.com/2,Peluang,Coursera,200000,1
+Yatim,https://example.com/3,Pengajar tidak ada,Coursera,0,99
+"""
+MEMBERS = """course_id,user_id,roles
+1,2,"std"
+1,2,"std"
+2,3,"ast"
+5,2,"std"
+"""
+CONTENTS = [
+    {"video_url": "http://example.com/a", "course_id": 1, "name": "Limit", "description": "-"},
+    {"video_url": "http://example.com/b", "course_id": 2, "name": "Peluang", "description": "-"},
+    {"video_url": "http://example.com/d", "course_id": 1, "name": "Turunan", "description": "-"},
+    # "Sudah ada" dicek dari nomor baris (= id), jadi baris yang dilewati diletakkan di akhir
+    {"video_url": "http://example.com/c", "course_id": 9, "name": "Yatim", "description": "-"},
+]
+COMMENTS = [
+    {"content_id": 1, "user_id": 2, "comment": "Jelas"},
+    {"content_id": 2, "user_id": 3, "comment": "Mantap"},
+    {"content_id": 1, "user_id": 3, "comment": "Bukan member kursus 1"},
+]
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class ImportLmsDataTests(TransactionTestCase):
+    # File contoh merujuk id (teacher, course_id, ...) mulai dari 1
+    reset_sequences = True
+
+    def setUp(self):
+        self.data_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.data_dir)
+        (self.data_dir / 'user-data.csv').write_text(USERS)
+        (self.data_dir / 'course-data.csv').write_text(COURSES)
+        (self.data_dir / 'member-data.csv').write_text(MEMBERS)
+        (self.data_dir / 'contents.json').write_text(json.dumps(CONTENTS))
+        (self.data_dir / 'comments.json').write_text(json.dumps(COMMENTS))
+
+    def run_import(self):
+        out = StringIO()
+        call_command('import_lms_data', data_dir=str(self.data_dir), batch_size=2, stdout=out)
+        return out.getvalue()
+
+    def test_imports_rows_and_skips_invalid_references(self):
+        output = self.run_import()
+
+        self.assertEqual(list(User.objects.order_by('id').values_list('username', flat=True)), ['ani', 'budi', 'citra'])
+        self.assertTrue(User.objects.get(username='budi').check_password('rahasia2'))
+        self.assertEqual(list(Course.objects.order_by('id').values_list('name', 'teacher_id')),
+                         [('Kalkulus', 1), ('Statistika', 1)])
+        # Duplikat dan course yang tidak ada dilewati
+        self.assertEqual(sorted(CourseMember.objects.values_list('course_id', 'user_id', 'roles')),
+                         [(1, 2, 'std'), (2, 3, 'ast')])
+        self.assertEqual(sorted(Comment.objects.values_list('comment', 'member_id__user_id')),
+                         [('Jelas', 2), ('Mantap', 3)])
+        self.assertIn('members', output)
+
+    def test_fills_content_paths(self):
+        self.run_import()
+        contents = CourseContent.objects.order_by('id')
+        self.assertEqual([content.name for content in contents], ['Limit', 'Peluang', 'Turunan'])
+        for content in contents:
+            self.assertEqual((content.path, content.depth), (content_path_segment(content.pk), 0))
+        # Path hasil import dipakai save() berikutnya untuk konten anak
+        root = contents[0]
+        child = CourseContent.objects.create(name='Limit kiri', course_id_id=root.course_id_id, parent_id=root)
+        self.assertEqual(child.path, root.path + content_path_segment(child.pk))
+
+    def test_second_run_skips_existing_rows(self):
+        self.run_import()
+        self.run_import()
+        self.assertEqual(User.objects.count(), 3)
+        self.assertEqual(Course.objects.count(), 2)
+        self.assertEqual(CourseMember.objects.count(), 2)
+        self.assertEqual(CourseContent.objects.count(), 3)
+        self.assertEqual(Comment.objects.count(), 2)
+
+
+class CopyTests(TestCase):
+    def copy_sql(self, raw_cursor):
+        cursor = mock.MagicMock()
+        cursor.__enter__.return_value.cursor = raw_cursor
+        comments = [Comment(content_id_id=5, member_id_id=7, comment='baris\tdengan\nspasi\\'),
+                    Comment(content_id_id=6, member_id_id=8, comment='kedua')]
+        with mock.patch.object(connection, 'cursor', return_value=cursor):
+            Command()._copy(Comment, comments)
+
+    def test_psycopg2_uses_copy_expert(self):
+        raw = mock.Mock(spec=['copy_expert'])
+        self.copy_sql(raw)
+        sql, buffer = raw.copy_expert.call_args.args
+        self.assertEqual(sql, 'COPY "lms_core_comment" ("content_id_id", "member_id_id", "comment", '
+                              '"created_at", "updated_at") FROM STDIN')
+        lines = buffer.getvalue().splitlines()
+        self.assertEqual([line.split('\t')[:3] for line in lines],
+                         [['5', '7', 'baris\\tdengan\\nspasi\\\\'], ['6', '8', 'kedua']])
+
+    def test_psycopg3_uses_copy_context(self):
+        raw = mock.Mock(spec=['copy'])
+        raw.copy.return_value = mock.MagicMock()
+        self.copy_sql(raw)
+        sql = raw.copy.call_args.args[0]
+        self.assertTrue(sql.startswith('COPY "lms_core_comment" '))
+        written = raw.copy.return_value.__enter__.return_value.write.call_args.args[0]
+        self.assertEqual(len(written.splitlines()), 2)
+
+
+class CopyValueTests(SimpleTestCase):
+    def test_copy_value(self):
+        self.assertEqual(_copy_value(None), '\\N')
+        self.assertEqual((_copy_value(True), _copy_value(False)), ('t', 'f'))
+        self.assertEqual(_copy_value('a\r\nb'), 'a\\r\\nb')
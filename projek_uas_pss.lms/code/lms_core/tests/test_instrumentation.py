@@ -0,0 +1,57 @@
+import re
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from rest_framework.renderers import JSONRenderer
+
+from lms_core.instrumentation import database_pool_stats
+
+
+class UnusedPool:
+    """Alias yang belum pernah dipakai: membaca pool-nya akan membuat pool baru."""
+
+    alias = 'replica'
+    connection = None
+
+    @property
+    def pool(self):
+        raise AssertionError('pool dibuat untuk alias yang tidak dipakai')
+
+
+class DatabasePoolStatsTests(SimpleTestCase):
+    def test_reads_only_open_pooled_connections(self):
+        pooled = SimpleNamespace(alias='default', connection=object(),
+                                 pool=mock.Mock(**{'get_stats.return_value': {'pool_size': 4}}))
+        unpooled = SimpleNamespace(alias='sqlite', connection=object())  # Backend tanpa pool
+        connections = mock.Mock(**{'all.return_value': [pooled, UnusedPool(), unpooled]})
+        with mock.patch('lms_core.instrumentation.connections', connections):
+            self.assertEqual(database_pool_stats(), {'default': {'pool_size': 4}})
+        connections.all.assert_called_once_with(initialized_only=True)
+
+
+def server_timing(response):
+    return {name: float(duration) for name, duration in re.findall(r'(\w+);dur=([\d.]+)', response['Server-Timing'])}
+
+
+class ServerTimingTests(TestCase):
+    def test_rendering_counts_as_serialization(self):
+        render = JSONRenderer.render
+
+        def slow_render(renderer, *args, **kwargs):
+            time.sleep(0.02)
+            return render(renderer, *args, **kwargs)
+
+        # Respons 401 DRF: tidak ada timed_serialization di view, hanya render
+        with mock.patch.object(JSONRenderer, 'render', autospec=True, side_effect=slow_render):
+            response = self.client.get('/api/v1/bookmarks/')
+        self.assertEqual(response.status_code, 401)
+        timing = server_timing(response)
+        self.assertGreaterEqual(timing['serialize'], 20)
+        self.assertGreaterEqual(timing['total'], timing['serialize'])
+
+    def test_plain_response_has_no_serialization_time(self):
+        timing = server_timing(self.client.get('/'))
+        self.assertEqual(timing['serialize'], 0)
+        self.assertEqual(timing['db'], 0)
@@ -0,0 +1,45 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from lms_core.models import Course, CourseContent, Profile
+from lms_core.serializers import RoleTokenObtainPairSerializer
+
+
+@override_settings(LMS_RESPONSE_CACHE=True)
+class NinjaReadApiTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        teacher = User.objects.create(username='ninja_teacher', first_name='Guru')
+        Profile.objects.create(user=teacher, role='teacher')
+        courses = Course.objects.bulk_create(
+            Course(name=f'ninja {i}', description='-', price=i, teacher=teacher) for i in range(3)
+        )
+        CourseContent.objects.bulk_create(CourseContent(name=f'materi {course.pk}', course_id=course) for course in courses)
+        cls.authorization = f'Bearer {RoleTokenObtainPairSerializer.get_token(teacher).access_token}'
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, path):
+        return self.client.get(path, HTTP_AUTHORIZATION=self.authorization)
+
+    def test_courses_share_the_course_list_cache(self):
+        first = self.get('/api/ninja/v1/courses')
+        self.assertEqual([course['name'] for course in first.json()], ['ninja 0', 'ninja 1', 'ninja 2'])
+        self.assertEqual(first.json()[0]['teacher']['first_name'], 'Guru')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get('/api/ninja/v1/courses').json(), first.json())
+
+        # Signal yang sama dengan API DRF membuang cache saat course berubah
+        with self.captureOnCommitCallbacks(execute=True):
+            course = Course.objects.get(name='ninja 2')
+            course.name = 'ninja baru'
+            course.save()
+        self.assertEqual(self.get('/api/ninja/v1/courses').json()[2]['name'], 'ninja baru')
+
+    def test_contents_lists_every_course(self):
+        response = self.get('/api/ninja/v1/contents?limit=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 2)
+        self.assertEqual(len(self.get('/api/ninja/v1/contents').json()), 3)
@@ -0,0 +1,28 @@
+from urllib.parse import urlsplit
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+
+class UserListPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.bulk_create(User(username=f'page_user_{i}') for i in range(7))
+
+    def test_pages_follow_primary_key(self):
+        path, usernames, pages = '/api/users/?page_size=3', [], []
+        while path:
+            with CaptureQueriesContext(connection) as queries:
+                body = self.client.get(path).json()
+            pages.append(queries.captured_queries[-1]['sql'])
+            usernames += [user['username'] for user in body['results']]
+            path = body['next'] and '{0.path}?{0.query}'.format(urlsplit(body['next']))
+
+        expected = list(User.objects.order_by('id').values_list('username', flat=True))
+        self.assertEqual(usernames, expected)
+        self.assertEqual(len(pages), 3)
+        # Kunci seek hanya id, jadi cukup index primary key
+        self.assertIn('ORDER BY "auth_user"."id" ASC', pages[-1])
+        self.assertNotIn('date_joined" >', pages[-1])
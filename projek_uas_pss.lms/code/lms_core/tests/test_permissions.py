@@ -0,0 +1,46 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from lms_core.models import Profile
+
+FAST_HASHER = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHER)
+class RoleClaimTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = User.objects.create_user(username='claim_student', password='rahasia')
+        cls.teacher = User.objects.create_user(username='claim_teacher', password='rahasia', is_staff=True)
+        Profile.objects.create(user=cls.student, role='student')
+        Profile.objects.create(user=cls.teacher, role='teacher')
+
+    def login(self, user):
+        response = self.client.post('/api/login/', {'username': user.username, 'password': 'rahasia'},
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_obtain_issues_role_and_staff_claims(self):
+        student = AccessToken(self.login(self.student)['access'])
+        teacher = AccessToken(self.login(self.teacher)['access'])
+        self.assertEqual((student['role'], student['is_staff']), ('student', False))
+        self.assertEqual((teacher['role'], teacher['is_staff']), ('teacher', True))
+
+    def test_refresh_rereads_claims(self):
+        refresh = self.login(self.student)['refresh']
+        Profile.objects.filter(user=self.student).update(role='teacher')
+        User.objects.filter(pk=self.student.pk).update(is_staff=True)
+        response = self.client.post('/api/token/refresh/', {'refresh': refresh}, content_type='application/json')
+        access = AccessToken(response.json()['access'])
+        self.assertEqual((access['role'], access['is_staff']), ('teacher', True))
+
+    def test_token_without_role_claim_falls_back_to_profile(self):
+        for user, expected in ((self.student, 200), (self.teacher, 403)):
+            token = AccessToken.for_user(user)  # Token lama: tanpa claim role
+            self.assertNotIn('role', token)
+            with self.subTest(user=user.username):
+                # ShowBookmarksView: autentikasi stateless (RoleTokenUser tanpa relasi profile) + IsStudent
+                response = self.client.get('/api/v1/bookmarks/', HTTP_AUTHORIZATION=f'Bearer {token}')
+                self.assertEqual(response.status_code, expected)
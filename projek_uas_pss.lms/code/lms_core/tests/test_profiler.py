@@ -0,0 +1,59 @@
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+
+from lms_core.serializers import RoleTokenObtainPairSerializer
+
+
+def _authorization(user):
+    return f'Bearer {RoleTokenObtainPairSerializer.get_token(user).access_token}'
+
+
+class ProfilerMiddlewareTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.profile_dir = tempfile.mkdtemp()
+        cls.profiler_override = override_settings(LMS_PROFILER_ENABLED=True, LMS_PROFILER_DIR=cls.profile_dir)
+        cls.profiler_override.enable()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls.profiler_override.disable()
+        shutil.rmtree(cls.profile_dir, ignore_errors=True)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create(username='profiler_staff', is_staff=True)
+        cls.user = User.objects.create(username='profiler_user')
+
+    def get(self, user=None, **headers):
+        if user is not None:
+            headers['HTTP_AUTHORIZATION'] = _authorization(user)
+        return self.client.get('/api/users/', **headers)
+
+    def test_staff_request_is_profiled(self):
+        switch_interval = sys.getswitchinterval()
+        response = self.get(self.staff, HTTP_X_PROFILE='1')
+        self.assertEqual(response.status_code, 200)
+        profile_id = response['X-Profile-Id']
+        self.assertTrue((Path(self.profile_dir) / f'{profile_id}.collapsed').exists())
+        self.assertTrue((Path(self.profile_dir) / f'{profile_id}.txt').read_text().startswith('GET /api/users/'))
+        # Setting global interpreter tidak disentuh
+        self.assertEqual(sys.getswitchinterval(), switch_interval)
+
+    def test_other_requests_are_not_profiled(self):
+        cases = [
+            ('non-staff', self.get(self.user, HTTP_X_PROFILE='1')),
+            ('anonymous', self.get(HTTP_X_PROFILE='1')),
+            ('invalid token', self.get(HTTP_X_PROFILE='1', HTTP_AUTHORIZATION='Bearer invalid')),
+            ('no header', self.get(self.staff)),
+        ]
+        for name, response in cases:
+            with self.subTest(name):
+                self.assertNotIn('X-Profile-Id', response)
@@ -0,0 +1,65 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+
+from lms_core.enrollment import bulk_enroll_students
+from lms_core.models import Category, Course, CourseMember, Profile
+from lms_core.serializers import UserProfileSerializer
+
+# Ukuran dibuat kecil supaya INSERT di SQLite tidak dipecah per 999 parameter
+SIZES = [2, 10, 100]
+
+# User + profile (join), kursus yang diikuti, kursus yang dibuat (lihat UserProfileSerializer.setup_eager_loading)
+PROFILE_QUERY_BUDGET = 3
+
+
+class ProfileQueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = Category.objects.create(name='budget_category')
+        cls.teacher = User.objects.create(username='budget_teacher')
+        cls.student = User.objects.create(username='budget_student')
+        Profile.objects.create(user=cls.teacher, role='teacher')
+        Profile.objects.create(user=cls.student, role='student')
+
+    def test_profile_queries_do_not_grow_with_courses(self):
+        created = 0
+        for size in SIZES:
+            courses = Course.objects.bulk_create(
+                Course(name=f'budget {i}', description='-', price=0, teacher=self.teacher, category=self.category)
+                for i in range(created, size)
+            )
+            CourseMember.objects.bulk_create(CourseMember(course_id=course, user_id=self.student) for course in courses)
+            created = size
+
+            for user in (self.student, self.teacher):
+                with self.subTest(courses=size, role=user.profile.role):
+                    with self.assertNumQueries(PROFILE_QUERY_BUDGET):
+                        instance = UserProfileSerializer.setup_eager_loading(User.objects.all()).get(pk=user.pk)
+                        data = UserProfileSerializer(instance).data
+                    if user is self.student:
+                        self.assertEqual(len(data['courses_joined']), size)
+                    else:
+                        self.assertEqual(len(data['courses_created']), size)
+
+
+class EnrollQueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create(username='enroll_budget_teacher')
+        Profile.objects.create(user=cls.teacher, role='teacher')
+        cls.students = User.objects.bulk_create(User(username=f'enroll_budget_{i}') for i in range(max(SIZES)))
+        Profile.objects.bulk_create(Profile(user=student, role='student') for student in cls.students)
+
+    def test_enroll_queries_do_not_grow_with_batch(self):
+        missing_id = max(student.id for student in self.students) + 1
+        for size in SIZES:
+            course = Course.objects.create(name=f'enroll budget {size}', description='-', price=0, teacher=self.teacher)
+            # Sebagian sudah terdaftar, plus id yang tidak ada dan seorang teacher: semua cabang ikut dihitung
+            CourseMember.objects.create(course_id=course, user_id=self.students[0])
+            student_ids = [student.id for student in self.students[:size]] + [missing_id, self.teacher.id]
+            with self.subTest(size=size), self.assertNumQueries(3):
+                enrolled, not_found, invalid_role = bulk_enroll_students(course, student_ids)
+            self.assertEqual(enrolled, [student.username for student in self.students[1:size]])
+            self.assertEqual(not_found, [missing_id])
+            self.assertEqual(invalid_role, [self.teacher.username])
+            self.assertEqual(CourseMember.objects.filter(course_id=course).count(), size)
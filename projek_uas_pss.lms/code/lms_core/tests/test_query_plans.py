@@ -0,0 +1,62 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from lms_core.management.commands.check_query_plans import _pg_scanned_tables
+
+
+class CheckQueryPlansTests(TestCase):
+    def test_hot_paths_use_indexes(self):
+        try:
+            call_command('check_query_plans', courses=20, contents=3, stdout=StringIO())
+        except CommandError as error:
+            self.fail(str(error))
+
+    def test_missing_index_is_reported(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP INDEX {connection.ops.quote_name('course_name_idx')}")
+        # Jumlah seed beda dari tes lain: cache statement sqlite3 bisa mengembalikan
+        # hasil EXPLAIN lama untuk teks SQL yang sama persis
+        with self.assertRaisesMessage(CommandError, 'course-by-name'):
+            call_command('check_query_plans', courses=30, contents=3, stdout=StringIO())
+
+
+class PostgresPlanParsingTests(SimpleTestCase):
+    def test_seq_scan(self):
+        plan = [
+            "Limit  (cost=0.00..1.05 rows=1 width=8)",
+            "  ->  Seq Scan on lms_core_course  (cost=0.00..21.00 rows=20 width=8)",
+            "        Filter: ((name)::text = 'x'::text)",
+        ]
+        self.assertEqual(_pg_scanned_tables(plan), {'lms_core_course'})
+
+    def test_index_scan_with_only_filter(self):
+        plan = [
+            "Limit  (cost=0.15..8.17 rows=1 width=8)",
+            "  ->  Index Scan using lms_core_course_pkey on lms_core_course  (cost=0.15..8.17 rows=1 width=8)",
+            "        Filter: ((name)::text = 'x'::text)",
+        ]
+        self.assertEqual(_pg_scanned_tables(plan), {'lms_core_course'})
+
+    def test_index_scan_with_index_cond(self):
+        plan = [
+            "Nested Loop  (cost=0.30..16.35 rows=1 width=8)",
+            "  ->  Index Only Scan using coursemember_user_course_idx on lms_core_coursemember"
+            "  (cost=0.15..8.17 rows=1 width=8)",
+            "        Index Cond: ((user_id_id = 2) AND (course_id_id = 3))",
+            "  ->  Index Scan Backward using announcement_feed_idx on lms_core_courseannouncement"
+            "  (cost=0.15..8.17 rows=1 width=8)",
+            "        Index Cond: (course_id = lms_core_coursemember.course_id_id)",
+            "        Filter: (title IS NOT NULL)",
+        ]
+        self.assertEqual(_pg_scanned_tables(plan), set())
+
+    def test_index_scan_for_ordering_only(self):
+        plan = [
+            "Limit  (cost=0.15..0.95 rows=20 width=8)",
+            "  ->  Index Scan using course_created_id_idx on lms_core_course  (cost=0.15..40.15 rows=1000 width=8)",
+        ]
+        self.assertEqual(_pg_scanned_tables(plan), set())
@@ -0,0 +1,77 @@
+from django.core.cache import cache
+from django.db import router
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from lms_core import routers
+from lms_core.middleware import ReplicaRoutingMiddleware
+from lms_core.models import Course
+
+
+@override_settings(LMS_REPLICA_DATABASES=['replica'], LMS_REPLICA_MIGRATE=False)
+class ReplicaRoutingTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        token = AccessToken()
+        token['user_id'] = 42
+        self.authorization = f'Bearer {token}'
+
+    def _call(self, method, view, status=200):
+        """Jalankan ``view`` di balik ReplicaRoutingMiddleware; kembalikan alias yang tercatat view."""
+        seen = []
+
+        def get_response(request):
+            view(seen)
+            return HttpResponse(status=status)
+
+        request = getattr(self.factory, method)('/api/v1/courses/', HTTP_AUTHORIZATION=self.authorization)
+        ReplicaRoutingMiddleware(get_response)(request)
+        return seen
+
+    @staticmethod
+    def _read(seen):
+        seen.append(router.db_for_read(Course))
+
+    def test_reads_go_to_replica_and_writes_to_default(self):
+        def view(seen):
+            self._read(seen)
+            seen.append(router.db_for_write(Course))
+
+        self.assertEqual(self._call('get', view), ['replica', 'default'])
+
+    def test_reads_after_write_in_same_request_use_primary(self):
+        def view(seen):
+            self._read(seen)
+            router.db_for_write(Course)
+            self._read(seen)
+
+        self.assertEqual(self._call('get', view), ['replica', 'default'])
+
+    def test_read_only_request_does_not_pin(self):
+        self._call('get', self._read)
+        self.assertEqual(self._call('get', self._read), ['replica'])
+
+    def test_write_in_safe_request_pins_user(self):
+        self._call('get', lambda seen: router.db_for_write(Course))
+        self.assertEqual(self._call('get', self._read), ['default'])
+
+    def test_successful_post_pins_user(self):
+        self._call('post', lambda seen: None)
+        self.assertEqual(self._call('get', self._read), ['default'])
+
+    def test_failed_post_does_not_pin(self):
+        self._call('post', lambda seen: None, status=400)
+        self.assertEqual(self._call('get', self._read), ['replica'])
+
+    def test_outside_request_uses_default(self):
+        self.assertEqual(router.db_for_read(Course), 'default')
+        self.assertIsNone(routers.read_alias())
+
+    def test_replica_migrations_need_flag(self):
+        replica_router = routers.ReplicaRouter()
+        self.assertIs(replica_router.allow_migrate('replica', 'lms_core'), False)
+        self.assertIsNone(replica_router.allow_migrate('default', 'lms_core'))
+        with override_settings(LMS_REPLICA_MIGRATE=True):
+            self.assertIsNone(replica_router.allow_migrate('replica', 'lms_core'))
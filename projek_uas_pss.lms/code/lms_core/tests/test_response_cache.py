@@ -0,0 +1,53 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from lms_core.models import Category, Course, Profile
+from lms_core.serializers import RoleTokenObtainPairSerializer
+
+
+class ResponseCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create(username='cache_teacher')
+        Profile.objects.create(user=cls.teacher, role='teacher')
+        cls.category = Category.objects.create(name='kategori lama')
+        Course.objects.create(name='cache 0', description='-', price=0, teacher=cls.teacher, category=cls.category)
+        cls.authorization = f'Bearer {RoleTokenObtainPairSerializer.get_token(cls.teacher).access_token}'
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, path):
+        return self.client.get(path, HTTP_AUTHORIZATION=self.authorization).json()
+
+    def course_names(self):
+        return [course['name'] for course in self.get('/api/v1/courses/')['results']]
+
+    @override_settings(LMS_RESPONSE_CACHE=True)
+    def test_course_write_invalidates_course_list(self):
+        self.assertEqual(self.course_names(), ['cache 0'])
+        # Tanpa commit signal belum jalan: respons masih dari cache
+        Course.objects.create(name='belum commit', description='-', price=0, teacher=self.teacher)
+        self.assertEqual(self.course_names(), ['cache 0'])
+        with self.captureOnCommitCallbacks(execute=True):
+            Course.objects.create(name='cache 1', description='-', price=0, teacher=self.teacher)
+        self.assertEqual(self.course_names(), ['cache 0', 'belum commit', 'cache 1'])
+
+    @override_settings(LMS_RESPONSE_CACHE=True)
+    def test_category_write_invalidates_categories_and_courses(self):
+        self.assertEqual(self.get('/api/v1/courses/')['results'][0]['category']['name'], 'kategori lama')
+        self.assertEqual([row['name'] for row in self.get('/api/v1/categories/')['data']], ['kategori lama'])
+
+        self.category.name = 'kategori baru'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.category.save()
+        self.assertEqual(self.get('/api/v1/courses/')['results'][0]['category']['name'], 'kategori baru')
+        self.assertEqual([row['name'] for row in self.get('/api/v1/categories/')['data']], ['kategori baru'])
+
+    @override_settings(LMS_RESPONSE_CACHE=False)
+    def test_disabled_without_shared_cache(self):
+        self.assertEqual(self.course_names(), ['cache 0'])
+        # Worker lain yang menulis tidak bisa meng-invalidasi cache proses ini, jadi tidak ada cache sama sekali
+        Course.objects.create(name='worker lain', description='-', price=0, teacher=self.teacher)
+        self.assertEqual(self.course_names(), ['cache 0', 'worker lain'])
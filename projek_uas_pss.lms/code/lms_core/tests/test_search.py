@@ -0,0 +1,82 @@
+from unittest import skipUnless
+from urllib.parse import urlsplit
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+
+from lms_core.models import Course, CourseContent
+from lms_core.search import search
+from lms_core.serializers import RoleTokenObtainPairSerializer
+
+
+@skipUnless(connection.vendor == 'sqlite', 'Index FTS5 hanya ada di SQLite')
+class SqliteSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = User.objects.create(username='search_teacher')
+        cls.course = Course.objects.create(name='Aljabar Linear', description='matriks dan vektor', price=0,
+                                           teacher=cls.teacher)
+        cls.other = Course.objects.create(name='Kalkulus', description='turunan dan integral', price=0,
+                                          teacher=cls.teacher)
+        cls.content = CourseContent.objects.create(name='Determinan', description='determinan matriks persegi',
+                                                   course_id=cls.course)
+        cls.authorization = f'Bearer {RoleTokenObtainPairSerializer.get_token(cls.teacher).access_token}'
+
+    def hits(self, query, **kwargs):
+        return [(hit['type'], hit['id']) for hit in search(query, **kwargs)]
+
+    def test_insert_is_indexed(self):
+        self.assertEqual(self.hits('kalkulus'), [('course', self.other.pk)])
+        hit = search('determinan')[0]
+        self.assertEqual((hit['type'], hit['id'], hit['course_id']), ('content', self.content.pk, self.course.pk))
+
+    def test_update_reindexes(self):
+        self.other.name = 'Statistika'
+        self.other.save()
+        self.assertEqual(self.hits('kalkulus'), [])
+        self.assertEqual(self.hits('statistika'), [('course', self.other.pk)])
+
+        self.content.course_id = self.other
+        self.content.save()
+        self.assertEqual(search('determinan')[0]['course_id'], self.other.pk)
+
+    def test_delete_removes_from_index(self):
+        self.content.delete()
+        self.assertEqual(self.hits('determinan'), [])
+
+    def test_name_match_ranks_first(self):
+        # "matriks" ada di deskripsi course dan konten, tapi hanya nama konten ini yang memuatnya
+        named = CourseContent.objects.create(name='Matriks', description='pengantar', course_id=self.course)
+        self.assertEqual(self.hits('matriks')[0], ('content', named.pk))
+        ranks = [hit['rank'] for hit in search('matriks')]
+        self.assertEqual(ranks, sorted(ranks, reverse=True))
+
+    def test_query_syntax_is_escaped(self):
+        self.assertEqual(self.hits('matriks" (*:^'), self.hits('matriks'))
+        # Operator FTS5 diperlakukan sebagai kata biasa, bukan sintaks
+        self.assertEqual(self.hits('matriks OR kalkulus'), [])
+        self.assertEqual(search('***'), [])
+
+    def get(self, **params):
+        return self.client.get('/api/v1/search/', params, HTTP_AUTHORIZATION=self.authorization)
+
+    def test_type_filter(self):
+        self.assertEqual({hit['type'] for hit in self.get(q='matriks', type='content').json()['data']}, {'content'})
+        self.assertEqual({hit['type'] for hit in self.get(q='matriks', type='course').json()['data']}, {'course'})
+        self.assertEqual(self.get(q='matriks', type='user').status_code, 400)
+        self.assertEqual(self.get(q=' ').status_code, 400)
+
+    def test_pagination(self):
+        CourseContent.objects.bulk_create(
+            CourseContent(name=f'Latihan {i}', description='soal latihan', course_id=self.other) for i in range(5)
+        )
+        params, seen, pages = {'q': 'latihan', 'page_size': 2}, [], 0
+        while params:
+            body = self.get(**params).json()
+            pages += 1
+            seen += [hit['id'] for hit in body['data']]
+            self.assertEqual(body['previous'] is None, pages == 1)
+            params = body['next'] and dict(pair.split('=') for pair in urlsplit(body['next']).query.split('&'))
+        self.assertEqual(pages, 3)
+        self.assertCountEqual(seen, CourseContent.objects.filter(name__startswith='Latihan').values_list('id', flat=True))
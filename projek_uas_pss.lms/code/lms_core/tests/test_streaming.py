@@ -0,0 +1,35 @@
+import json
+
+from django.contrib.auth.models import User
+from django.test import AsyncClient, TestCase, override_settings
+
+from lms_core.models import Course, Profile
+from lms_core.serializers import RoleTokenObtainPairSerializer
+
+
+@override_settings(LMS_STREAM_CHUNK_SIZE=3)
+class StreamJsonArrayTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        teacher = User.objects.create(username='stream_teacher')
+        Profile.objects.create(user=teacher, role='teacher')
+        Course.objects.bulk_create(
+            Course(name=f'stream {i}', description='-', price=i, teacher=teacher) for i in range(7)
+        )
+        cls.authorization = f'Bearer {RoleTokenObtainPairSerializer.get_token(teacher).access_token}'
+        cls.names = [f'stream {i}' for i in range(7)]
+
+    def test_wsgi_streams_whole_catalog(self):
+        response = self.client.get('/api/v1/courses/?stream=1', HTTP_AUTHORIZATION=self.authorization)
+        self.assertFalse(response.is_async)
+        rows = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([row['name'] for row in rows], self.names)
+
+    async def test_asgi_streams_one_chunk_at_a_time(self):
+        response = await AsyncClient().get('/api/v1/courses/?stream=1', headers={'Authorization': self.authorization})
+        self.assertEqual(response.status_code, 200)
+        # Iterator async: Django tidak mengumpulkan seluruh respons dengan sync_to_async(list)
+        self.assertTrue(response.is_async)
+        parts = [part async for part in response.streaming_content]
+        self.assertEqual(len(parts), 1 + 3 + 1)  # '[', tiga batch (3+3+1 baris), ']'
+        self.assertEqual([row['name'] for row in json.loads(b''.join(parts))], self.names)
@@ -0,0 +1,75 @@
+from unittest import mock
+
+from django.conf import settings
+from django.test import SimpleTestCase
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken
+
+from lms_core.authentication import StatelessJWTAuthentication, VerifiedTokenCache, token_cache
+
+
+def access_token(user_id):
+    token = AccessToken()
+    token['user_id'] = user_id
+    return token
+
+
+class VerifiedTokenCacheTests(SimpleTestCase):
+    def test_entry_expires_at_exp(self):
+        cache, token = VerifiedTokenCache(4), access_token(1)
+        cache.put(str(token), token)
+        with mock.patch('lms_core.authentication.time.time', return_value=token['exp'] - 1):
+            self.assertIs(cache.get(str(token)), token)
+        with mock.patch('lms_core.authentication.time.time', return_value=token['exp']):
+            self.assertIsNone(cache.get(str(token)))
+        # Entri kedaluwarsa langsung dibuang
+        self.assertEqual(cache.stats()['size'], 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = VerifiedTokenCache(2)
+        first, second, third = (access_token(user_id) for user_id in (1, 2, 3))
+        cache.put(str(first), first)
+        cache.put(str(second), second)
+        cache.get(str(first))  # first jadi yang paling baru dipakai
+        cache.put(str(third), third)
+        self.assertIs(cache.get(str(first)), first)
+        self.assertIsNone(cache.get(str(second)))
+        self.assertIs(cache.get(str(third)), third)
+        self.assertEqual(cache.stats()['size'], 2)
+
+    def test_zero_size_disables_cache(self):
+        cache, token = VerifiedTokenCache(0), access_token(1)
+        cache.put(str(token), token)
+        self.assertIsNone(cache.get(str(token)))
+
+    def test_shared_cache_uses_setting(self):
+        self.assertEqual(token_cache.maxsize, getattr(settings, 'LMS_JWT_CACHE_SIZE', 10000))
+
+
+class CachedTokenValidationTests(SimpleTestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.addCleanup(token_cache.clear)
+
+    def test_verified_token_is_served_from_cache(self):
+        raw = str(access_token(1)).encode()
+        auth = StatelessJWTAuthentication()
+        verify = JWTAuthentication.get_validated_token
+        with mock.patch.object(JWTAuthentication, 'get_validated_token', autospec=True, side_effect=verify) as verified:
+            first = auth.get_validated_token(raw)
+            second = auth.get_validated_token(raw)
+        self.assertIs(first, second)
+        self.assertEqual(verified.call_count, 1)
+
+    def test_changed_signature_misses_cache(self):
+        raw = str(access_token(1))
+        auth = StatelessJWTAuthentication()
+        auth.get_validated_token(raw.encode())
+        header, payload, signature = raw.split('.')
+        forged = '.'.join((header, payload, signature[:-2] + ('AA' if signature[-2:] != 'AA' else 'BB')))
+        # Header dan payload sama, tanda tangan beda: kunci cache beda, jadi diverifikasi ulang dan ditolak
+        self.assertIsNone(token_cache.get(forged))
+        with self.assertRaises(InvalidToken):
+            auth.get_validated_token(forged.encode())
+        self.assertIsNone(token_cache.get(forged))
@@ -0,0 +1,130 @@
+import logging
+import posixpath
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connections, transaction
+from django.db.models import Q
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from lms_core.cache import invalidate
+from lms_core.models import Course, Profile
+
+logger = logging.getLogger(__name__)
+
+# model -> (field gambar, field peta varian, namespace cache yang ikut berubah)
+TARGETS = {
+    Course: ('image', 'image_variants', 'courses'),
+    Profile: ('profile_picture', 'profile_picture_variants', None),
+}
+
+EXTENSIONS = {'WEBP': 'webp', 'JPEG': 'jpg'}
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def image_variants():
+    return getattr(settings, 'LMS_IMAGE_VARIANTS', {'thumb': 160, 'card': 640})
+
+
+def variant_name(name, variant, image_format):
+    """``course/foto.png`` -> ``course/variants/foto.thumb.webp``"""
+    directory, filename = posixpath.split(name)
+    stem = posixpath.splitext(filename)[0]
+    return posixpath.join(directory, 'variants', f'{stem}.{variant}.{EXTENSIONS[image_format]}')
+
+
+def render_variant(image, size, image_format, quality):
+    resized = image.copy()
+    resized.thumbnail((size, size), Image.Resampling.LANCZOS)  # Hanya mengecilkan, rasio tetap
+    has_alpha = 'A' in resized.getbands() or 'transparency' in resized.info
+    if image_format == 'WEBP' and has_alpha:
+        resized = resized.convert('RGBA')
+    elif resized.mode not in ('RGB', 'L'):
+        resized = resized.convert('RGB')
+    buffer = BytesIO()
+    resized.save(buffer, image_format, quality=quality)
+    return buffer.getvalue()
+
+
+def needs_variants(instance):
+    field_name, variants_field, _ = TARGETS[type(instance)]
+    image = getattr(instance, field_name)
+    variants = getattr(instance, variants_field)
+    if not image:
+        return bool(variants)
+    return not variants or variants.get('source') != image.name
+
+
+def generate_variants(model, pk):
+    """
+    Build every configured variant of one instance's image, store them next to
+    the original and record their names on the row. Runs outside the request.
+    """
+    field_name, variants_field, namespace = TARGETS[model]
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None:
+        return None
+    image_file = getattr(instance, field_name)
+
+    variants = None
+    if image_file:
+        image_format = getattr(settings, 'LMS_IMAGE_FORMAT', 'WEBP')
+        quality = getattr(settings, 'LMS_IMAGE_QUALITY', 80)
+        storage = image_file.storage
+        with storage.open(image_file.name, 'rb') as source:
+            image = ImageOps.exif_transpose(Image.open(source))  # Foto kamera HP sering berorientasi EXIF
+            image.load()
+        variants = {'source': image_file.name}
+        for variant, size in image_variants().items():
+            name = variant_name(image_file.name, variant, image_format)
+            if storage.exists(name):
+                storage.delete(name)
+            variants[variant] = storage.save(name, ContentFile(render_variant(image, size, image_format, quality)))
+
+    updates = {variants_field: variants}
+    if any(field.name == 'updated_at' for field in model._meta.concrete_fields):
+        updates['updated_at'] = timezone.now()  # Supaya ETag ikut berubah
+    # Abaikan hasil jika gambar sudah diganti lagi selama proses berjalan
+    if image_file:
+        unchanged = Q(**{field_name: image_file.name})
+    else:
+        unchanged = Q(**{field_name: ''}) | Q(**{f'{field_name}__isnull': True})
+    model.objects.filter(unchanged, pk=pk).update(**updates)
+    if namespace:
+        invalidate(namespace)
+    return variants
+
+
+def _run(model, pk):
+    try:
+        generate_variants(model, pk)
+    except Exception:
+        logger.exception("Gagal membuat varian gambar %s %s", model.__name__, pk)
+    finally:
+        # Koneksi thread worker dikembalikan (ke pool) setelah setiap tugas
+        connections.close_all()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'LMS_IMAGE_WORKERS', 2), thread_name_prefix='lms-thumbnails',
+            )
+        return _executor
+
+
+def schedule_variants(instance):
+    """Generate the variants of ``instance`` after the current transaction commits."""
+    model, pk = type(instance), instance.pk
+    if getattr(settings, 'LMS_IMAGE_WORKERS', 2) <= 0:
+        transaction.on_commit(lambda: generate_variants(model, pk))
+    else:
+        transaction.on_commit(lambda: _get_executor().submit(_run, model, pk))
@@ -1,13 +1,26 @@
 # lms_core/views.py
-from django.http import HttpResponse
+import asyncio
+import json
+import logging
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import IntegrityError
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.utils.urls import replace_query_param
+from rest_framework_simplejwt.exceptions import TokenError
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from lms_core.models import (
     Course, Profile, CourseAnnouncement, Category, CourseContent, Bookmark, CourseMember
 )
 from rest_framework import status 
 from lms_core.serializers import (
+    field_selection,
     CourseSerializer,
     UserProfileSerializer,
     CourseAnnouncementSerializer,
@@ -16,53 +29,93 @@ from lms_core.serializers import (
     CourseContentSerializer,
     RegisterSerializer,
     BatchEnrollSerializer,
+    BulkRegisterSerializer,
     UserListSerializer
 )
 from django.contrib.auth.models import User
-from .permissions import IsTeacher, IsStudentOrTeacher, IsStudent
+from .permissions import IsTeacher, IsStudentOrTeacher, IsStudent, get_role
+from .authentication import StatelessJWTAuthentication, StreamTicket, token_cache
+from .enrollment import bulk_enroll_students
+from .bulk_users import bulk_create_users
+from .pagination import KeysetPagination
+from .streaming import wants_stream, stream_json_array
+from .cache import cached_response_data, cache_stats
+from .conditional import conditional_get, queryset_validator
+from .search import search, SEARCH_TYPES
+from .instrumentation import timed_serialization, route_stats, database_pool_stats
+from .downloads import file_download_response
+from .fast_serializers import FastCourseSerializer, FastCourseContentSerializer
+from .events import course_channel, get_broker
+
+logger = logging.getLogger(__name__)
 
 def index(request):
     return HttpResponse("<h1>Welcome to Simple LMS API</h1>")
 
+def course_list_validator(request):
+    # Kategori ikut dihitung karena ditampilkan nested di setiap course
+    return queryset_validator(Course.objects.all(), Category.objects.all())
+
+def category_list_validator(request):
+    return queryset_validator(Category.objects.all())
+
+def course_announcement_validator(request, course_id):
+    return queryset_validator(
+        CourseAnnouncement.objects.filter(course_id=course_id),
+        Course.objects.filter(id=course_id),
+        Category.objects.filter(courses__id=course_id),
+    )
+
 class IndexView(APIView):
     def get(self, request):
         return Response({"message": "Hello World"})
 
 class UserListView(APIView):
+    keyset_ordering = ('id',)  # Primary key: sudah ter-index, tidak perlu index (date_joined, id)
 
     def get(self, request):
-        users = User.objects.all()
-        serializer = UserListSerializer(users, many=True)
-        return Response(serializer.data)
+        selection = field_selection(request)
+        users = UserListSerializer.setup_eager_loading(User.objects.all(), keep=self.keyset_ordering, **selection)
+        if wants_stream(request):
+            # Mode ekspor: kirim semua user secara bertahap tanpa pagination
+            return stream_json_array(request, users.order_by(*self.keyset_ordering), partial(UserListSerializer, **selection))
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(users, request, view=self)
+        serializer = UserListSerializer(page, many=True, **selection)
+        with timed_serialization():
+            data = serializer.data
+        return paginator.get_paginated_response(data)
 
 class GetProfileView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         try:
-            user = request.user
+            user = UserProfileSerializer.setup_eager_loading(User.objects.all()).get(pk=request.user.pk)
             serializer = UserProfileSerializer(user)
-            return Response(serializer.data)
+            with timed_serialization():
+                data = serializer.data
+            return Response(data)
         except Exception as e:
-            print("Error: ", str(e))  # Menambahkan print untuk log
+            logger.exception("Gagal mengambil profil user %s", request.user.pk)
             return Response({"message": "Error occurred", "details": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 class BatchEnrollView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        # ✅ Validasi role pengguna saat ini
-        try:
-            if request.user.profile.role != 'teacher':
-                return Response(
-                    {"error": "Hanya teacher yang diizinkan."},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-        except Profile.DoesNotExist:
+        # ✅ Validasi role pengguna saat ini (dari claim token, fallback ke profile)
+        role = get_role(request)
+        if role is None:
             return Response(
                 {"error": "Profil pengguna tidak ditemukan."},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        if role != 'teacher':
+            return Response(
+                {"error": "Hanya teacher yang diizinkan."},
+                status=status.HTTP_403_FORBIDDEN
+            )
 
         # ✅ Validasi input
         serializer = BatchEnrollSerializer(data=request.data, context={'request': request})
@@ -79,34 +132,8 @@ class BatchEnrollView(APIView):
                     status=status.HTTP_404_NOT_FOUND
                 )
 
-            added_students = []
-            not_found = []
-            invalid_role = []
-
-            # ✅ Loop semua student_ids yang dikirim
-            for student_id in student_ids:
-                try:
-                    student = User.objects.get(id=student_id)
-
-                    try:
-                        if student.profile.role != 'student':
-                            invalid_role.append(student.username)
-                            continue
-                    except Profile.DoesNotExist:
-                        invalid_role.append(student.username)
-                        continue
-
-                    member, created = CourseMember.objects.get_or_create(
-                        course_id=course,
-                        user_id=student,
-                        defaults={'roles': 'std'}
-                    )
-
-                    if created:
-                        added_students.append(student.username)
-
-                except User.DoesNotExist:
-                    not_found.append(student_id)
+            # ✅ Resolusi user, role dan membership dilakukan sekaligus (set-based)
+            added_students, not_found, invalid_role = bulk_enroll_students(course, student_ids)
 
             # ❌ Semua gagal
             if not added_students:
@@ -160,6 +187,33 @@ class RegisterView(APIView):
             }, status=status.HTTP_201_CREATED)
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+class BulkRegisterView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def post(self, request):
+        serializer = BulkRegisterSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        entries = serializer.validated_data['users']
+        try:
+            # Hashing password paralel di pool thread proses ini, insert batch dalam satu transaksi
+            users = bulk_create_users(entries)
+        except IntegrityError:
+            # Username didaftarkan request lain setelah validasi; transaksi sudah di-rollback
+            return Response(
+                {"message": "Sebagian username baru saja didaftarkan oleh request lain, tidak ada user yang dibuat."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response({
+            "message": "Users registered successfully",
+            "created": len(users),
+            "users": [
+                {"id": user.id, "username": user.username, "role": entry['role']}
+                for user, entry in zip(users, entries)
+            ],
+        }, status=status.HTTP_201_CREATED)
+
 class UpdateProfileView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -195,17 +249,39 @@ class UpdateProfileView(APIView):
         profile.save()  # Simpan perubahan di Profile
 
         # Serialize and return the response
+        user = UserProfileSerializer.setup_eager_loading(User.objects.all()).get(pk=user.pk)
         serializer = UserProfileSerializer(user)
         return Response({"message": "Profile updated successfully", "user": serializer.data}, status=status.HTTP_200_OK)
 
 
 class CourseListView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]  # Tanpa query user per request
     permission_classes = [IsAuthenticated]
 
+    @conditional_get(course_list_validator)
     def get(self, request):
-        courses = Course.objects.all()  # Ambil semua data course
-        serializer = CourseSerializer(courses, many=True)  # Gunakan serializer untuk mengonversi queryset ke JSON
-        return Response(serializer.data)
+        selection = field_selection(request)
+        if selection:
+            # ?fields= / ?expand=: serializer DRF dengan field pilihan, query dipersempit sesuai field itu
+            serializer_class = partial(CourseSerializer, **selection)
+            courses = CourseSerializer.setup_eager_loading(Course.objects.all(), keep=KeysetPagination.ordering, **selection)
+        else:
+            # Bentuk default: hanya kolom yang dikeluarkan CourseSerializer, kategori di-join dalam query yang sama
+            serializer_class = FastCourseSerializer
+            courses = FastCourseSerializer.values(Course.objects.all())
+        if wants_stream(request):
+            # Mode ekspor: kirim seluruh katalog secara bertahap tanpa pagination
+            return stream_json_array(request, courses.order_by('created_at', 'id'), serializer_class)
+
+        def build():
+            paginator = KeysetPagination()
+            page = paginator.paginate_queryset(courses, request, view=self)
+            serializer = serializer_class(page, many=True)  # Fast path: output sama persis dengan CourseSerializer
+            with timed_serialization():
+                data = serializer.data
+            return paginator.get_paginated_data(data)
+
+        return Response(cached_response_data('courses', request, build))
 
 class AddCourseView(APIView):
     permission_classes = [IsAuthenticated]  # Menambahkan autentikasi jika diperlukan
@@ -248,14 +324,109 @@ class DeleteCourseView(APIView):
         return Response({"message": "Course not found"}, status=status.HTTP_404_NOT_FOUND)
 
 class ShowCourseContentView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        contents = CourseContent.objects.all()
-        serializer = CourseContentSerializer(contents, many=True)
+        selection = field_selection(request)
+        if selection:
+            serializer_class = partial(CourseContentSerializer, **selection)
+            contents = CourseContentSerializer.setup_eager_loading(
+                CourseContent.objects.all(), keep=KeysetPagination.ordering, **selection)
+        else:
+            serializer_class = FastCourseContentSerializer
+            contents = FastCourseContentSerializer.values(CourseContent.objects.all())
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(contents, request, view=self)
+        serializer = serializer_class(page, many=True)  # Fast path: output sama dengan CourseContentSerializer
+        with timed_serialization():
+            data = serializer.data
         return Response({
             "message": "Konten berhasil diambil",
-            "data": serializer.data
+            "data": data,
+            "next": paginator.get_next_link(),
+            "previous": paginator.get_previous_link(),
+        }, status=status.HTTP_200_OK)
+
+class ContentDownloadView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, content_id):
+        content = CourseContent.objects.select_related('course_id').filter(id=content_id).first()
+        if content is None or not content.file_attachment:
+            return Response({"message": "File not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        # Hanya teacher pemilik kursus, member kursus, atau staff yang boleh mengunduh
+        course = content.course_id
+        allowed = (
+            request.user.is_staff
+            or str(course.teacher_id) == str(request.user.id)  # Claim user_id di token berupa string
+            or CourseMember.objects.filter(course_id=course, user_id=request.user.id).exists()
+        )
+        if not allowed:
+            return Response({"message": "You are not a member of this course"}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            return file_download_response(request, content.file_attachment)
+        except FileNotFoundError:
+            return Response({"message": "File not found"}, status=status.HTTP_404_NOT_FOUND)
+
+class CourseOutlineView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, course_id):
+        # Satu query: semua konten kursus berurutan menurut materialized path,
+        # sehingga induk selalu muncul sebelum anak-anaknya
+        rows = CourseContent.objects.filter(course_id=course_id).order_by('path').values(
+            'id', 'name', 'description', 'video_url', 'file_attachment', 'parent_id', 'depth'
+        )
+        storage = CourseContent._meta.get_field('file_attachment').storage
+
+        nodes = {}
+        outline = []
+        for row in rows:
+            row['file_attachment'] = storage.url(row['file_attachment']) if row['file_attachment'] else None
+            row['children'] = []
+            nodes[row['id']] = row
+            parent = nodes.get(row['parent_id'])
+            (parent['children'] if parent else outline).append(row)
+
+        if not outline and not Course.objects.filter(id=course_id).exists():
+            return Response({"message": "Course not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response({"message": "Outline berhasil diambil", "data": outline}, status=status.HTTP_200_OK)
+
+class SearchView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({"message": "Query parameter 'q' is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        kind = request.query_params.get('type')
+        if kind and kind not in SEARCH_TYPES:
+            return Response({"message": f"type harus salah satu dari {list(SEARCH_TYPES)}"}, status=status.HTTP_400_BAD_REQUEST)
+        types = (kind,) if kind else SEARCH_TYPES
+
+        try:
+            page = max(1, int(request.query_params.get('page', 1)))
+            page_size = int(request.query_params.get('page_size', settings.LMS_PAGE_SIZE))
+        except ValueError:
+            return Response({"message": "page dan page_size harus berupa angka"}, status=status.HTTP_400_BAD_REQUEST)
+        page_size = max(1, min(page_size, settings.LMS_MAX_PAGE_SIZE))
+
+        # Ambil satu baris ekstra untuk menentukan apakah ada halaman berikutnya
+        results = search(query, types=types, limit=page_size + 1, offset=(page - 1) * page_size)
+        url = request.build_absolute_uri()
+        return Response({
+            "message": "Pencarian berhasil",
+            "data": results[:page_size],
+            "next": replace_query_param(url, 'page', page + 1) if len(results) > page_size else None,
+            "previous": replace_query_param(url, 'page', page - 1) if page > 1 else None,
         }, status=status.HTTP_200_OK)
 
 class CreateCourseAnnouncementView(APIView):
@@ -276,8 +447,10 @@ class CreateCourseAnnouncementView(APIView):
         return Response({"message": "Announcement created successfully"}, status=201)
 
 class ShowCourseAnnouncementView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAuthenticated]  # Memastikan user sudah login
 
+    @conditional_get(course_announcement_validator)
     def get(self, request, course_id):
         # Ambil kursus berdasarkan course_id
         try:
@@ -285,14 +458,108 @@ class ShowCourseAnnouncementView(APIView):
         except Course.DoesNotExist:
             return Response({"message": "Course not found"}, status=status.HTTP_404_NOT_FOUND)
         
-        # Ambil pengumuman yang terkait dengan kursus ini
-        announcements = CourseAnnouncement.objects.filter(course=course)
+        # Ambil pengumuman yang terkait dengan kursus ini, relasi yang dikeluarkan ikut di-join
+        selection = field_selection(request)
+        announcements = CourseAnnouncementSerializer.setup_eager_loading(
+            CourseAnnouncement.objects.filter(course=course), **selection)
 
         # Serialize pengumuman untuk mengubah menjadi JSON
-        from lms_core.serializers import CourseAnnouncementSerializer
-        serializer = CourseAnnouncementSerializer(announcements, many=True)
+        serializer = CourseAnnouncementSerializer(announcements, many=True, **selection)
+        with timed_serialization():
+            data = serializer.data
+
+        return Response(data, status=status.HTTP_200_OK)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+class MyAnnouncementFeedView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+    keyset_ordering = ('-created_at', '-id')  # Terbaru dulu
+
+    def get(self, request):
+        # Satu query untuk semua kursus yang diikuti: subquery membership + index (course, created_at, id)
+        enrolled = CourseMember.objects.filter(user_id=request.user.id).values('course_id')
+        selection = field_selection(request)
+        announcements = CourseAnnouncementSerializer.setup_eager_loading(
+            CourseAnnouncement.objects.filter(course__in=enrolled), keep=('created_at', 'id'), **selection)
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(announcements, request, view=self)
+        serializer = CourseAnnouncementSerializer(page, many=True, **selection)
+        with timed_serialization():
+            data = serializer.data
+        return Response({
+            "message": "Get announcements success",
+            "data": data,
+            "next": paginator.get_next_link(),
+            "previous": paginator.get_previous_link(),
+        }, status=status.HTTP_200_OK)
+
+class StreamTicketView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        # EventSource tidak bisa mengirim header Authorization: tukar access token dengan tiket ?ticket= berumur pendek
+        ticket = StreamTicket.for_user(request.user)
+        return Response({
+            "message": "Stream ticket created",
+            "data": {"ticket": str(ticket), "expires_in": int(StreamTicket.lifetime.total_seconds())},
+        }, status=status.HTTP_201_CREATED)
+
+def _stream_user(request):
+    # Tiket dari StreamTicketView (query string bisa tercatat di log), atau header Authorization biasa
+    authenticator = StatelessJWTAuthentication()
+    try:
+        ticket = request.GET.get('ticket')
+        if ticket:
+            return authenticator.get_user(StreamTicket(ticket))
+        result = authenticator.authenticate(request)
+    except (AuthenticationFailed, TokenError):
+        return None
+    return result[0] if result else None
+
+async def announcement_stream(request):
+    """
+    Server-Sent Events: one long-lived connection per client that pushes
+    ``announcement.created/updated/deleted`` for the courses the user is a
+    member or teacher of (as of connecting). Only served through ASGI
+    (``lms/asgi.py``); under WSGI it would hold a worker thread per client.
+    Browsers authenticate with ``?ticket=`` from :class:`StreamTicketView`
+    and fetch a new ticket before reconnecting.
+    """
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"message": "Event stream is only available through the ASGI server"}, status=501)
+    user = await sync_to_async(_stream_user)(request)
+    if user is None:
+        return JsonResponse({"message": "Authentication credentials were not provided or are invalid"}, status=401)
+
+    course_ids = [pk async for pk in CourseMember.objects.filter(user_id=user.id).values_list('course_id', flat=True)]
+    course_ids += [pk async for pk in Course.objects.filter(teacher_id=user.id).values_list('id', flat=True)]
+    channels = [course_channel(pk) for pk in set(course_ids)]
+    heartbeat = getattr(settings, 'LMS_SSE_HEARTBEAT', 15)
+
+    async def events():
+        subscription = get_broker().subscribe(channels)
+        try:
+            yield f"retry: {getattr(settings, 'LMS_SSE_RETRY_MS', 3000)}\n\n"
+            while True:
+                try:
+                    message = await subscription.get(timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    message = ''
+                if message is None:
+                    return  # Client tertinggal terlalu jauh: tutup, client reconnect lalu baca ulang feed
+                if not message:
+                    yield ": keep-alive\n\n"  # Komentar SSE supaya proxy tidak memutus koneksi idle
+                else:
+                    yield f"event: {json.loads(message)['type']}\ndata: {message}\n\n"
+        finally:
+            # Juga saat client memutus koneksi (generator ditutup/di-cancel oleh server ASGI)
+            subscription.close()
+
+    response = StreamingHttpResponse(events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx: jangan buffer, kirim event langsung
+    return response
 
 class UpdateCourseAnnouncementView(APIView):
     permission_classes = [IsAuthenticated, IsTeacher]
@@ -368,13 +635,25 @@ class AddBookmarkView(APIView):
         return Response({"message": "Bookmark added successfully", "bookmark": BookmarkSerializer(bookmark).data}, status=status.HTTP_201_CREATED)
 
 class ShowBookmarksView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAuthenticated, IsStudent]
 
     def get(self, request):
-        # Ambil semua bookmark milik student
-        bookmarks = Bookmark.objects.filter(student=request.user)
-        serializer = BookmarkSerializer(bookmarks, many=True)
-        return Response({"message": "Get bookmarks success", "data": serializer.data}, status=status.HTTP_200_OK)
+        # Ambil semua bookmark milik student (request.user berasal dari token, pakai id-nya)
+        selection = field_selection(request)
+        bookmarks = BookmarkSerializer.setup_eager_loading(
+            Bookmark.objects.filter(student_id=request.user.id), keep=KeysetPagination.ordering, **selection)
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(bookmarks, request, view=self)
+        serializer = BookmarkSerializer(page, many=True, **selection)
+        with timed_serialization():
+            data = serializer.data
+        return Response({
+            "message": "Get bookmarks success",
+            "data": data,
+            "next": paginator.get_next_link(),
+            "previous": paginator.get_previous_link(),
+        }, status=status.HTTP_200_OK)
 
 
 class DeleteBookmarkView(APIView):
@@ -393,20 +672,29 @@ class DeleteBookmarkView(APIView):
 
 
 class ShowCategoryView(APIView):
+    authentication_classes = [StatelessJWTAuthentication]
     permission_classes = [IsAuthenticated]
 
+    @conditional_get(category_list_validator)
     def get(self, request):
-        # Ambil semua kategori
-        categories = Category.objects.all()
-        
-        # Serialisasi data kategori
-        serializer = CategorySerializer(categories, many=True)
-        
-        # Mengembalikan response dengan pesan dan data kategori
-        return Response({
-            "message": "Get categories success",  # Menambahkan pesan sukses
-            "data": serializer.data  # Menambahkan data kategori yang diserialisasi
-        }, status=status.HTTP_200_OK)
+        def build():
+            # Ambil semua kategori
+            selection = field_selection(request)
+            categories = CategorySerializer.setup_eager_loading(Category.objects.all(), **selection)
+
+            # Serialisasi data kategori
+            serializer = CategorySerializer(categories, many=True, **selection)
+            with timed_serialization():
+                data = serializer.data
+
+            # Mengembalikan response dengan pesan dan data kategori
+            return {
+                "message": "Get categories success",  # Menambahkan pesan sukses
+                "data": data  # Menambahkan data kategori yang diserialisasi
+            }
+
+        # Data kategori diambil dari cache, di-invalidasi oleh signal saat Category berubah
+        return Response(cached_response_data('categories', request, build), status=status.HTTP_200_OK)
 
 
 class DeleteCategoryView(APIView):
@@ -446,3 +734,21 @@ class EditCourseView(APIView):
         course.save()
         return Response({"message": "Course updated successfully"}, status=status.HTTP_200_OK)
 
+
+class CacheStatsView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def get(self, request):
+        # Statistik hit/miss cache untuk proses worker ini
+        data = cache_stats()
+        data['jwt_tokens'] = token_cache.stats()
+        return Response({"message": "Get cache stats success", "data": data}, status=status.HTTP_200_OK)
+
+
+class RequestStatsView(APIView):
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def get(self, request):
+        # Histogram latensi, waktu DB, waktu serialisasi dan jumlah query per route, plus statistik pool yang sedang dipakai
+        data = {"routes": route_stats(), "db_pools": database_pool_stats()}
+        return Response({"message": "Get request stats success", "data": data}, status=status.HTTP_200_OK)
@@ -0,0 +1,64 @@
+# Benchmark throughput API baca: DRF (sinkron) vs Django Ninja (async), beban sama.
+#
+# Jalankan server lewat ASGI agar kedua API dilayani entry point yang sama:
+#   uvicorn lms.asgi:application --workers 4 --port 8000          (dari folder code/)
+#
+# Lalu jalankan masing-masing user class bergantian dengan jumlah user yang sama,
+# dan bandingkan kolom "Current RPS" / persentil latensi di laporan locust:
+#   locust -f load_test/locust_read_compare.py --headless -u 200 -r 50 -t 2m -H http://localhost:8000 DrfReadUser
+#   locust -f load_test/locust_read_compare.py --headless -u 200 -r 50 -t 2m -H http://localhost:8000 NinjaReadUser
+#
+# Setiap task membaca resource yang sama dengan cache yang sama di kedua API: daftar course lewat
+# cache 'courses' (LMS_RESPONSE_CACHE, aktif jika REDIS_URL di-set), daftar konten dan pengumuman langsung dari database.
+#
+# Akun login dan id kursus bisa diganti lewat env LMS_LOCUST_USERNAME, LMS_LOCUST_PASSWORD, LMS_LOCUST_COURSE_ID.
+
+import os
+
+from locust import HttpUser, constant, task
+
+USERNAME = os.environ.get("LMS_LOCUST_USERNAME", "LarissaWylie")
+PASSWORD = os.environ.get("LMS_LOCUST_PASSWORD", "RLS71GOH8GF")
+COURSE_ID = int(os.environ.get("LMS_LOCUST_COURSE_ID", 1))
+
+
+class ReadUser(HttpUser):
+    abstract = True
+    wait_time = constant(0)  # Tanpa jeda: yang diukur throughput maksimum server
+
+    def on_start(self):
+        # Kedua API memakai access token yang sama dari /api/login/
+        response = self.client.post("/api/login/", json={"username": USERNAME, "password": PASSWORD})
+        if response.status_code != 200:
+            print("Login failed:", response.text)
+        self.headers = {"Authorization": f"Bearer {response.json().get('access')}"}
+
+
+class DrfReadUser(ReadUser):
+    @task(3)
+    def courses(self):
+        self.client.get("/api/v1/courses/", headers=self.headers, name="drf courses (cached)")
+
+    @task(3)
+    def contents(self):
+        self.client.get("/api/v1/contents/", headers=self.headers, name="drf contents")
+
+    @task(2)
+    def announcements(self):
+        self.client.get(f"/api/v1/courses/{COURSE_ID}/announcements/", headers=self.headers,
+                        name="drf announcements")
+
+
+class NinjaReadUser(ReadUser):
+    @task(3)
+    def courses(self):
+        self.client.get("/api/ninja/v1/courses", headers=self.headers, name="ninja courses (cached)")
+
+    @task(3)
+    def contents(self):
+        self.client.get("/api/ninja/v1/contents", headers=self.headers, name="ninja contents")
+
+    @task(2)
+    def announcements(self):
+        self.client.get(f"/api/ninja/v1/courses/{COURSE_ID}/announcements", headers=self.headers,
+                        name="ninja announcements")